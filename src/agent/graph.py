@@ -4,10 +4,16 @@ This module implements the main agent graph that orchestrates the RAG pipeline,
 including query analysis, routing, retrieval, context ranking, and generation.
 """
 
-from typing import Any, Literal, Optional
+import asyncio
+from typing import Any, Literal, Optional, Sequence
 
 import structlog
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+)
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 from langgraph.checkpoint.memory import MemorySaver
@@ -156,6 +162,9 @@ class F1AgentGraph:
     def compile(self, checkpointer: Optional[MemorySaver] = None) -> Any:
         """Compile the graph with optional checkpointing.
 
+        Compiling without a checkpointer is memoized, so calling this again
+        with no checkpointer returns the already compiled graph.
+
         Args:
             checkpointer: Optional MemorySaver for conversation persistence
 
@@ -163,6 +172,8 @@ class F1AgentGraph:
             Compiled graph ready for execution
         """
         if checkpointer is None:
+            if self.compiled_graph is not None:
+                return self.compiled_graph
             checkpointer = MemorySaver()
 
         self.compiled_graph = self.graph.compile(checkpointer=checkpointer)
@@ -343,7 +354,7 @@ Be accurate and concise."""
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         query = state.query
         entities = state.entities
@@ -371,7 +382,7 @@ Be accurate and concise."""
                 for doc in docs
             ]
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             logger.info(
                 "vector_search_completed",
@@ -407,7 +418,7 @@ Be accurate and concise."""
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         query = state.query
 
@@ -439,7 +450,7 @@ Be accurate and concise."""
                 for result in results
             ]
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             logger.info(
                 "tavily_search_completed",
@@ -478,7 +489,7 @@ Be accurate and concise."""
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info("performing_parallel_retrieval")
 
@@ -512,7 +523,7 @@ Be accurate and concise."""
             logger.error("parallel_tavily_search_failed", error=str(tavily_result))
             metadata["tavily_search_error"] = str(tavily_result)
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
 
         logger.info(
             "parallel_retrieval_completed",
@@ -618,7 +629,7 @@ Be accurate and concise."""
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         query = state.query
         context = state.context
@@ -639,8 +650,31 @@ Be accurate and concise."""
         )
 
         cached_response = cache_manager.llm_cache.get(cache_key)
+
+        # Fall back to a semantic lookup so paraphrased queries also hit.
+        # Only answers built from the same context and history can match, and
+        # the query is embedded for lookup only if such answers are cached.
+        query_embedding = None
+        partition = cache_manager.get_llm_partition_key(
+            model=self.config.openai_model,
+            temperature=self.config.openai_temperature,
+            context=context,
+            history=self._cache_history(messages),
+        )
+        use_semantic_cache = (
+            cached_response is None and self.config.semantic_cache_enabled
+        )
+        if use_semantic_cache and cache_manager.semantic_llm_cache.has_entries(
+            partition
+        ):
+            query_embedding = await self._embed_query_for_cache(query)
+            if query_embedding is not None:
+                cached_response = cache_manager.semantic_llm_cache.get(
+                    partition, query_embedding
+                )
+
         if cached_response is not None:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             logger.info(
                 "llm_response_cache_hit",
                 query=query[:100],
@@ -663,6 +697,11 @@ Be accurate and concise."""
         # Build optimized prompt with context
         prompt_messages = self._build_optimized_prompt(query, context, messages)
 
+        # Embed the query for the semantic cache alongside generation
+        embedding_task = None
+        if use_semantic_cache and query_embedding is None:
+            embedding_task = asyncio.create_task(self._embed_query_for_cache(query))
+
         try:
             # Generate response with token tracking
             response = await self.llm.ainvoke(prompt_messages)
@@ -680,8 +719,14 @@ Be accurate and concise."""
 
             # Cache the response
             cache_manager.llm_cache.set(cache_key, response_text)
+            if embedding_task is not None:
+                query_embedding = await embedding_task
+            if query_embedding is not None:
+                cache_manager.semantic_llm_cache.set(
+                    partition, query_embedding, response_text
+                )
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             logger.info(
                 "response_generated",
@@ -706,6 +751,8 @@ Be accurate and concise."""
             }
 
         except Exception as e:
+            if embedding_task is not None:
+                embedding_task.cancel()
             logger.error("generation_failed", error=str(e))
             error_response = (
                 "I apologize, but I encountered an error generating a response. "
@@ -722,6 +769,33 @@ Be accurate and concise."""
                 },
             }
 
+    async def _embed_query_for_cache(self, query: str) -> Optional[list[float]]:
+        """Embed a query for semantic LLM cache lookups.
+
+        Args:
+            query: User query
+
+        Returns:
+            Query embedding, or None if embedding failed
+        """
+        try:
+            return await self.vector_store.embeddings.aembed_query(query)
+        except Exception as e:
+            logger.warning("semantic_cache_embedding_failed", error=str(e))
+            return None
+
+    @staticmethod
+    def _cache_history(messages: Sequence[BaseMessage]) -> list[str]:
+        """Get the conversation history that keys semantic LLM cache entries.
+
+        Args:
+            messages: Conversation history
+
+        Returns:
+            Contents of the non-system messages, oldest first
+        """
+        return [str(m.content) for m in messages if m.type != "system"]
+
     def _build_optimized_prompt(
         self,
         query: str,
@@ -809,6 +883,20 @@ Provide a concise, accurate answer using the context. Cite sources."""
             )
             cache_manager.llm_cache.set(cache_key, full_response)
 
+            if self.config.semantic_cache_enabled:
+                query_embedding = await self._embed_query_for_cache(query)
+                if query_embedding is not None:
+                    cache_manager.semantic_llm_cache.set(
+                        cache_manager.get_llm_partition_key(
+                            model=self.config.openai_model,
+                            temperature=self.config.openai_temperature,
+                            context=context,
+                            history=self._cache_history(messages),
+                        ),
+                        query_embedding,
+                        full_response,
+                    )
+
             logger.info(
                 "streaming_response_complete",
                 response_length=len(full_response),
@@ -37,6 +37,7 @@ class ConversationMemoryManager:
         checkpointer: MemorySaver instance for persistence
         llm: ChatOpenAI instance for summarization
         max_history: Maximum conversation history to maintain
+        token_budget: Maximum tokens of history per session (None = no limit)
     """
 
     def __init__(
@@ -53,6 +54,7 @@ class ConversationMemoryManager:
         self.config = config
         self.checkpointer = checkpointer or MemorySaver()
         self.max_history = config.max_conversation_history
+        self.token_budget = config.conversation_token_budget
 
         # Initialize LLM for summarization
         self.llm = ChatOpenAI(
@@ -89,6 +91,7 @@ class ConversationMemoryManager:
             session_id=session_id,
             messages=messages,
             max_history=self.max_history,
+            token_budget=self.token_budget,
             created_at=datetime.now(),
             updated_at=datetime.now(),
         )
@@ -571,6 +574,7 @@ Summary:"""
             session_id=session_id,
             messages=messages,
             max_history=self.max_history,
+            token_budget=self.token_budget,
             created_at=datetime.fromisoformat(session_data["created_at"]),
             updated_at=datetime.fromisoformat(session_data["updated_at"]),
             metadata=session_data.get("metadata", {}),
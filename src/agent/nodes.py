@@ -8,7 +8,8 @@ This module provides additional node implementations with:
 - Streaming support using astream_events
 """
 
-from typing import Any, AsyncIterator, Optional
+import re
+from typing import Any, AsyncIterator, Iterable, Optional
 
 import structlog
 from langchain_core.messages import AIMessage, HumanMessage
@@ -24,6 +25,39 @@ from .state import AgentState
 logger = structlog.get_logger(__name__)
 
 
+def _keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile lowercase keywords into one substring alternation."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Intent keyword scans over the lowercased query, compiled once so each
+# intent is a single regex pass instead of one substring search per keyword
+_PREDICTION_RE = _keyword_pattern(
+    ["predict", "prediction", "forecast", "will", "going to", "expect"]
+)
+_REALTIME_RE = _keyword_pattern(
+    ["current", "latest", "now", "today", "this season", "2024"]
+)
+_HISTORICAL_RE = _keyword_pattern(["history", "past", "previous", "all-time", "ever"])
+_TECHNICAL_RE = _keyword_pattern(
+    ["how does", "explain", "what is", "technical", "regulation"]
+)
+_F1_TOPIC_RE = _keyword_pattern(
+    [
+        "f1",
+        "formula 1",
+        "formula one",
+        "grand prix",
+        "gp",
+        "driver",
+        "team",
+        "race",
+        "circuit",
+        "championship",
+    ]
+)
+
+
 class EntityExtraction(BaseModel):
     """Structured output for entity extraction."""
 
@@ -191,49 +225,23 @@ def _determine_intent_from_entities(query: str, entities: EntityExtraction) -> s
     query_lower = query.lower()
 
     # Check for prediction keywords
-    prediction_keywords = [
-        "predict",
-        "prediction",
-        "forecast",
-        "will",
-        "going to",
-        "expect",
-    ]
-    if any(keyword in query_lower for keyword in prediction_keywords):
+    if _PREDICTION_RE.search(query_lower):
         return "prediction"
 
     # Check for current info keywords
-    current_keywords = ["current", "latest", "now", "today", "this season", "2024"]
-    if any(keyword in query_lower for keyword in current_keywords):
+    if _REALTIME_RE.search(query_lower):
         return "current_info"
 
     # Check for historical keywords
-    historical_keywords = ["history", "past", "previous", "all-time", "ever"]
-    if any(keyword in query_lower for keyword in historical_keywords) or entities.years:
+    if _HISTORICAL_RE.search(query_lower) or entities.years:
         return "historical"
 
     # Check for technical keywords
-    technical_keywords = ["how does", "explain", "what is", "technical", "regulation"]
-    if (
-        any(keyword in query_lower for keyword in technical_keywords)
-        or entities.technical_terms
-    ):
+    if _TECHNICAL_RE.search(query_lower) or entities.technical_terms:
         return "technical"
 
     # Check for off-topic
-    f1_keywords = [
-        "f1",
-        "formula 1",
-        "formula one",
-        "grand prix",
-        "gp",
-        "driver",
-        "team",
-        "race",
-        "circuit",
-        "championship",
-    ]
-    has_f1_keyword = any(keyword in query_lower for keyword in f1_keywords)
+    has_f1_keyword = _F1_TOPIC_RE.search(query_lower) is not None
     has_entities = (
         entities.drivers or entities.teams or entities.races or entities.circuits
     )
@@ -5,14 +5,41 @@ including message handling, context management, and metadata tracking.
 """
 
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import Annotated, Any, Literal, Optional, Sequence
 
 import structlog
+import tiktoken
 from langchain_core.messages import BaseMessage
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 logger = structlog.get_logger(__name__)
 
+# Tokenizer used to measure conversation history against a token budget
+TOKEN_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Load the history tokenizer once per process."""
+    return tiktoken.get_encoding(TOKEN_ENCODING)
+
+
+def count_message_tokens(message: BaseMessage) -> int:
+    """Count the tokens in a message's content.
+
+    Args:
+        message: Message to measure
+
+    Returns:
+        Number of tokens in the message content
+    """
+    content = message.content
+    if not isinstance(content, str):
+        content = str(content)
+    return len(_get_encoding().encode(content))
+
 
 def add_messages(
     left: Sequence[BaseMessage], right: Sequence[BaseMessage]
@@ -274,6 +301,12 @@ class ConversationContext(BaseModel):
         description="Maximum number of message pairs to maintain",
     )
 
+    token_budget: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum tokens across non-system messages (None = no limit)",
+    )
+
     created_at: datetime = Field(
         default_factory=datetime.now,
         description="Session creation timestamp",
@@ -289,9 +322,19 @@ class ConversationContext(BaseModel):
         description="Session metadata (user preferences, etc.)",
     )
 
+    # Token counts keyed by message id; the message is stored alongside its
+    # count so a recycled id is never mistaken for an already counted message
+    _token_counts: dict[int, tuple[BaseMessage, int]] = PrivateAttr(
+        default_factory=dict
+    )
+
     def add_message(self, message: BaseMessage) -> None:
         """Add a message to conversation history.
 
+        Once the history exceeds its window, system messages are kept ahead
+        of the turn messages and the oldest turn messages after them are
+        dropped in place with a single slice deletion.
+
         Args:
             message: Message to add
         """
@@ -300,13 +343,11 @@ class ConversationContext(BaseModel):
 
         # Implement sliding window if history exceeds max
         if len(self.messages) > self.max_history * 2:  # 2 messages per turn
-            # Keep system message if present, then apply sliding window
-            system_messages = [m for m in self.messages if m.type == "system"]
-            other_messages = [m for m in self.messages if m.type != "system"]
-
-            # Keep most recent messages
-            recent_messages = other_messages[-(self.max_history * 2) :]
-            self.messages = system_messages + recent_messages
+            # Keep system messages, then drop the oldest turns
+            system_count = self._front_load_system_messages()
+            overflow = len(self.messages) - system_count - self.max_history * 2
+            if overflow > 0:
+                del self.messages[system_count : system_count + overflow]
 
             logger.info(
                 "conversation_history_trimmed",
@@ -314,6 +355,95 @@ class ConversationContext(BaseModel):
                 total_messages=len(self.messages),
             )
 
+        if self.token_budget is not None:
+            self._enforce_token_budget()
+
+    def _enforce_token_budget(self) -> None:
+        """Drop the oldest turn messages until the rest fit the token budget.
+
+        Each message is tokenized once; later calls reuse the cached count.
+        The newest message is always kept, even if it alone exceeds the budget.
+        System messages are never evicted and do not count toward the budget.
+        """
+        budget = self.token_budget
+        if budget is None:
+            return
+
+        turn_messages = [m for m in self.messages if m.type != "system"]
+        # One count per position, so a message added twice is counted twice
+        counts = []
+        for message in turn_messages:
+            cached = self._token_counts.get(id(message))
+            if cached is None or cached[0] is not message:
+                cached = (message, count_message_tokens(message))
+                self._token_counts[id(message)] = cached
+            counts.append(cached[1])
+
+        total = sum(counts)
+        evicted = 0
+        while total > budget and evicted < len(turn_messages) - 1:
+            total -= counts[evicted]
+            evicted += 1
+        self._token_counts = {
+            id(message): (message, count)
+            for message, count in zip(
+                turn_messages[evicted:], counts[evicted:], strict=True
+            )
+        }
+
+        if evicted:
+            system_count = self._front_load_system_messages()
+            del self.messages[system_count : system_count + evicted]
+
+            logger.info(
+                "conversation_history_trimmed_to_budget",
+                session_id=self.session_id,
+                total_messages=len(self.messages),
+                total_tokens=total,
+            )
+
+    def _leading_system_count(self) -> int:
+        """Count the system messages at the front of the history."""
+        count = 0
+        for message in self.messages:
+            if message.type != "system":
+                break
+            count += 1
+        return count
+
+    def _has_misplaced_system_messages(self, system_count: int) -> bool:
+        """Check for system messages after the first turn message.
+
+        Args:
+            system_count: Number of system messages leading the history
+
+        Returns:
+            True if any system message follows a turn message
+        """
+        return any(
+            message.type == "system"
+            for message in islice(self.messages, system_count, None)
+        )
+
+    def _front_load_system_messages(self) -> int:
+        """Move system messages ahead of the turn messages.
+
+        Histories built by add_message already lead with their system
+        messages, so they are left as is; histories created or imported in
+        another order are partitioned once, keeping the relative order of
+        both groups.
+
+        Returns:
+            Number of system messages, which now lead the history
+        """
+        system_count = self._leading_system_count()
+        if self._has_misplaced_system_messages(system_count):
+            system_messages = [m for m in self.messages if m.type == "system"]
+            other_messages = [m for m in self.messages if m.type != "system"]
+            self.messages = system_messages + other_messages
+            system_count = len(system_messages)
+        return system_count
+
     def get_recent_messages(self, count: int = 5) -> list[BaseMessage]:
         """Get the most recent messages.
 
@@ -323,13 +453,16 @@ class ConversationContext(BaseModel):
         Returns:
             List of recent messages
         """
-        # Exclude system messages from count
-        non_system = [m for m in self.messages if m.type != "system"]
-        recent = non_system[-(count * 2) :]
+        system_count = self._leading_system_count()
+        if self._has_misplaced_system_messages(system_count):
+            # Exclude system messages from count, then add them back in front
+            non_system = [m for m in self.messages if m.type != "system"]
+            system_messages = [m for m in self.messages if m.type == "system"]
+            return system_messages + non_system[-(count * 2) :]
 
-        # Add back system message if present
-        system_messages = [m for m in self.messages if m.type == "system"]
-        return system_messages + recent
+        # System messages lead the history and are always included
+        start = max(system_count, len(self.messages) - count * 2)
+        return self.messages[:system_count] + self.messages[start:]
 
     def clear(self) -> None:
         """Clear conversation history while preserving session metadata."""
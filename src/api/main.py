@@ -8,13 +8,13 @@ import asyncio
 import time
 import uuid
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
 
 import structlog
 import uvicorn
 from fastapi import BackgroundTasks, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from src.config.settings import Settings, get_settings
 
@@ -22,12 +22,13 @@ logger = structlog.get_logger(__name__)
 
 
 # Global state for dependencies
-app_state = {
+app_state: Dict[str, Any] = {
     "vector_store": None,
     "tavily_client": None,
     "agent_graph": None,
     "background_tasks": {},  # Track background tasks
     "task_queue": None,  # Background task queue
+    "chat_semaphore": None,  # Bounds concurrent agent graph runs
 }
 
 
@@ -186,6 +187,113 @@ def get_task_status(task_id: str) -> Dict[str, Any]:
     )
 
 
+def _get_chat_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent agent graph runs.
+
+    Created lazily when the app is used without its lifespan (e.g. in tests).
+
+    Returns:
+        Semaphore shared by the chat endpoints
+    """
+    semaphore: Optional[asyncio.Semaphore] = app_state["chat_semaphore"]
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_settings().api_max_concurrent_chats)
+        app_state["chat_semaphore"] = semaphore
+    return semaphore
+
+
+@asynccontextmanager
+async def chat_slot() -> AsyncGenerator[None, None]:
+    """Hold one of the bounded agent graph run slots.
+
+    Both /chat and /chat/stream run the graph inside this context, so the
+    same concurrency bound and timeout apply to each. The timeout covers
+    waiting for a slot as well as the run itself, so a hung upstream call
+    cannot hold a slot indefinitely.
+
+    Raises:
+        TimeoutError: If waiting for a slot and running exceed api_chat_timeout
+    """
+    async with asyncio.timeout(get_settings().api_chat_timeout):
+        async with _get_chat_semaphore():
+            yield
+
+
+async def run_chat_graph(
+    compiled_graph: Any,
+    state: Dict[str, Any],
+    config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Invoke the agent graph within a bounded chat slot.
+
+    Args:
+        compiled_graph: Compiled agent graph to run
+        state: Initial agent state
+        config: Graph run configuration
+
+    Returns:
+        Final agent state produced by the graph
+
+    Raises:
+        TimeoutError: If the run does not finish within api_chat_timeout
+    """
+    async with chat_slot():
+        result: Dict[str, Any] = await compiled_graph.ainvoke(state, config=config)
+        return result
+
+
+async def stream_chat_graph(
+    compiled_graph: Any,
+    state: Dict[str, Any],
+    config: Dict[str, Any],
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream agent graph events produced within a bounded chat slot.
+
+    A producer task runs ``astream_events`` inside the slot and buffers the
+    events in a queue, which is drained outside it. The slot and timeout
+    therefore only cover producing events, not the time a slow client takes
+    to read them.
+
+    Args:
+        compiled_graph: Compiled agent graph to run
+        state: Initial agent state
+        config: Graph run configuration
+
+    Yields:
+        Graph events in the order they were produced
+
+    Raises:
+        TimeoutError: If producing the events exceeds api_chat_timeout
+    """
+    events: asyncio.Queue[Any] = asyncio.Queue()
+    done = object()
+
+    async def produce() -> None:
+        try:
+            async with chat_slot():
+                async for event in compiled_graph.astream_events(
+                    state, config=config, version="v1"
+                ):
+                    events.put_nowait(event)
+        except Exception as e:
+            events.put_nowait(e)
+        else:
+            events.put_nowait(done)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await events.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # The client went away or the stream failed; stop producing
+        producer.cancel()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI application.
@@ -247,6 +355,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app_state["task_processor"] = task_processor
         logger.info("background_task_processor_started")
 
+        # Bound concurrent agent graph runs across chat endpoints
+        app_state["chat_semaphore"] = asyncio.Semaphore(config.api_max_concurrent_chats)
+        logger.info(
+            "chat_semaphore_initialized",
+            max_concurrent=config.api_max_concurrent_chats,
+        )
+
         logger.info("api_startup_complete")
 
     except Exception as e:
@@ -270,6 +385,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as e:
             logger.error("task_processor_cleanup_failed", error=str(e))
 
+    app_state["chat_semaphore"] = None
+
     # Clean up resources
     if app_state["vector_store"]:
         try:
@@ -302,6 +419,7 @@ def create_app() -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
@@ -365,7 +483,7 @@ def create_app() -> FastAPI:
         set_request_id(request_id)
 
         # Log request
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(
             "http_request_started",
             method=request.method,
@@ -380,7 +498,7 @@ def create_app() -> FastAPI:
             response = await call_next(request)
 
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log response
             logger.info(
@@ -401,7 +519,7 @@ def create_app() -> FastAPI:
 
         except Exception as e:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
 
             # Log error
             logger.error(
@@ -417,7 +535,7 @@ def create_app() -> FastAPI:
             clear_context()
 
             # Return error response
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": "Internal server error",
@@ -449,7 +567,7 @@ def create_app() -> FastAPI:
             exc_info=True,
         )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
@@ -4,9 +4,9 @@ This module provides endpoints for chat interactions, including message processi
 streaming responses, and conversation management.
 """
 
-import json
 from typing import Any, Optional
 
+import orjson
 import structlog
 from fastapi import APIRouter, HTTPException, Request, status
 from fastapi.responses import StreamingResponse
@@ -80,9 +80,24 @@ class SessionClearResponse(BaseModel):
     message: str = Field(..., description="Confirmation message")
 
 
+def _sse_event(payload: dict[str, Any]) -> str:
+    """Encode a payload as a Server-Sent Events data frame.
+
+    Args:
+        payload: Event payload
+
+    Returns:
+        SSE frame with the JSON-encoded payload
+    """
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+
 # In-memory session storage (replace with Redis in production)
 session_storage: dict[str, MemorySaver] = {}
 
+# Agent graph compiled against each session's checkpointer
+session_graphs: dict[str, Any] = {}
+
 
 def get_or_create_session(session_id: str) -> MemorySaver:
     """Get existing session or create new one.
@@ -99,6 +114,28 @@ def get_or_create_session(session_id: str) -> MemorySaver:
     return session_storage[session_id]
 
 
+def get_session_graph(session_id: str, agent_graph: Any, cache: bool = True) -> Any:
+    """Get the agent graph compiled for a session, compiling it once.
+
+    Args:
+        session_id: Session identifier
+        agent_graph: F1AgentGraph whose state machine is compiled
+        cache: Whether to keep the compiled graph for later requests. Pass
+            False for one-off sessions whose id was generated per request,
+            so they do not accumulate compiled graphs.
+
+    Returns:
+        Compiled graph bound to the session's checkpointer
+    """
+    compiled_graph = session_graphs.get(session_id)
+    if compiled_graph is None:
+        checkpointer = get_or_create_session(session_id)
+        compiled_graph = agent_graph.graph.compile(checkpointer=checkpointer)
+        if cache:
+            session_graphs[session_id] = compiled_graph
+    return compiled_graph
+
+
 @router.post(
     "/chat",
     response_model=ChatResponse,
@@ -119,7 +156,7 @@ async def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
     Raises:
         HTTPException: If agent is not initialized or processing fails
     """
-    from src.api.main import app_state
+    from src.api.main import app_state, run_chat_graph
 
     # Get agent graph
     agent_graph = app_state.get("agent_graph")
@@ -133,11 +170,10 @@ async def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
     # Generate session ID if not provided
     session_id = request.session_id or f"session_{http_request.state.request_id}"
 
-    # Get or create session checkpointer
-    checkpointer = get_or_create_session(session_id)
-
-    # Recompile graph with session checkpointer
-    compiled_graph = agent_graph.graph.compile(checkpointer=checkpointer)
+    # Graph compiled once per client-provided session checkpointer
+    compiled_graph = get_session_graph(
+        session_id, agent_graph, cache=request.session_id is not None
+    )
 
     logger.info(
         "processing_chat_message",
@@ -167,8 +203,8 @@ async def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
             }
         }
 
-        # Invoke agent graph
-        result = await compiled_graph.ainvoke(initial_state, config=config)
+        # Invoke agent graph within a bounded chat slot
+        result = await run_chat_graph(compiled_graph, initial_state, config)
 
         # Extract response
         response_text = result.get(
@@ -189,6 +225,13 @@ async def chat(request: ChatRequest, http_request: Request) -> ChatResponse:
             metadata=metadata,
         )
 
+    except TimeoutError:
+        logger.error("chat_processing_timed_out", session_id=session_id)
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="Timed out while processing message. Please try again.",
+        )
+
     except Exception as e:
         logger.error(
             "chat_processing_failed",
@@ -221,7 +264,7 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
     Raises:
         HTTPException: If agent is not initialized or processing fails
     """
-    from src.api.main import app_state
+    from src.api.main import app_state, stream_chat_graph
 
     # Get agent graph
     agent_graph = app_state.get("agent_graph")
@@ -235,11 +278,10 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
     # Generate session ID if not provided
     session_id = request.session_id or f"session_{http_request.state.request_id}"
 
-    # Get or create session checkpointer
-    checkpointer = get_or_create_session(session_id)
-
-    # Recompile graph with session checkpointer
-    compiled_graph = agent_graph.graph.compile(checkpointer=checkpointer)
+    # Graph compiled once per client-provided session checkpointer
+    compiled_graph = get_session_graph(
+        session_id, agent_graph, cache=request.session_id is not None
+    )
 
     logger.info(
         "processing_chat_stream",
@@ -270,17 +312,15 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
                 }
             }
 
-            # Stream events from graph
-            async for event in compiled_graph.astream_events(
-                initial_state, config=config, version="v1"
-            ):
+            # Stream events produced within a bounded chat slot
+            async for event in stream_chat_graph(compiled_graph, initial_state, config):
                 event_type = event.get("event")
 
                 # Send node updates
                 if event_type == "on_chain_start":
                     node_name = event.get("name", "")
                     if node_name:
-                        yield f"data: {json.dumps({'type': 'node', 'node': node_name})}\n\n"
+                        yield _sse_event({"type": "node", "node": node_name})
 
                 # Send LLM token streams
                 elif event_type == "on_chat_model_stream":
@@ -288,7 +328,7 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
                     if chunk and hasattr(chunk, "content"):
                         content = chunk.content
                         if content:
-                            yield f"data: {json.dumps({'type': 'token', 'content': content})}\n\n"
+                            yield _sse_event({"type": "token", "content": content})
 
                 # Send final result
                 elif event_type == "on_chain_end":
@@ -297,16 +337,32 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
                         response_text = output.get("response")
                         metadata = output.get("metadata", {})
                         if response_text:
-                            yield f"data: {json.dumps({'type': 'complete', 'response': response_text, 'metadata': metadata, 'session_id': session_id})}\n\n"
+                            yield _sse_event(
+                                {
+                                    "type": "complete",
+                                    "response": response_text,
+                                    "metadata": metadata,
+                                    "session_id": session_id,
+                                }
+                            )
 
             # Send done event
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            yield _sse_event({"type": "done"})
 
             logger.info(
                 "chat_stream_completed",
                 session_id=session_id,
             )
 
+        except TimeoutError:
+            logger.error("chat_stream_timed_out", session_id=session_id)
+            yield _sse_event(
+                {
+                    "type": "error",
+                    "error": "Timed out while processing message. Please try again.",
+                }
+            )
+
         except Exception as e:
             logger.error(
                 "chat_stream_failed",
@@ -315,7 +371,7 @@ async def chat_stream(request: ChatRequest, http_request: Request) -> StreamingR
                 exc_info=True,
             )
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield _sse_event({"type": "error", "error": str(e)})
 
     return StreamingResponse(
         event_generator(),
@@ -435,8 +491,9 @@ async def clear_session(session_id: str) -> SessionClearResponse:
         )
 
     try:
-        # Remove session from storage
+        # Remove session and its compiled graph from storage
         del session_storage[session_id]
+        session_graphs.pop(session_id, None)
 
         logger.info("session_cleared", session_id=session_id)
 
@@ -108,6 +108,12 @@ class Settings(BaseSettings):
         le=5,
         description="Maximum depth for Tavily crawl operations",
     )
+    tavily_max_concurrent: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum Tavily requests in flight at once per client",
+    )
 
     # Application Configuration
     app_name: str = Field(default="ChatFormula1", description="Application name")
@@ -121,6 +127,11 @@ class Settings(BaseSettings):
         le=50,
         description="Maximum conversation history to maintain",
     )
+    conversation_token_budget: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum tokens of conversation history to keep (None = no limit)",
+    )
     environment: Literal["development", "staging", "production"] = Field(
         default="development",
         description="Application environment",
@@ -133,6 +144,18 @@ class Settings(BaseSettings):
         default=True,
         description="Enable auto-reload for development",
     )
+    api_max_concurrent_chats: int = Field(
+        default=16,
+        ge=1,
+        le=256,
+        description="Maximum agent graph runs in flight across chat endpoints",
+    )
+    api_chat_timeout: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=600.0,
+        description="Seconds allowed per chat request, including queueing",
+    )
 
     # RAG Configuration
     vector_search_top_k: int = Field(
@@ -154,6 +177,18 @@ class Settings(BaseSettings):
         description="Overlap between document chunks",
     )
 
+    # Cache Configuration
+    semantic_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached LLM responses for semantically similar queries",
+    )
+    semantic_vector_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Reuse cached vector search results for semantically similar queries"
+        ),
+    )
+
     # Retry Configuration
     max_retries: int = Field(
         default=3,
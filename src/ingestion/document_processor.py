@@ -1,10 +1,10 @@
 """Document processing for text chunking and metadata extraction."""
 
-import hashlib
 import re
 from typing import Any, Dict, List, Optional, Set
 
 import structlog
+import xxhash
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -55,8 +55,9 @@ class DocumentProcessor:
             is_separator_regex=False,
         )
 
-        # Track seen document hashes for deduplication
-        self._seen_hashes: Set[str] = set()
+        # Track seen document hashes for deduplication; raw 16-byte digests
+        # take about 40% less memory per entry than hex strings
+        self._seen_hashes: Set[bytes] = set()
 
         self.logger.info(
             "document_processor_initialized",
@@ -543,17 +544,17 @@ class DocumentProcessor:
 
         return text
 
-    def _hash_document(self, doc: Document) -> str:
+    def _hash_document(self, doc: Document) -> bytes:
         """Generate hash for document content.
 
         Args:
             doc: Document to hash
 
         Returns:
-            MD5 hash of document content
+            128-bit xxh3 digest of document content
         """
         content = doc.page_content.encode("utf-8")
-        return hashlib.md5(content).hexdigest()
+        return xxhash.xxh3_128_digest(content)
 
     def clear_deduplication_cache(self) -> None:
         """Clear the deduplication cache."""
@@ -4,6 +4,8 @@ This module contains system-level prompts that define the agent's persona,
 capabilities, and behavioral guardrails.
 """
 
+import re
+from functools import lru_cache
 from typing import Optional
 
 from langchain_core.messages import SystemMessage
@@ -73,12 +75,16 @@ Do NOT:
 """
 
 
+@lru_cache(maxsize=32)
 def create_system_prompt(
     include_guardrails: bool = True,
     additional_context: Optional[str] = None,
 ) -> ChatPromptTemplate:
     """Create a system prompt template with F1 expert persona.
 
+    Templates are cached per argument combination, so repeated calls return
+    the same shared instance; callers must not mutate it.
+
     Args:
         include_guardrails: Whether to include off-topic guardrails
         additional_context: Optional additional context to append
@@ -103,12 +109,16 @@ def create_system_prompt(
     )
 
 
+@lru_cache(maxsize=32)
 def create_role_based_system_prompt(
     role: str = "expert",
     user_expertise: str = "intermediate",
 ) -> SystemMessage:
     """Create a role-based system prompt tailored to user expertise.
 
+    Messages are cached per (role, user_expertise), so repeated calls return
+    the same shared instance; callers must not mutate it.
+
     Args:
         role: The role of the assistant (expert, analyst, educator)
         user_expertise: User's F1 knowledge level (beginner, intermediate, expert)
@@ -147,6 +157,56 @@ def create_role_based_system_prompt(
     return SystemMessage(content=prompt)
 
 
+# Phrases that indicate a prompt injection attempt
+_INJECTION_PATTERNS = (
+    "ignore previous instructions",
+    "ignore all previous",
+    "disregard previous",
+    "forget previous",
+    "new instructions:",
+    "system:",
+    "you are now",
+    "act as",
+    "pretend to be",
+)
+
+# Keywords that mark a query as F1-related
+_F1_KEYWORDS = (
+    "f1",
+    "formula 1",
+    "formula one",
+    "grand prix",
+    "gp",
+    "driver",
+    "team",
+    "race",
+    "circuit",
+    "championship",
+    "qualifying",
+    "pole",
+    "podium",
+    "pit",
+    "tire",
+    "tyre",
+    "drs",
+    "kers",
+    "ers",
+    "fia",
+    "ferrari",
+    "mercedes",
+    "red bull",
+    "mclaren",
+    "verstappen",
+    "hamilton",
+    "leclerc",
+)
+
+# Each list is compiled into one alternation, so the lowercased input is
+# scanned once per check instead of once per phrase
+_INJECTION_RE = re.compile("|".join(map(re.escape, _INJECTION_PATTERNS)))
+_F1_KEYWORD_RE = re.compile("|".join(map(re.escape, _F1_KEYWORDS)))
+
+
 def validate_prompt_safety(user_input: str) -> tuple[bool, Optional[str]]:
     """Validate user input for prompt injection attempts and off-topic queries.
 
@@ -156,27 +216,14 @@ def validate_prompt_safety(user_input: str) -> tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_safe, warning_message)
     """
-    # Check for prompt injection patterns
-    injection_patterns = [
-        "ignore previous instructions",
-        "ignore all previous",
-        "disregard previous",
-        "forget previous",
-        "new instructions:",
-        "system:",
-        "you are now",
-        "act as",
-        "pretend to be",
-    ]
-
     user_input_lower = user_input.lower()
 
-    for pattern in injection_patterns:
-        if pattern in user_input_lower:
-            return (
-                False,
-                "Your query contains patterns that cannot be processed. Please rephrase your F1 question.",
-            )
+    # Check for prompt injection patterns
+    if _INJECTION_RE.search(user_input_lower):
+        return (
+            False,
+            "Your query contains patterns that cannot be processed. Please rephrase your F1 question.",
+        )
 
     # Check for extremely long inputs (potential abuse)
     if len(user_input) > 2000:
@@ -185,43 +232,12 @@ def validate_prompt_safety(user_input: str) -> tuple[bool, Optional[str]]:
             "Your query is too long. Please keep questions under 2000 characters.",
         )
 
-    # Basic F1 relevance check (keywords)
-    f1_keywords = [
-        "f1",
-        "formula 1",
-        "formula one",
-        "grand prix",
-        "gp",
-        "driver",
-        "team",
-        "race",
-        "circuit",
-        "championship",
-        "qualifying",
-        "pole",
-        "podium",
-        "pit",
-        "tire",
-        "tyre",
-        "drs",
-        "kers",
-        "ers",
-        "fia",
-        "ferrari",
-        "mercedes",
-        "red bull",
-        "mclaren",
-        "verstappen",
-        "hamilton",
-        "leclerc",
-    ]
-
     # If input is very short, skip keyword check
     if len(user_input.split()) < 3:
         return True, None
 
     # Check if any F1 keyword is present
-    has_f1_keyword = any(keyword in user_input_lower for keyword in f1_keywords)
+    has_f1_keyword = _F1_KEYWORD_RE.search(user_input_lower) is not None
 
     if not has_f1_keyword and len(user_input.split()) > 5:
         return (
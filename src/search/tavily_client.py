@@ -8,6 +8,7 @@ import asyncio
 import time
 from collections import deque
 from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
 
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.documents import Document
@@ -19,6 +20,9 @@ from ..utils.retry import retry_with_backoff
 
 logger = get_logger(__name__)
 
+# Distinct per-call parameter overrides whose search tools are kept for reuse
+MAX_OVERRIDE_TOOLS = 16
+
 
 class TavilyClient:
     """Client for Tavily Search API with F1-specific optimizations.
@@ -55,6 +59,9 @@ class TavilyClient:
         """
         self.settings = settings
         self._search_tool: Optional[TavilySearchResults] = None
+        # Tools for per-call parameter overrides, keyed by the resolved
+        # parameters, so repeat overrides reuse one configured tool
+        self._override_tools: dict[tuple[Any, ...], TavilySearchResults] = {}
 
         # Rate limiting using token bucket algorithm
         self._rate_limit_requests = rate_limit_requests
@@ -62,6 +69,9 @@ class TavilyClient:
         self._request_timestamps: deque[float] = deque()
         self._rate_limit_lock = asyncio.Lock()
 
+        # Caps in-flight requests independently of the per-window rate limit
+        self._concurrency = asyncio.Semaphore(settings.tavily_max_concurrent)
+
         # Fallback handling
         self._fallback_mode = False
         self._consecutive_failures = 0
@@ -85,6 +95,7 @@ class TavilyClient:
             include_domains_count=len(settings.tavily_include_domains),
             rate_limit_requests=rate_limit_requests,
             rate_limit_window=rate_limit_window,
+            max_concurrent=settings.tavily_max_concurrent,
             cache_enabled=enable_cache,
         )
 
@@ -97,7 +108,7 @@ class TavilyClient:
         """
         # Check if we should exit fallback mode
         if self._fallback_mode and self._last_failure_time:
-            time_since_failure = time.time() - self._last_failure_time
+            time_since_failure = time.monotonic() - self._last_failure_time
             if time_since_failure > self._fallback_cooldown:
                 logger.info(
                     "exiting_fallback_mode",
@@ -111,7 +122,7 @@ class TavilyClient:
     def _record_failure(self) -> None:
         """Record a search failure and potentially enter fallback mode."""
         self._consecutive_failures += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
 
         if self._consecutive_failures >= self._max_consecutive_failures:
             if not self._fallback_mode:
@@ -145,7 +156,7 @@ class TavilyClient:
 
         time_remaining = 0
         if self._last_failure_time:
-            elapsed = time.time() - self._last_failure_time
+            elapsed = time.monotonic() - self._last_failure_time
             time_remaining = max(0, int(self._fallback_cooldown - elapsed))
 
         return (
@@ -174,6 +185,43 @@ class TavilyClient:
             )
         return self._search_tool
 
+    def _override_search_tool(
+        self,
+        max_results: int,
+        search_depth: str,
+        include_answer: bool,
+        include_raw_content: bool,
+    ) -> TavilySearchResults:
+        """Get or create a search tool for overridden search parameters.
+
+        Args:
+            max_results: Resolved maximum number of results
+            search_depth: Resolved search depth
+            include_answer: Resolved include_answer setting
+            include_raw_content: Resolved include_raw_content setting
+
+        Returns:
+            TavilySearchResults: Search tool configured with the parameters
+        """
+        key = (max_results, search_depth, include_answer, include_raw_content)
+        search_tool = self._override_tools.get(key)
+        if search_tool is None:
+            if len(self._override_tools) >= MAX_OVERRIDE_TOOLS:
+                # Evict the oldest configuration
+                del self._override_tools[next(iter(self._override_tools))]
+            search_tool = TavilySearchResults(
+                api_key=self.settings.tavily_api_key,
+                max_results=max_results,
+                search_depth=search_depth,
+                include_answer=include_answer,
+                include_raw_content=include_raw_content,
+                include_images=self.settings.tavily_include_images,
+                include_domains=self.settings.tavily_include_domains,
+                exclude_domains=self.settings.tavily_exclude_domains,
+            )
+            self._override_tools[key] = search_tool
+        return search_tool
+
     async def _check_rate_limit(self) -> None:
         """Check and enforce rate limiting using token bucket algorithm.
 
@@ -181,7 +229,7 @@ class TavilyClient:
             RateLimitError: If rate limit is exceeded
         """
         async with self._rate_limit_lock:
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Remove timestamps outside the current window
             while (
@@ -279,8 +327,7 @@ class TavilyClient:
                     search_depth,
                 ]
             ):
-                search_tool = TavilySearchResults(
-                    api_key=self.settings.tavily_api_key,
+                search_tool = self._override_search_tool(
                     max_results=final_max_results,
                     search_depth=final_search_depth,
                     include_answer=(
@@ -293,15 +340,13 @@ class TavilyClient:
                         if include_raw_content is not None
                         else self.settings.tavily_include_raw_content
                     ),
-                    include_images=self.settings.tavily_include_images,
-                    include_domains=self.settings.tavily_include_domains,
-                    exclude_domains=self.settings.tavily_exclude_domains,
                 )
             else:
                 search_tool = self.search_tool
 
             # Execute search
-            results = await search_tool.ainvoke({"query": query})
+            async with self._concurrency:
+                results = await search_tool.ainvoke({"query": query})
 
             logger.info(
                 "tavily_search_completed",
@@ -697,6 +742,34 @@ class TavilyClient:
             )
             return None
 
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """Normalize a URL for duplicate detection.
+
+        Only the scheme and host are case-insensitive, so the path and query
+        keep their case; a trailing slash on the path is ignored. Malformed
+        URLs fall back to only stripping the trailing slash.
+
+        Args:
+            url: Result URL
+
+        Returns:
+            Normalized URL
+        """
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return url.rstrip("/")
+        return urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path.rstrip("/"),
+                parts.query,
+                parts.fragment,
+            )
+        )
+
     def _deduplicate_results(
         self,
         results: list[dict[str, Any]],
@@ -717,8 +790,9 @@ class TavilyClient:
             url = result["url"]
             content = result["content"]
 
-            # Check for duplicate URL
-            if url in seen_urls:
+            # Check for duplicate URL, ignoring host case and trailing slashes
+            url_key = self._normalize_url(url)
+            if url_key in seen_urls:
                 logger.debug("duplicate_url_skipped", url=url)
                 continue
 
@@ -728,7 +802,7 @@ class TavilyClient:
                 logger.debug("duplicate_content_skipped", url=url)
                 continue
 
-            seen_urls.add(url)
+            seen_urls.add(url_key)
             seen_content_hashes.add(content_hash)
             deduplicated.append(result)
 
@@ -4,9 +4,10 @@ This module provides rate limiting functionality to prevent abuse and ensure
 fair usage of the API.
 """
 
+import asyncio
 import time
 from collections import defaultdict
-from typing import Optional
+from typing import Literal, Optional, Union
 
 import structlog
 from fastapi import HTTPException, Request, status
@@ -52,7 +53,7 @@ class TokenBucket:
         self.capacity = capacity
         self.refill_rate = refill_rate
         self.tokens = capacity
-        self.last_refill = time.time()
+        self.last_refill = time.monotonic()
 
     def consume(self, tokens: int = 1) -> bool:
         """Try to consume tokens from the bucket.
@@ -63,11 +64,7 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if insufficient tokens
         """
-        # Refill tokens based on time elapsed
-        now = time.time()
-        elapsed = now - self.last_refill
-        self.tokens = min(self.capacity, self.tokens + (elapsed * self.refill_rate))
-        self.last_refill = now
+        self._refill()
 
         # Try to consume tokens
         if self.tokens >= tokens:
@@ -76,6 +73,21 @@ class TokenBucket:
 
         return False
 
+    def next_conforming_time(self, tokens: int = 1) -> float:
+        """Calculate the delay until exactly ``tokens`` tokens are available.
+
+        The bucket is refilled up to now first, so the result is the instant
+        a single timer can be scheduled for instead of polling ``consume``.
+
+        Args:
+            tokens: Number of tokens needed
+
+        Returns:
+            Seconds until tokens are available (0.0 if available now)
+        """
+        self._refill()
+        return max(0.0, (tokens - self.tokens) / self.refill_rate)
+
     def time_until_available(self, tokens: int = 1) -> float:
         """Calculate time until tokens are available.
 
@@ -85,40 +97,165 @@ class TokenBucket:
         Returns:
             Seconds until tokens are available
         """
-        if self.tokens >= tokens:
+        return self.next_conforming_time(tokens)
+
+    async def acquire(self, tokens: int = 1) -> None:
+        """Wait until tokens can be consumed, then consume them.
+
+        Sleeps once until the next conforming time rather than polling; it
+        only sleeps again if a concurrent caller took the refilled tokens.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket can hold
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}"
+            )
+
+        while not self.consume(tokens):
+            await asyncio.sleep(self.next_conforming_time(tokens))
+
+    def available(self) -> float:
+        """Get the tokens available now without consuming any.
+
+        Returns:
+            Current token count including the refill since the last update
+        """
+        elapsed = time.monotonic() - self.last_refill
+        return min(self.capacity, self.tokens + (elapsed * self.refill_rate))
+
+    @property
+    def last_used(self) -> float:
+        """Monotonic time the bucket was last refilled or consumed from."""
+        return self.last_refill
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + (elapsed * self.refill_rate))
+        self.last_refill = now
+
+
+class FixedWindowCounter:
+    """Fixed-window counter for rate limiting.
+
+    Allows ``limit`` tokens per window and resets the count when a new
+    window starts. Each check is an integer increment and compare, with no
+    refill arithmetic, at the cost of allowing up to twice the limit across
+    a window boundary.
+    """
+
+    def __init__(self, limit: int, window_seconds: float):
+        """Initialize fixed-window counter.
+
+        Args:
+            limit: Maximum tokens per window
+            window_seconds: Window length in seconds
+        """
+        self.capacity = limit
+        self.window_seconds = window_seconds
+        self.window_start = time.monotonic()
+        self.count = 0
+        self.last_used = self.window_start
+
+    @property
+    def tokens(self) -> int:
+        """Tokens left in the current window."""
+        return self.capacity - self.count
+
+    def consume(self, tokens: int = 1) -> bool:
+        """Try to consume tokens from the current window.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            True if tokens were consumed, False if the window is exhausted
+        """
+        now = time.monotonic()
+        self.last_used = now
+        if now - self.window_start >= self.window_seconds:
+            self.window_start = now
+            self.count = 0
+
+        if self.count + tokens <= self.capacity:
+            self.count += tokens
+            return True
+
+        return False
+
+    def time_until_available(self, tokens: int = 1) -> float:
+        """Calculate time until tokens are available.
+
+        Args:
+            tokens: Number of tokens needed
+
+        Returns:
+            Seconds until the window resets, or 0.0 if tokens are available now
+        """
+        if self.count + tokens <= self.capacity:
             return 0.0
+        elapsed = time.monotonic() - self.window_start
+        return max(0.0, self.window_seconds - elapsed)
+
+    def available(self) -> int:
+        """Get the tokens available now without consuming any.
+
+        Returns:
+            Tokens left in the current window (the full limit once it expired)
+        """
+        if time.monotonic() - self.window_start >= self.window_seconds:
+            return self.capacity
+        return self.tokens
+
 
-        tokens_needed = tokens - self.tokens
-        return tokens_needed / self.refill_rate
+RateLimitStrategy = Literal["token_bucket", "fixed_window"]
 
 
 class RateLimiter:
-    """Rate limiter using token bucket algorithm."""
+    """Per-client rate limiter using token buckets or fixed-window counters."""
 
     def __init__(
         self,
         requests_per_minute: int = 60,
         requests_per_hour: int = 1000,
         burst_size: Optional[int] = None,
+        strategy: RateLimitStrategy = "token_bucket",
     ):
         """Initialize rate limiter.
 
         Args:
             requests_per_minute: Maximum requests per minute per client
             requests_per_hour: Maximum requests per hour per client
-            burst_size: Maximum burst size (defaults to requests_per_minute)
+            burst_size: Maximum burst size (defaults to requests_per_minute,
+                token bucket strategy only)
+            strategy: "token_bucket" smooths bursts with continuous refill;
+                "fixed_window" counts requests per clock window, which is
+                cheaper per request when burst smoothing is not needed
+
+        Raises:
+            ValueError: If strategy is not recognized
         """
+        if strategy not in ("token_bucket", "fixed_window"):
+            raise ValueError(f"Unknown rate limit strategy: {strategy}")
+
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         self.burst_size = burst_size or requests_per_minute
+        self.strategy = strategy
 
-        # Storage for token buckets per client
+        # Storage for per-client limiters
         # In production, use Redis for distributed rate limiting
-        self.minute_buckets: dict[str, TokenBucket] = {}
-        self.hour_buckets: dict[str, TokenBucket] = {}
+        self.minute_buckets: dict[str, Union[TokenBucket, FixedWindowCounter]] = {}
+        self.hour_buckets: dict[str, Union[TokenBucket, FixedWindowCounter]] = {}
 
         # Cleanup old buckets periodically
-        self.last_cleanup = time.time()
+        self.last_cleanup = time.monotonic()
         self.cleanup_interval = 3600  # 1 hour
 
     def _get_client_id(self, request: Request) -> str:
@@ -146,9 +283,26 @@ class RateLimiter:
 
         return f"ip:{client_ip}"
 
+    def _create_limiter(
+        self, limit: int, burst: int, window_seconds: float
+    ) -> Union[TokenBucket, FixedWindowCounter]:
+        """Create a per-client limiter for the configured strategy.
+
+        Args:
+            limit: Maximum requests per window
+            burst: Token bucket capacity
+            window_seconds: Window length in seconds
+
+        Returns:
+            New token bucket or fixed-window counter
+        """
+        if self.strategy == "fixed_window":
+            return FixedWindowCounter(limit=limit, window_seconds=window_seconds)
+        return TokenBucket(capacity=burst, refill_rate=limit / window_seconds)
+
     def _cleanup_old_buckets(self) -> None:
         """Clean up old token buckets to prevent memory leaks."""
-        now = time.time()
+        now = time.monotonic()
         if now - self.last_cleanup < self.cleanup_interval:
             return
 
@@ -158,13 +312,13 @@ class RateLimiter:
         self.minute_buckets = {
             client_id: bucket
             for client_id, bucket in self.minute_buckets.items()
-            if bucket.last_refill > cutoff_time
+            if bucket.last_used > cutoff_time
         }
 
         self.hour_buckets = {
             client_id: bucket
             for client_id, bucket in self.hour_buckets.items()
-            if bucket.last_refill > cutoff_time
+            if bucket.last_used > cutoff_time
         }
 
         self.last_cleanup = now
@@ -192,16 +346,18 @@ class RateLimiter:
 
         # Get or create minute bucket
         if client_id not in self.minute_buckets:
-            self.minute_buckets[client_id] = TokenBucket(
-                capacity=self.burst_size,
-                refill_rate=self.requests_per_minute / 60.0,  # tokens per second
+            self.minute_buckets[client_id] = self._create_limiter(
+                limit=self.requests_per_minute,
+                burst=self.burst_size,
+                window_seconds=60.0,
             )
 
         # Get or create hour bucket
         if client_id not in self.hour_buckets:
-            self.hour_buckets[client_id] = TokenBucket(
-                capacity=self.requests_per_hour,
-                refill_rate=self.requests_per_hour / 3600.0,  # tokens per second
+            self.hour_buckets[client_id] = self._create_limiter(
+                limit=self.requests_per_hour,
+                burst=self.requests_per_hour,
+                window_seconds=3600.0,
             )
 
         minute_bucket = self.minute_buckets[client_id]
@@ -268,27 +424,15 @@ class RateLimiter:
         # Get remaining tokens
         if client_id in self.minute_buckets:
             minute_bucket = self.minute_buckets[client_id]
-            # Refill tokens to get current count
-            now = time.time()
-            elapsed = now - minute_bucket.last_refill
-            current_tokens = min(
-                minute_bucket.capacity,
-                minute_bucket.tokens + (elapsed * minute_bucket.refill_rate),
-            )
-            info["remaining"]["minute"] = int(current_tokens)
+            info["remaining"]["minute"] = int(minute_bucket.available())
+        elif self.strategy == "fixed_window":
+            info["remaining"]["minute"] = self.requests_per_minute
         else:
             info["remaining"]["minute"] = self.burst_size
 
         if client_id in self.hour_buckets:
             hour_bucket = self.hour_buckets[client_id]
-            # Refill tokens to get current count
-            now = time.time()
-            elapsed = now - hour_bucket.last_refill
-            current_tokens = min(
-                hour_bucket.capacity,
-                hour_bucket.tokens + (elapsed * hour_bucket.refill_rate),
-            )
-            info["remaining"]["hour"] = int(current_tokens)
+            info["remaining"]["hour"] = int(hour_bucket.available())
         else:
             info["remaining"]["hour"] = self.requests_per_hour
 
@@ -303,6 +447,7 @@ def get_rate_limiter(
     requests_per_minute: int = 60,
     requests_per_hour: int = 1000,
     burst_size: Optional[int] = None,
+    strategy: RateLimitStrategy = "token_bucket",
 ) -> RateLimiter:
     """Get or create global rate limiter instance.
 
@@ -310,6 +455,7 @@ def get_rate_limiter(
         requests_per_minute: Maximum requests per minute per client
         requests_per_hour: Maximum requests per hour per client
         burst_size: Maximum burst size
+        strategy: Rate limiting strategy ("token_bucket" or "fixed_window")
 
     Returns:
         RateLimiter instance
@@ -321,12 +467,14 @@ def get_rate_limiter(
             requests_per_minute=requests_per_minute,
             requests_per_hour=requests_per_hour,
             burst_size=burst_size,
+            strategy=strategy,
         )
         logger.info(
             "rate_limiter_initialized",
             requests_per_minute=requests_per_minute,
             requests_per_hour=requests_per_hour,
             burst_size=burst_size or requests_per_minute,
+            strategy=strategy,
         )
 
     return _rate_limiter
@@ -26,6 +26,8 @@ class RequestSigner:
             max_age_seconds: Maximum age of signed requests in seconds
         """
         self.secret_key = secret_key.encode()
+        # Keyed once; copies skip re-deriving the HMAC pads on every request
+        self._hmac_prototype = hmac.new(self.secret_key, digestmod=hashlib.sha256)
         self.max_age_seconds = max_age_seconds
         logger.info(
             "request_signer_initialized",
@@ -53,26 +55,7 @@ class RequestSigner:
         if timestamp is None:
             timestamp = int(time.time())
 
-        # Build string to sign
-        parts = [
-            str(timestamp),
-            method.upper(),
-            path,
-        ]
-
-        if body:
-            # Hash body for large payloads
-            body_hash = hashlib.sha256(body.encode()).hexdigest()
-            parts.append(body_hash)
-
-        string_to_sign = "\n".join(parts)
-
-        # Generate signature
-        signature = hmac.new(
-            self.secret_key,
-            string_to_sign.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = self._compute_signature(timestamp, method, path, body)
 
         logger.debug(
             "request_signed",
@@ -128,11 +111,10 @@ class RequestSigner:
                 return False
 
             # Compute expected signature
-            expected_sig = self.sign_request(method, path, body, timestamp)
-            expected_sig_value = expected_sig.split(".", 1)[1]
+            expected_sig = self._compute_signature(timestamp, method, path, body)
 
             # Compare signatures (constant time)
-            is_valid = hmac.compare_digest(provided_sig, expected_sig_value)
+            is_valid = hmac.compare_digest(provided_sig, expected_sig)
 
             if not is_valid:
                 logger.warning("signature_mismatch")
@@ -149,6 +131,43 @@ class RequestSigner:
             )
             return False
 
+    def _compute_signature(
+        self,
+        timestamp: int,
+        method: str,
+        path: str,
+        body: Optional[str] = None,
+    ) -> str:
+        """Compute the hex HMAC-SHA256 signature for a request.
+
+        Args:
+            timestamp: Unix timestamp
+            method: HTTP method
+            path: Request path
+            body: Request body (optional)
+
+        Returns:
+            Hex-encoded signature
+        """
+        # Build string to sign
+        parts = [
+            str(timestamp),
+            method.upper(),
+            path,
+        ]
+
+        if body:
+            # Hash body for large payloads
+            body_hash = hashlib.sha256(body.encode()).hexdigest()
+            parts.append(body_hash)
+
+        string_to_sign = "\n".join(parts)
+
+        # Generate signature from a copy of the pre-keyed HMAC
+        mac = self._hmac_prototype.copy()
+        mac.update(string_to_sign.encode())
+        return mac.hexdigest()
+
     async def verify_request(self, request: Request) -> None:
         """Verify a FastAPI request signature.
 
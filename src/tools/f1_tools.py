@@ -6,6 +6,7 @@ This module provides tools that the LangGraph agent can use to:
 3. Generate race predictions combining historical and current data
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional
 
 from langchain_core.tools import tool
@@ -420,11 +421,12 @@ async def predict_race_outcome(
         if not factors:
             factors = ["circuit_history", "driver_form"]
 
-        # Step 1: Gather historical data from vector store
-        historical_data = await _gather_historical_data(race, season)
-
-        # Step 2: Gather current form data from Tavily
-        current_data = await _gather_current_data(race, season, factors)
+        # Steps 1-2: Gather historical data from the vector store and current
+        # form data from Tavily concurrently
+        historical_data, current_data = await asyncio.gather(
+            _gather_historical_data(race, season),
+            _gather_current_data(race, season, factors),
+        )
 
         # Step 3: Generate structured prediction
         prediction = _generate_prediction(
@@ -540,27 +542,32 @@ async def _gather_current_data(
     if not search_queries:
         search_queries.append(f"{race} {season} F1 preview predictions")
 
-    # Execute searches
-    for query in search_queries:
-        try:
-            results, error = await _tavily_client.safe_search(
+    # Execute searches concurrently; the client's rate limiter still applies
+    search_outcomes = await asyncio.gather(
+        *(
+            _tavily_client.safe_search(
                 query=query,
                 max_results=3,
                 search_depth="advanced",
             )
+            for query in search_queries
+        ),
+        return_exceptions=True,
+    )
 
-            if not error and results:
-                current_context[query] = [
-                    result.get("content", "") for result in results
-                ]
-        except Exception as e:
+    for query, outcome in zip(search_queries, search_outcomes, strict=True):
+        if isinstance(outcome, BaseException):
             logger.warning(
                 "current_data_search_failed",
                 query=query,
-                error=str(e),
+                error=str(outcome),
             )
             continue
 
+        results, error = outcome
+        if not error and results:
+            current_context[query] = [result.get("content", "") for result in results]
+
     logger.info(
         "current_data_gathered",
         race=race,
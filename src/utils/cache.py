@@ -5,17 +5,21 @@ This module provides in-memory caching for:
 - Tavily search results
 - LLM responses for common queries
 
-Uses a simple TTL-based cache with LRU eviction.
+Uses a simple TTL-based cache with LRU eviction. Vector search results and LLM
+responses are additionally cached semantically, so paraphrased queries can
+reuse an earlier result.
 """
 
-import hashlib
-import json
+import heapq
 import time
 from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+import orjson
 import structlog
+import xxhash
 
 logger = structlog.get_logger(__name__)
 
@@ -32,16 +36,29 @@ class TTLCache:
         default_ttl: Default time-to-live in seconds
     """
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 300) -> None:
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 300,
+        time_source: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize TTL cache.
 
         Args:
             max_size: Maximum number of items to store (default: 1000)
             default_ttl: Default TTL in seconds (default: 300 = 5 minutes)
+            time_source: Clock used for expiry (default: time.monotonic)
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self._time = time_source
         self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
+        # Min-heap of (expiry, key) so sweeps only touch entries that expired.
+        # Overwritten or evicted keys leave stale heap entries behind; they
+        # are skipped when popped and dropped when the heap is compacted.
+        self._expiry_heap: List[Tuple[float, str]] = []
+        # Plain counters, never locked: telemetry must not slow down get/set.
+        # Derived figures such as hit_rate are only computed in get_stats().
         self._hits = 0
         self._misses = 0
 
@@ -65,8 +82,12 @@ class TTLCache:
             "args": args,
             "kwargs": kwargs,
         }
-        cache_str = json.dumps(cache_data, sort_keys=True, default=str)
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        cache_bytes = orjson.dumps(
+            cache_data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+        return xxhash.xxh3_128_hexdigest(cache_bytes)
 
     def _is_expired(self, expiry_time: float) -> bool:
         """Check if an entry has expired.
@@ -77,25 +98,38 @@ class TTLCache:
         Returns:
             True if expired, False otherwise
         """
-        return time.time() > expiry_time
+        return self._time() > expiry_time
 
     def _evict_expired(self) -> int:
         """Remove all expired entries.
 
+        Pops deadlines off the expiry heap, so the cost is proportional to
+        the number of expired (or stale) entries rather than the cache size.
+
         Returns:
             Number of entries evicted
         """
-        expired_keys = [
-            key for key, (_, expiry) in self._cache.items() if self._is_expired(expiry)
-        ]
+        now = self._time()
+        heap = self._expiry_heap
+        evicted = 0
+
+        while heap and heap[0][0] < now:
+            expiry, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale heap entries for keys that were overwritten or removed
+            if entry is not None and entry[1] == expiry:
+                del self._cache[key]
+                evicted += 1
 
-        for key in expired_keys:
-            del self._cache[key]
+        if evicted:
+            logger.debug("expired_entries_evicted", count=evicted)
 
-        if expired_keys:
-            logger.debug("expired_entries_evicted", count=len(expired_keys))
+        return evicted
 
-        return len(expired_keys)
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries, dropping stale ones."""
+        self._expiry_heap = [(expiry, key) for key, (_, expiry) in self._cache.items()]
+        heapq.heapify(self._expiry_heap)
 
     def _evict_lru(self) -> None:
         """Evict least recently used entry."""
@@ -150,10 +184,13 @@ class TTLCache:
 
         # Calculate expiry time
         ttl_seconds = ttl if ttl is not None else self.default_ttl
-        expiry = time.time() + ttl_seconds
+        expiry = self._time() + ttl_seconds
 
         # Store value
         self._cache[key] = (value, expiry)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        if len(self._expiry_heap) > 2 * self.max_size:
+            self._compact_expiry_heap()
 
         logger.debug(
             "cache_set",
@@ -185,6 +222,7 @@ class TTLCache:
         """
         count = len(self._cache)
         self._cache.clear()
+        self._expiry_heap.clear()
         self._hits = 0
         self._misses = 0
         logger.info("cache_cleared", entries_cleared=count)
@@ -217,13 +255,290 @@ class TTLCache:
         return key in self._cache
 
 
+class _SemanticPartition:
+    """Embeddings of one semantic cache partition, one matrix row per entry.
+
+    Rows are appended in place and removed by moving the last row into the
+    freed slot, so writes never rebuild the matrix.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        """Initialize an empty partition.
+
+        Args:
+            dimension: Embedding dimension
+        """
+        self.ids: List[int] = []  # row -> entry id
+        self._rows: Dict[int, int] = {}  # entry id -> row
+        self._matrix = np.empty((8, dimension), dtype=np.float32)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Stacked embeddings of the live entries, one per row."""
+        return self._matrix[: len(self.ids)]
+
+    def add(self, entry_id: int, vector: np.ndarray) -> None:
+        """Append a normalized embedding for an entry."""
+        row = len(self.ids)
+        if row == len(self._matrix):
+            grown = np.empty((2 * row, self._matrix.shape[1]), dtype=np.float32)
+            grown[:row] = self._matrix
+            self._matrix = grown
+        self._matrix[row] = vector
+        self._rows[entry_id] = row
+        self.ids.append(entry_id)
+
+    def remove(self, entry_id: int) -> None:
+        """Remove an entry, filling its row with the last one."""
+        row = self._rows.pop(entry_id)
+        last_id = self.ids.pop()
+        if last_id != entry_id:
+            self._matrix[row] = self._matrix[len(self.ids)]
+            self.ids[row] = last_id
+            self._rows[last_id] = row
+
+    def __len__(self) -> int:
+        """Get number of entries in the partition."""
+        return len(self.ids)
+
+
+class SemanticTTLCache:
+    """TTL cache with LRU eviction that matches entries by embedding similarity.
+
+    Entries are stored with an L2-normalized embedding of the query that
+    produced them. A lookup returns the value of the most similar entry if
+    its cosine similarity reaches ``similarity_threshold``, so paraphrases
+    such as "Who won the 2021 F1 title?" and "Who was the 2021 F1 champion?"
+    share one cached response.
+
+    Entries live in named partitions (e.g. one per model/temperature pair)
+    and only match within their own partition.
+
+    Attributes:
+        max_size: Maximum number of items to store across all partitions
+        default_ttl: Default time-to-live in seconds
+        similarity_threshold: Minimum cosine similarity for a hit
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 3600,
+        similarity_threshold: float = 0.9,
+        time_source: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize semantic TTL cache.
+
+        Args:
+            max_size: Maximum number of items to store (default: 1000)
+            default_ttl: Default TTL in seconds (default: 3600 = 1 hour)
+            similarity_threshold: Minimum cosine similarity for a hit (default: 0.9)
+            time_source: Clock used for expiry (default: time.monotonic)
+        """
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.similarity_threshold = similarity_threshold
+        self._time = time_source
+        # entry id -> (partition, value, expiry), in LRU order
+        self._entries: OrderedDict[int, Tuple[str, Any, float]] = OrderedDict()
+        # partition -> stacked embeddings, updated in place on every write
+        self._partitions: Dict[str, _SemanticPartition] = {}
+        # Min-heap of (expiry, entry id); ids are never reused, so heap
+        # entries for evicted ids are stale and skipped when popped
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._next_id = 0
+        self._hits = 0
+        self._misses = 0
+
+        logger.info(
+            "semantic_cache_initialized",
+            max_size=max_size,
+            default_ttl=default_ttl,
+            similarity_threshold=similarity_threshold,
+        )
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> np.ndarray:
+        """L2-normalize an embedding so dot products are cosine similarities."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _remove(self, entry_id: int) -> None:
+        """Remove an entry from the cache and its partition."""
+        partition = self._entries.pop(entry_id)[0]
+        rows = self._partitions[partition]
+        rows.remove(entry_id)
+        if not rows:
+            del self._partitions[partition]
+
+    def _evict_expired(self) -> int:
+        """Remove all expired entries.
+
+        Pops deadlines off the expiry heap, so the cost is proportional to
+        the number of expired (or stale) entries rather than the cache size.
+
+        Returns:
+            Number of entries evicted
+        """
+        now = self._time()
+        heap = self._expiry_heap
+        evicted = 0
+
+        while heap and heap[0][0] < now:
+            _, entry_id = heapq.heappop(heap)
+            # Skip stale heap entries for ids already evicted as LRU
+            if entry_id in self._entries:
+                self._remove(entry_id)
+                evicted += 1
+
+        if evicted:
+            logger.debug("semantic_expired_entries_evicted", count=evicted)
+
+        return evicted
+
+    def has_entries(self, partition: str) -> bool:
+        """Check whether a partition holds any unexpired entries.
+
+        Lets callers skip embedding a query when nothing could match it.
+
+        Args:
+            partition: Partition name
+
+        Returns:
+            True if the partition has at least one unexpired entry
+        """
+        self._evict_expired()
+        return partition in self._partitions
+
+    def get(self, partition: str, embedding: Sequence[float]) -> Optional[Any]:
+        """Get the value cached for the most similar query.
+
+        Args:
+            partition: Partition to search
+            embedding: Embedding of the query being looked up
+
+        Returns:
+            Cached value if a similar, unexpired entry exists, None otherwise
+        """
+        # Expired entries are swept first, so the best match is always live
+        self._evict_expired()
+        rows = self._partitions.get(partition)
+
+        if rows is not None:
+            scores = rows.matrix @ self._normalize(embedding)
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+
+            if similarity >= self.similarity_threshold:
+                entry_id = rows.ids[best]
+                self._entries.move_to_end(entry_id)
+                self._hits += 1
+                logger.debug(
+                    "semantic_cache_hit",
+                    partition=partition,
+                    similarity=round(similarity, 4),
+                )
+                return self._entries[entry_id][1]
+
+        self._misses += 1
+        logger.debug("semantic_cache_miss", partition=partition)
+        return None
+
+    def set(
+        self,
+        partition: str,
+        embedding: Sequence[float],
+        value: Any,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Cache a value under a query embedding.
+
+        Args:
+            partition: Partition to store the entry in
+            embedding: Embedding of the query that produced the value
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default if None)
+        """
+        self._evict_expired()
+
+        # Evict LRU if cache is full
+        if len(self._entries) >= self.max_size:
+            self._remove(next(iter(self._entries)))
+            logger.debug("semantic_lru_entry_evicted")
+
+        ttl_seconds = ttl if ttl is not None else self.default_ttl
+        expiry = self._time() + ttl_seconds
+        vector = self._normalize(embedding)
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (partition, value, expiry)
+        if partition not in self._partitions:
+            self._partitions[partition] = _SemanticPartition(vector.shape[0])
+        self._partitions[partition].add(entry_id, vector)
+
+        heapq.heappush(self._expiry_heap, (expiry, entry_id))
+        if len(self._expiry_heap) > 2 * self.max_size:
+            self._expiry_heap = [
+                (entry_expiry, live_id)
+                for live_id, (_, _, entry_expiry) in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+        logger.debug(
+            "semantic_cache_set",
+            partition=partition,
+            ttl=ttl_seconds,
+            cache_size=len(self._entries),
+        )
+
+    def clear(self) -> int:
+        """Clear all entries from cache.
+
+        Returns:
+            Number of entries cleared
+        """
+        count = len(self._entries)
+        self._entries.clear()
+        self._partitions.clear()
+        self._expiry_heap.clear()
+        self._hits = 0
+        self._misses = 0
+        logger.info("semantic_cache_cleared", entries_cleared=count)
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": hit_rate,
+            "total_requests": total_requests,
+            "similarity_threshold": self.similarity_threshold,
+        }
+
+    def __len__(self) -> int:
+        """Get number of entries in cache."""
+        return len(self._entries)
+
+
 class CacheManager:
     """Manager for multiple caches with different TTLs.
 
     Provides separate caches for:
-    - Vector search results (5 minute TTL)
+    - Vector search results (5 minute TTL), both exact-match and semantic
     - Tavily search results (15 minute TTL)
-    - LLM responses (1 hour TTL)
+    - LLM responses (1 hour TTL), both exact-match and semantic
     """
 
     def __init__(
@@ -232,6 +547,8 @@ class CacheManager:
         search_cache_ttl: int = 900,  # 15 minutes
         llm_cache_ttl: int = 3600,  # 1 hour
         max_size: int = 1000,
+        llm_similarity_threshold: float = 0.9,
+        vector_similarity_threshold: float = 0.95,
     ) -> None:
         """Initialize cache manager.
 
@@ -240,10 +557,24 @@ class CacheManager:
             search_cache_ttl: TTL for Tavily search results in seconds
             llm_cache_ttl: TTL for LLM responses in seconds
             max_size: Maximum size for each cache
+            llm_similarity_threshold: Minimum cosine similarity for a semantic
+                LLM cache hit
+            vector_similarity_threshold: Minimum cosine similarity for a
+                semantic vector search cache hit
         """
         self.vector_cache = TTLCache(max_size=max_size, default_ttl=vector_cache_ttl)
         self.search_cache = TTLCache(max_size=max_size, default_ttl=search_cache_ttl)
         self.llm_cache = TTLCache(max_size=max_size, default_ttl=llm_cache_ttl)
+        self.semantic_vector_cache = SemanticTTLCache(
+            max_size=max_size,
+            default_ttl=vector_cache_ttl,
+            similarity_threshold=vector_similarity_threshold,
+        )
+        self.semantic_llm_cache = SemanticTTLCache(
+            max_size=max_size,
+            default_ttl=llm_cache_ttl,
+            similarity_threshold=llm_similarity_threshold,
+        )
 
         logger.info(
             "cache_manager_initialized",
@@ -276,6 +607,24 @@ class CacheManager:
             filters or {},
         )
 
+    def get_vector_partition_key(
+        self,
+        k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Generate semantic vector cache partition for search parameters.
+
+        Results only match queries made with the same k and filters.
+
+        Args:
+            k: Number of results
+            filters: Optional metadata filters
+
+        Returns:
+            Partition name
+        """
+        return self.vector_cache._generate_key("vector", k, filters or {})
+
     def get_search_cache_key(
         self,
         query: str,
@@ -318,7 +667,7 @@ class CacheManager:
             Cache key string
         """
         # Use hash of context to keep key size manageable
-        context_hash = hashlib.md5(context.encode()).hexdigest()
+        context_hash = xxhash.xxh3_128_hexdigest(context.encode())
 
         return self.llm_cache._generate_key(
             "llm",
@@ -328,6 +677,36 @@ class CacheManager:
             temperature,
         )
 
+    def get_llm_partition_key(
+        self,
+        model: str,
+        temperature: float,
+        context: str,
+        history: Sequence[str] = (),
+    ) -> str:
+        """Generate semantic LLM cache partition for a generation setup.
+
+        Responses only match queries made with the same model, temperature,
+        retrieved context and conversation history, so a paraphrase never
+        reuses an answer built from different sources or earlier turns.
+
+        Args:
+            model: Model name
+            temperature: Temperature setting
+            context: Context provided to LLM
+            history: Contents of the conversation messages sent with the query
+
+        Returns:
+            Partition name
+        """
+        return self.llm_cache._generate_key(
+            "llm",
+            model,
+            temperature,
+            xxhash.xxh3_128_hexdigest(context.encode()),
+            list(history),
+        )
+
     def clear_all(self) -> Dict[str, int]:
         """Clear all caches.
 
@@ -336,8 +715,10 @@ class CacheManager:
         """
         return {
             "vector_cache": self.vector_cache.clear(),
+            "semantic_vector_cache": self.semantic_vector_cache.clear(),
             "search_cache": self.search_cache.clear(),
             "llm_cache": self.llm_cache.clear(),
+            "semantic_llm_cache": self.semantic_llm_cache.clear(),
         }
 
     def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
@@ -348,8 +729,10 @@ class CacheManager:
         """
         return {
             "vector_cache": self.vector_cache.get_stats(),
+            "semantic_vector_cache": self.semantic_vector_cache.get_stats(),
             "search_cache": self.search_cache.get_stats(),
             "llm_cache": self.llm_cache.get_stats(),
+            "semantic_llm_cache": self.semantic_llm_cache.get_stats(),
         }
 
 
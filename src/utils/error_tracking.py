@@ -1,7 +1,7 @@
 """Comprehensive error tracking, categorization, and alerting."""
 
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Optional
@@ -50,8 +50,11 @@ class ErrorMetrics:
         self._error_counts: dict[str, int] = defaultdict(int)
         self._error_by_category: dict[ErrorCategory, int] = defaultdict(int)
         self._error_by_severity: dict[ErrorSeverity, int] = defaultdict(int)
-        self._recent_errors: list[dict[str, Any]] = []
         self._max_recent_errors = 100
+        # Bounded buffer: appends past the limit drop the oldest record
+        self._recent_errors: deque[dict[str, Any]] = deque(
+            maxlen=self._max_recent_errors
+        )
         self._start_time = datetime.now()
 
     def record_error(
@@ -85,10 +88,6 @@ class ErrorMetrics:
 
         self._recent_errors.append(error_record)
 
-        # Keep only recent errors
-        if len(self._recent_errors) > self._max_recent_errors:
-            self._recent_errors = self._recent_errors[-self._max_recent_errors :]
-
     def get_error_count(self, error_type: Optional[str] = None) -> int:
         """Get total error count or count for specific error type.
 
@@ -127,7 +126,7 @@ class ErrorMetrics:
         Returns:
             List of recent error records
         """
-        return self._recent_errors[-limit:]
+        return list(self._recent_errors)[-limit:]
 
     def get_error_rate(self, window_minutes: int = 5) -> float:
         """Calculate error rate over time window.
@@ -68,7 +68,7 @@ class CircuitBreaker:
         """Check if enough time has passed to attempt reset."""
         if self._last_failure_time is None:
             return False
-        return time.time() - self._last_failure_time >= self.recovery_timeout
+        return time.monotonic() - self._last_failure_time >= self.recovery_timeout
 
     def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Execute function with circuit breaker protection.
@@ -169,7 +169,7 @@ class CircuitBreaker:
     def _on_failure(self, func_name: str, error: Exception) -> None:
         """Handle failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
 
         logger.warning(
             "circuit_breaker_failure",
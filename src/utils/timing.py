@@ -27,7 +27,7 @@ def log_performance(
     Yields:
         None
     """
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     logger.debug(
         "operation_started",
@@ -38,7 +38,7 @@ def log_performance(
     try:
         yield
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         logger.info(
             "operation_completed",
@@ -48,7 +48,7 @@ def log_performance(
         )
 
     except Exception as e:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
         logger.error(
             "operation_failed",
@@ -82,7 +82,7 @@ class PerformanceTimer:
         """
         self.operation = operation
         self.context = context
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.last_checkpoint = self.start_time
         self.checkpoints: list[dict[str, Any]] = []
 
@@ -102,7 +102,7 @@ class PerformanceTimer:
         Returns:
             Duration in milliseconds since last checkpoint
         """
-        current_time = time.time()
+        current_time = time.perf_counter()
         duration_ms = (current_time - self.last_checkpoint) * 1000
 
         checkpoint_data = {
@@ -136,7 +136,7 @@ class PerformanceTimer:
         Returns:
             Total duration in milliseconds
         """
-        total_duration_ms = (time.time() - self.start_time) * 1000
+        total_duration_ms = (time.perf_counter() - self.start_time) * 1000
 
         log_method = logger.info if success else logger.error
 
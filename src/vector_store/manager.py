@@ -4,15 +4,19 @@ import asyncio
 import hashlib
 import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import structlog
 from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 from langchain_pinecone import PineconeVectorStore
 from pinecone import Pinecone, ServerlessSpec
-from tenacity import (retry, retry_if_exception_type, stop_after_attempt,
-                      wait_exponential)
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from src.config.settings import Settings
 from src.exceptions import VectorStoreError
@@ -25,6 +29,9 @@ OPTIMAL_EMBEDDING_BATCH_SIZE = 100  # OpenAI embeddings API optimal batch size
 OPTIMAL_UPSERT_BATCH_SIZE = 100  # Pinecone upsert optimal batch size
 MAX_PARALLEL_BATCHES = 3  # Maximum parallel batch operations
 
+# Query embedding coalescing: concurrent searches share one embeddings request
+EMBEDDING_COALESCE_MAX_BATCH = 32  # Maximum queries per embeddings request
+
 
 class VectorStoreManager:
     """Manages Pinecone vector store operations with LangChain integration.
@@ -36,7 +43,10 @@ class VectorStoreManager:
     - Document embedding and upsertion
     - Semantic search and retrieval
 
-    Uses langchain-pinecone for seamless LangChain integration.
+    Uses langchain-pinecone for seamless LangChain integration. The Pinecone
+    client and PineconeVectorStore are synchronous (``Index.query`` blocks on
+    HTTPS), so every call into them is offloaded with ``asyncio.to_thread``
+    to keep concurrent requests from stalling the event loop.
     """
 
     def __init__(self, config: Settings) -> None:
@@ -87,6 +97,11 @@ class VectorStoreManager:
 
         self._cache_manager = get_cache_manager()
 
+        # Query embedding coalescing state, bound to the running event loop
+        self._embed_batch: List[Tuple[str, asyncio.Future]] = []
+        self._embed_tasks: Set[asyncio.Task] = set()
+        self._embed_loop: Optional[asyncio.AbstractEventLoop] = None
+
         # Performance metrics
         self._query_count = 0
         self._cache_hits = 0
@@ -265,8 +280,8 @@ class VectorStoreManager:
                     "error": "Vector store not initialized",
                 }
 
-            # Get index stats
-            index = self.pc.Index(self.index_name)
+            # Get index stats (resolving the Index handle may hit the network)
+            index = await asyncio.to_thread(self.pc.Index, self.index_name)
             stats = await asyncio.to_thread(index.describe_index_stats)
 
             # Get index description
@@ -304,7 +319,7 @@ class VectorStoreManager:
             VectorStoreError: If stats retrieval fails
         """
         try:
-            index = self.pc.Index(self.index_name)
+            index = await asyncio.to_thread(self.pc.Index, self.index_name)
             stats = await asyncio.to_thread(index.describe_index_stats)
 
             stats_dict = {
@@ -642,6 +657,114 @@ class VectorStoreManager:
             self.logger.error("document_embedding_failed", error=str(e))
             raise VectorStoreError(f"Failed to embed documents: {e}") from e
 
+    async def _coalesced_embed(self, query: str) -> List[float]:
+        """Embed a query, batching it with other concurrent queries.
+
+        Queries submitted during the same event loop iteration are embedded
+        with a single embeddings API request, so K concurrent searches cost
+        one round trip instead of K. The batch is flushed on the next loop
+        iteration (or once it holds EMBEDDING_COALESCE_MAX_BATCH queries), so
+        a query on its own is not held back.
+
+        Args:
+            query: Query string to embed
+
+        Returns:
+            Embedding vector for the query
+        """
+        loop = asyncio.get_running_loop()
+        if self._embed_loop is not loop:
+            # Requests left on another event loop can never complete here
+            self._fail_pending_embeds(
+                VectorStoreError("Event loop changed while embedding queries")
+            )
+            self._embed_loop = loop
+
+        future: asyncio.Future = loop.create_future()
+        self._embed_batch.append((query, future))
+        if len(self._embed_batch) >= EMBEDDING_COALESCE_MAX_BATCH:
+            self._flush_embed_batch(loop)
+        elif len(self._embed_batch) == 1:
+            loop.call_soon(self._flush_embed_batch, loop)
+
+        return await future
+
+    def _flush_embed_batch(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start embedding the queries collected so far.
+
+        Args:
+            loop: Event loop the queued queries are waiting on
+        """
+        batch, self._embed_batch = self._embed_batch, []
+        if not batch:
+            return
+
+        task = loop.create_task(self._embed_query_batch(batch))
+        self._embed_tasks.add(task)
+        task.add_done_callback(self._embed_tasks.discard)
+
+    async def _embed_query_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed a batch of queries and resolve their futures.
+
+        A lone query goes through aembed_query. Larger batches use
+        aembed_documents, which is the request aembed_query makes for a
+        single text with OpenAIEmbeddings, so every query gets the same
+        embedding either way.
+
+        Args:
+            batch: (query, future) pairs to embed
+        """
+        queries = [query for query, _ in batch]
+        try:
+            if len(queries) == 1:
+                embeddings = [await self.embeddings.aembed_query(queries[0])]
+            else:
+                embeddings = await self.embeddings.aembed_documents(queries)
+            # A short or long response must not leave awaiters hanging
+            results = list(zip(batch, embeddings, strict=True))
+        except asyncio.CancelledError:
+            self._fail_embed_futures(
+                batch, VectorStoreError("Vector store closed while embedding queries")
+            )
+            raise
+        except Exception as e:
+            self._fail_embed_futures(batch, e)
+            return
+
+        self.logger.debug("query_embeddings_coalesced", batch_size=len(batch))
+
+        for (_, future), embedding in results:
+            if not future.done():
+                future.set_result(embedding)
+
+    @staticmethod
+    def _fail_embed_futures(
+        batch: List[Tuple[str, asyncio.Future]], error: BaseException
+    ) -> None:
+        """Fail the still-pending futures of an embedding batch.
+
+        Args:
+            batch: (query, future) pairs whose awaiters should stop waiting
+            error: Exception raised to each awaiter
+        """
+        for _, future in batch:
+            if not future.done() and not future.get_loop().is_closed():
+                future.set_exception(error)
+
+    def _fail_pending_embeds(self, error: BaseException) -> None:
+        """Fail queued query embeddings and cancel the in-flight ones.
+
+        Args:
+            error: Exception raised to callers still waiting on a queued query
+        """
+        batch, self._embed_batch = self._embed_batch, []
+        self._fail_embed_futures(batch, error)
+
+        for task in list(self._embed_tasks):
+            if not task.done() and not task.get_loop().is_closed():
+                task.cancel()
+        self._embed_tasks.clear()
+
     def _get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics for vector store operations.
 
@@ -677,8 +800,11 @@ class VectorStoreManager:
     ) -> List[Document]:
         """Perform semantic similarity search with optimized caching.
 
-        Uses PineconeVectorStore's similarity_search method with optional
-        metadata filtering and intelligent caching.
+        Uses PineconeVectorStore's similarity_search_by_vector method with
+        optional metadata filtering and intelligent caching. The query is
+        embedded through a coalescing batcher shared by concurrent searches,
+        and a semantically similar earlier query's results are reused when
+        the semantic vector cache is enabled.
 
         Args:
             query: Query string to search for
@@ -702,7 +828,7 @@ class VectorStoreManager:
         """
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Track query metrics
         self._query_count += 1
@@ -713,7 +839,7 @@ class VectorStoreManager:
             cached_docs = self._cache_manager.vector_cache.get(cache_key)
             if cached_docs is not None:
                 self._cache_hits += 1
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 self._total_query_time += elapsed
                 self.logger.debug(
                     "vector_search_cache_hit",
@@ -730,15 +856,36 @@ class VectorStoreManager:
                 has_filters=filters is not None,
             )
 
-            # Use PineconeVectorStore's similarity_search
+            # Embed via the coalescing batcher, then query Pinecone by vector
+            embedding = await self._coalesced_embed(query)
+
+            # A paraphrase of an earlier query can reuse its results (opt-in:
+            # near-duplicates such as year-swapped queries may cross the threshold)
+            use_semantic_cache = use_cache and self.config.semantic_vector_cache_enabled
+            if use_semantic_cache:
+                partition = self._cache_manager.get_vector_partition_key(k, filters)
+                cached_docs = self._cache_manager.semantic_vector_cache.get(
+                    partition, embedding
+                )
+                if cached_docs is not None:
+                    self._cache_hits += 1
+                    elapsed = time.perf_counter() - start_time
+                    self._total_query_time += elapsed
+                    self.logger.debug(
+                        "vector_search_semantic_cache_hit",
+                        query=query[:50],
+                        elapsed_ms=elapsed * 1000,
+                    )
+                    return cached_docs
+
             docs = await asyncio.to_thread(
-                self.vector_store.similarity_search,
-                query=query,
+                self.vector_store.similarity_search_by_vector,
+                embedding,
                 k=k,
                 filter=filters,
             )
 
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             self._total_query_time += elapsed
 
             self.logger.info(
@@ -751,6 +898,10 @@ class VectorStoreManager:
             if use_cache:
                 cache_key = self._cache_manager.get_vector_cache_key(query, k, filters)
                 self._cache_manager.vector_cache.set(cache_key, docs)
+            if use_semantic_cache:
+                self._cache_manager.semantic_vector_cache.set(
+                    partition, embedding, docs
+                )
 
             return docs
 
@@ -962,6 +1113,9 @@ class VectorStoreManager:
         stats = self.get_cache_stats()
         self.logger.info("final_performance_stats", **stats)
 
+        self._fail_pending_embeds(VectorStoreError("Vector store manager closed"))
+        self._embed_loop = None
+
         self._vector_store = None
         # Pinecone client doesn't require explicit cleanup
         self.logger.info("vector_store_manager_closed")
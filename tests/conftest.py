@@ -2,7 +2,8 @@
 
 This module provides reusable fixtures and utilities for testing the F1 Slipstream Agent.
 Fixtures are organized into categories:
-- Configuration: test_settings
+- Configuration: test_settings, live_settings
+- API Clients: client
 - Mock Factories: mock_openai_embeddings, mock_openai_chat, mock_pinecone_index, etc.
 - Test Data: sample_documents, sample_messages, sample_search_results, etc.
 - Utilities: Helper functions for creating test data
@@ -13,6 +14,8 @@ When to Use Each Fixture:
 - Use sample data fixtures (sample_*) for consistent test data across tests
 - Use utility functions (create_mock_*) when you need custom test data
 - Use test_settings for any test that needs configuration access
+- Mark tests that call real services with requires_live_api and use
+  live_settings; they are skipped at collection unless real keys are set
 
 Example Usage:
 --------------
@@ -34,14 +37,64 @@ Example Usage:
 """
 
 import os
-from typing import Any, AsyncGenerator, Dict, Generator, List, Optional
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Generator,
+    List,
+    Optional,
+)
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
+from httpx import ASGITransport, AsyncClient
 from langchain_core.documents import Document
 from langchain_core.messages import AIMessage, HumanMessage
 
 from src.config.settings import Settings
+from src.vector_store.manager import VectorStoreManager
+
+# Environment variable holding each live service's API key
+LIVE_API_KEY_ENV = {
+    "openai": "OPENAI_API_KEY",
+    "pinecone": "PINECONE_API_KEY",
+    "tavily": "TAVILY_API_KEY",
+}
+
+# Dummy keys used by test_settings, CI and .env.example
+PLACEHOLDER_KEY_PREFIXES = ("test", "sk-test", "your_")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip ``requires_live_api`` tests unless real API keys are configured.
+
+    ``@pytest.mark.requires_live_api("tavily")`` needs a real Tavily key; with
+    no arguments every service in LIVE_API_KEY_ENV is required. Keys that are
+    unset or start with a PLACEHOLDER_KEY_PREFIXES entry count as missing.
+    The decision is made once per test at collection instead of inside each
+    test body.
+    """
+    for item in items:
+        marker = item.get_closest_marker("requires_live_api")
+        if marker is None:
+            continue
+
+        services = marker.args or tuple(LIVE_API_KEY_ENV)
+        missing = [
+            service
+            for service in services
+            if os.environ.get(LIVE_API_KEY_ENV[service], "test").startswith(
+                PLACEHOLDER_KEY_PREFIXES
+            )
+        ]
+        if missing:
+            item.add_marker(
+                pytest.mark.skip(
+                    reason=f"Skipping live API test - no real {', '.join(missing)} key"
+                )
+            )
 
 
 @pytest.fixture
@@ -84,6 +137,24 @@ def test_settings() -> Generator[Settings, None, None]:
     get_settings.cache_clear()
 
 
+@pytest.fixture
+def live_settings() -> Settings:
+    """Provide settings loaded from the real environment.
+
+    When to use:
+        - Tests marked ``requires_live_api`` that call real services
+
+    Example:
+        >>> @pytest.mark.requires_live_api("tavily")
+        ... async def test_search(live_settings):
+        ...     client = TavilyClient(live_settings)
+
+    Returns:
+        Settings: Configuration built from the current environment
+    """
+    return Settings()
+
+
 # ============================================================================
 # Mock Factories for External APIs
 # ============================================================================
@@ -293,6 +364,9 @@ def mock_vector_store() -> Mock:
     without requiring a real Pinecone connection. Returns realistic
     F1-related documents with similarity scores.
 
+    The mock is specced on VectorStoreManager, so calling a method the real
+    manager does not have fails instead of returning a new Mock.
+
     When to use:
         - Testing RAG retrieval logic
         - Testing document addition workflows
@@ -312,7 +386,7 @@ def mock_vector_store() -> Mock:
         Mock: Mock vector store with similarity_search, add_documents,
               and similarity_search_with_score async methods
     """
-    mock = Mock()
+    mock = Mock(spec=VectorStoreManager)
     mock.similarity_search = AsyncMock(
         return_value=[
             Document(
@@ -494,6 +568,43 @@ def sample_agent_state() -> Dict[str, Any]:
     }
 
 
+# ============================================================================
+# API Test Clients
+# ============================================================================
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Provide an httpx client that talks to the FastAPI app over ASGI.
+
+    Requests go through the same ASGI stack (middleware, exception handlers)
+    as production, without a network socket or a sync shim. Swap in mocks
+    with ``app.dependency_overrides`` instead of building a new client.
+
+    The app lifespan (Pinecone, Tavily and agent graph startup) is not run.
+    This matches how the API tests have always used it.
+
+    When to use:
+        - Tests against API endpoints
+
+    Example:
+        >>> async def test_health(client):
+        ...     response = await client.get("/health")
+        ...     assert response.status_code == 200
+
+    Yields:
+        AsyncClient: Client bound to the application instance
+    """
+    # Imported lazily: building the app requires API settings to be present
+    from src.api.main import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as async_client:
+        yield async_client
+    app.dependency_overrides.clear()
+
+
 # ============================================================================
 # Async Test Utilities
 # ============================================================================
@@ -767,7 +878,7 @@ def assert_message_equal(msg1: Any, msg2: Any) -> None:
         >>> msg2 = HumanMessage(content="Hello")
         >>> assert_message_equal(msg1, msg2)  # Passes
     """
-    assert type(msg1) == type(msg2)
+    assert type(msg1) is type(msg2)
     assert msg1.content == msg2.content
 
 
@@ -811,87 +922,50 @@ def create_mock_embedding(dimension: int = 1536) -> List[float]:
     return [0.1] * dimension
 
 
-class MockStreamingResponse:
+async def mock_streaming_response(chunks: List[str]) -> AsyncIterator[str]:
     """Mock streaming response for testing async streaming functionality.
 
-    Use this class when testing code that processes streaming responses
+    Use this generator when testing code that processes streaming responses
     from LLMs or other async streaming sources.
 
+    Args:
+        chunks: List of response chunks to stream
+
+    Yields:
+        str: Each chunk in order
+
     Example:
         >>> async def test_streaming():
-        ...     stream = MockStreamingResponse(["Hello", " ", "world"])
+        ...     stream = mock_streaming_response(["Hello", " ", "world"])
         ...     chunks = [chunk async for chunk in stream]
         ...     assert chunks == ["Hello", " ", "world"]
     """
+    for chunk in chunks:
+        yield chunk
 
-    def __init__(self, chunks: List[str]):
-        """Initialize mock streaming response.
-
-        Args:
-            chunks: List of response chunks to stream
-        """
-        self.chunks = chunks
-        self.index = 0
-
-    def __aiter__(self):
-        """Return async iterator."""
-        return self
-
-    async def __anext__(self) -> str:
-        """Get next chunk.
 
-        Returns:
-            str: Next chunk
-
-        Raises:
-            StopAsyncIteration: When no more chunks available
-        """
-        if self.index >= len(self.chunks):
-            raise StopAsyncIteration
-
-        chunk = self.chunks[self.index]
-        self.index += 1
-        return chunk
-
-
-class AsyncMockIterator:
+async def async_mock_iterator(items: List[Any]) -> AsyncIterator[Any]:
     """Async iterator mock for testing async iteration patterns.
 
-    Use this class when testing code that iterates over async iterables
+    Use this generator when testing code that iterates over async iterables
     without requiring actual async data sources.
 
+    Args:
+        items: Items to iterate over
+
+    Yields:
+        Any: Each item in order
+
     Example:
         >>> async def test_async_iteration():
-        ...     iterator = AsyncMockIterator([1, 2, 3])
+        ...     iterator = async_mock_iterator([1, 2, 3])
         ...     items = [item async for item in iterator]
         ...     assert items == [1, 2, 3]
     """
+    for item in items:
+        yield item
 
-    def __init__(self, items: List[Any]):
-        """Initialize async iterator.
-
-        Args:
-            items: Items to iterate over
-        """
-        self.items = items
-        self.index = 0
-
-    def __aiter__(self):
-        """Return async iterator."""
-        return self
-
-    async def __anext__(self) -> Any:
-        """Get next item.
-
-        Returns:
-            Any: Next item
-
-        Raises:
-            StopAsyncIteration: When no more items available
-        """
-        if self.index >= len(self.items):
-            raise StopAsyncIteration
 
-        item = self.items[self.index]
-        self.index += 1
-        return item
+# Former class-based names, kept for existing callers
+MockStreamingResponse = mock_streaming_response
+AsyncMockIterator = async_mock_iterator
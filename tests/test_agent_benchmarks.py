@@ -0,0 +1,102 @@
+"""Micro-benchmarks for the agent's retrieval and query analysis steps.
+
+Tavily search and entity-based query analysis are timed with pytest-benchmark
+against mocked Tavily and OpenAI backends, so the numbers cover our own
+overhead (rate limiting, prompt formatting, intent detection), and
+regressions are judged against a saved baseline instead of a single
+wall-clock sample.
+
+The benchmarks are opt-in. Run them with::
+
+    pytest tests/test_agent_benchmarks.py -m benchmark --benchmark-only
+
+and compare against a saved baseline with
+``--benchmark-compare --benchmark-compare-fail=mean:10%``.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.agent.nodes import EntityExtraction, analyze_query_with_entities
+from src.config.settings import Settings
+from src.search.tavily_client import TavilyClient
+
+SEARCH_RESULTS = [
+    {
+        "title": "Latest F1 Race Results",
+        "url": "https://www.formula1.com/results",
+        "content": "Max Verstappen wins the Monaco Grand Prix",
+        "score": 0.9,
+    }
+]
+
+
+@pytest.fixture
+def event_loop_runner():
+    """Private event loop that synchronous benchmark rounds can drive."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def mock_tavily_client(test_settings: Settings) -> TavilyClient:
+    """Uncached Tavily client whose search tool is mocked."""
+    client = TavilyClient(
+        test_settings, rate_limit_requests=100_000, enable_cache=False
+    )
+    client._search_tool = MagicMock()
+    client._search_tool.ainvoke = AsyncMock(return_value=SEARCH_RESULTS)
+    return client
+
+
+@pytest.fixture
+def mock_analysis_llm() -> MagicMock:
+    """LLM whose structured entity extraction returns a fixed result."""
+    llm = MagicMock()
+    llm.with_structured_output.return_value.ainvoke = AsyncMock(
+        return_value=EntityExtraction(
+            drivers=["Max Verstappen"], races=["Monaco Grand Prix"], confidence=0.9
+        )
+    )
+    return llm
+
+
+@pytest.mark.benchmark(group="agent")
+class TestAgentBenchmarks:
+    """Per-call timings for agent retrieval and analysis steps."""
+
+    def test_tavily_search_latency(
+        self, benchmark, event_loop_runner, mock_tavily_client
+    ):
+        """Benchmark one uncached Tavily search through the client."""
+        results = benchmark.pedantic(
+            lambda: event_loop_runner(
+                mock_tavily_client.search("latest F1 race results", use_cache=False)
+            ),
+            rounds=50,
+            iterations=1,
+            warmup_rounds=5,
+        )
+
+        assert results == SEARCH_RESULTS
+
+    def test_query_analysis_latency(
+        self, benchmark, event_loop_runner, mock_analysis_llm
+    ):
+        """Benchmark entity extraction and intent detection for one query."""
+        intent, _, entities = benchmark.pedantic(
+            lambda: event_loop_runner(
+                analyze_query_with_entities(
+                    "What are the latest results from Monaco?", mock_analysis_llm
+                )
+            ),
+            rounds=50,
+            iterations=1,
+            warmup_rounds=5,
+        )
+
+        assert intent == "current_info"
+        assert entities.drivers == ["Max Verstappen"]
@@ -0,0 +1,37 @@
+"""Unit tests for agent node helpers."""
+
+import pytest
+
+from src.agent.nodes import EntityExtraction, _determine_intent_from_entities
+
+
+@pytest.mark.unit
+class TestIntentDetection:
+    """Tests for keyword and entity based intent detection."""
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("Who will win the next race?", "prediction"),
+            ("What are the LATEST standings?", "current_info"),
+            ("Who has the most wins ever?", "historical"),
+            ("Explain how DRS works", "technical"),
+            ("Who won at Monza?", "general"),
+            ("What is a good recipe for chocolate cake tonight", "technical"),
+            ("Give me a good recipe for chocolate cake tonight", "off_topic"),
+        ],
+    )
+    def test_intent_from_keywords(self, query, expected):
+        """Test intent is picked from the first matching keyword group."""
+        entities = EntityExtraction(confidence=0.9)
+
+        assert _determine_intent_from_entities(query, entities) == expected
+
+    def test_entities_override_keywords(self):
+        """Test extracted years and drivers steer intent without keywords."""
+        years = EntityExtraction(years=["2008"], confidence=0.9)
+        drivers = EntityExtraction(drivers=["Lewis Hamilton"], confidence=0.9)
+        query = "Give me a summary of how that season went for him"
+
+        assert _determine_intent_from_entities(query, years) == "historical"
+        assert _determine_intent_from_entities(query, drivers) == "general"
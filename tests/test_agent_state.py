@@ -0,0 +1,137 @@
+"""Unit tests for agent state models."""
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.agent.state import ConversationContext
+
+
+@pytest.mark.unit
+class TestConversationContext:
+    """Tests for conversation history windowing."""
+
+    def test_sliding_window_keeps_system_and_recent_turns(self):
+        """Test old turns are dropped while system messages are kept."""
+        context = ConversationContext(session_id="s", max_history=10)
+        context.add_message(SystemMessage(content="persona"))
+        for i in range(25):
+            context.add_message(HumanMessage(content=f"q{i}"))
+            context.add_message(AIMessage(content=f"a{i}"))
+
+        assert len(context.messages) == 1 + 20
+        assert context.messages[0].content == "persona"
+        assert context.messages[1].content == "q15"
+        assert context.messages[-1].content == "a24"
+
+    def test_late_system_message_joins_leading_block(self):
+        """Test system messages added mid-conversation are kept up front."""
+        context = ConversationContext(session_id="s", max_history=1)
+        context.add_message(SystemMessage(content="persona"))
+        context.add_message(HumanMessage(content="q0"))
+        context.add_message(SystemMessage(content="summary"))
+        context.add_message(AIMessage(content="a0"))
+        context.add_message(HumanMessage(content="q1"))
+
+        assert [m.content for m in context.messages] == [
+            "persona",
+            "summary",
+            "a0",
+            "q1",
+        ]
+
+    def test_late_system_message_keeps_position_until_trim(self):
+        """Test a mid-conversation system message is not reordered early."""
+        context = ConversationContext(session_id="s", max_history=10)
+        context.add_message(HumanMessage(content="q0"))
+        context.add_message(AIMessage(content="a0"))
+        context.add_message(SystemMessage(content="summary"))
+
+        assert [m.content for m in context.messages] == ["q0", "a0", "summary"]
+
+    def test_imported_history_keeps_system_message_on_trim(self):
+        """Test a system message after the first turn survives the window."""
+        context = ConversationContext(
+            session_id="s",
+            max_history=1,
+            messages=[
+                HumanMessage(content="q0"),
+                SystemMessage(content="persona"),
+                AIMessage(content="a0"),
+            ],
+        )
+        context.add_message(HumanMessage(content="q1"))
+
+        assert [m.content for m in context.messages] == ["persona", "a0", "q1"]
+        assert [m.content for m in context.get_recent_messages(count=1)] == [
+            "persona",
+            "a0",
+            "q1",
+        ]
+
+    def test_get_recent_messages(self):
+        """Test recent turns are returned after the system messages."""
+        context = ConversationContext(session_id="s", max_history=10)
+        context.add_message(SystemMessage(content="persona"))
+        for i in range(5):
+            context.add_message(HumanMessage(content=f"q{i}"))
+            context.add_message(AIMessage(content=f"a{i}"))
+
+        recent = context.get_recent_messages(count=2)
+
+        assert [m.content for m in recent] == ["persona", "q3", "a3", "q4", "a4"]
+
+    def test_token_budget_eviction(self, monkeypatch):
+        """Test oldest turns are evicted once history exceeds the token budget."""
+        counted = []
+
+        def count_words(message):
+            counted.append(message)
+            return len(message.content.split())
+
+        monkeypatch.setattr("src.agent.state.count_message_tokens", count_words)
+        context = ConversationContext(session_id="s", max_history=50, token_budget=4096)
+        context.add_message(SystemMessage(content="persona " * 300))
+        for i in range(10):
+            context.add_message(HumanMessage(content="word " * 250))
+            context.add_message(AIMessage(content="word " * 250))
+
+        turn_tokens = [count_words(m) for m in context.messages[1:]]
+        assert sum(turn_tokens) <= 4096
+        assert len(turn_tokens) == 16
+        assert context.messages[0].type == "system"
+        # Each message was tokenized once when added
+        assert len(counted) == 20 + 16
+
+    def test_token_budget_keeps_newest_message(self, monkeypatch):
+        """Test a single oversized message is kept rather than emptying history."""
+        monkeypatch.setattr(
+            "src.agent.state.count_message_tokens",
+            lambda message: len(message.content.split()),
+        )
+        context = ConversationContext(session_id="s", token_budget=10)
+        context.add_message(HumanMessage(content="short question"))
+        context.add_message(AIMessage(content="word " * 50))
+
+        assert [m.type for m in context.messages] == ["ai"]
+
+    def test_token_budget_counts_repeated_message_each_time(self, monkeypatch):
+        """Test a message object added twice is counted at both positions."""
+        monkeypatch.setattr(
+            "src.agent.state.count_message_tokens",
+            lambda message: len(message.content.split()),
+        )
+        context = ConversationContext(session_id="s", max_history=50, token_budget=2)
+        repeated = HumanMessage(content="again")
+        context.add_message(repeated)
+        context.add_message(repeated)
+        context.add_message(AIMessage(content="y"))
+        context.add_message(HumanMessage(content="x"))
+
+        assert [m.content for m in context.messages] == ["y", "x"]
+
+        context = ConversationContext(session_id="s", max_history=50, token_budget=10)
+        five_words = HumanMessage(content="one two three four five")
+        for _ in range(3):
+            context.add_message(five_words)
+
+        assert context.messages == [five_words, five_words]
@@ -0,0 +1,43 @@
+"""Micro-benchmarks for API request handling.
+
+Single-request latency is tracked with pytest-benchmark instead of a fixed
+wall-clock threshold, so regressions are judged against saved runs rather
+than a hard-coded budget.
+
+The benchmarks are opt-in. Run them with::
+
+    pytest tests/test_api_benchmarks.py -m benchmark --benchmark-only
+"""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+
+@pytest.fixture
+def loop_client():
+    """AsyncClient bound to a private event loop that benchmarks can drive."""
+    # Imported lazily: building the app requires API settings to be present
+    from src.api.main import app
+
+    loop = asyncio.new_event_loop()
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    yield loop, client
+
+    loop.run_until_complete(client.aclose())
+    loop.close()
+
+
+@pytest.mark.benchmark(group="api")
+class TestAPIBenchmarks:
+    """Per-request timings for API endpoints."""
+
+    def test_health_endpoint_response_time(self, benchmark, loop_client):
+        """Benchmark a single health check request through the ASGI stack."""
+        loop, client = loop_client
+
+        response = benchmark(lambda: loop.run_until_complete(client.get("/health")))
+
+        assert response.status_code == 200
@@ -13,21 +13,14 @@ from src.config.settings import Settings
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api
 class TestUserConversationFlows:
     """End-to-end tests for user conversation flows."""
 
     @pytest.fixture
-    async def agent(self, test_settings: Settings):
+    async def agent(self, live_settings: Settings):
         """Create agent for E2E testing."""
-        # Skip if no real API keys
-        if (
-            test_settings.openai_api_key.startswith("test-")
-            or test_settings.pinecone_api_key.startswith("test-")
-            or test_settings.tavily_api_key.startswith("test-")
-        ):
-            pytest.skip("Skipping E2E test - no real API keys")
-
-        graph = F1AgentGraph(test_settings)
+        graph = F1AgentGraph(live_settings)
         await graph.initialize()
         return graph
 
@@ -185,20 +178,14 @@ class TestUserConversationFlows:
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api
 class TestPredictionWorkflow:
     """End-to-end tests for prediction generation workflow."""
 
     @pytest.fixture
-    async def agent(self, test_settings: Settings):
+    async def agent(self, live_settings: Settings):
         """Create agent for E2E testing."""
-        if (
-            test_settings.openai_api_key.startswith("test-")
-            or test_settings.pinecone_api_key.startswith("test-")
-            or test_settings.tavily_api_key.startswith("test-")
-        ):
-            pytest.skip("Skipping E2E test - no real API keys")
-
-        graph = F1AgentGraph(test_settings)
+        graph = F1AgentGraph(live_settings)
         await graph.initialize()
         return graph
 
@@ -260,20 +247,14 @@ class TestPredictionWorkflow:
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api
 class TestErrorScenarios:
     """End-to-end tests for error scenarios and recovery."""
 
     @pytest.fixture
-    async def agent(self, test_settings: Settings):
+    async def agent(self, live_settings: Settings):
         """Create agent for E2E testing."""
-        if (
-            test_settings.openai_api_key.startswith("test-")
-            or test_settings.pinecone_api_key.startswith("test-")
-            or test_settings.tavily_api_key.startswith("test-")
-        ):
-            pytest.skip("Skipping E2E test - no real API keys")
-
-        graph = F1AgentGraph(test_settings)
+        graph = F1AgentGraph(live_settings)
         await graph.initialize()
         return graph
 
@@ -364,20 +345,14 @@ class TestErrorScenarios:
 
 @pytest.mark.e2e
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api
 class TestComplexConversations:
     """End-to-end tests for complex conversation scenarios."""
 
     @pytest.fixture
-    async def agent(self, test_settings: Settings):
+    async def agent(self, live_settings: Settings):
         """Create agent for E2E testing."""
-        if (
-            test_settings.openai_api_key.startswith("test-")
-            or test_settings.pinecone_api_key.startswith("test-")
-            or test_settings.tavily_api_key.startswith("test-")
-        ):
-            pytest.skip("Skipping E2E test - no real API keys")
-
-        graph = F1AgentGraph(test_settings)
+        graph = F1AgentGraph(live_settings)
         await graph.initialize()
         return graph
 
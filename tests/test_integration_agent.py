@@ -4,33 +4,39 @@ These tests require actual API credentials and test the complete agent workflow.
 """
 
 import pytest
+import pytest_asyncio
 from langchain_core.messages import HumanMessage
 
 from src.agent.graph import F1AgentGraph
 from src.agent.state import AgentState
 from src.config.settings import Settings
+from src.search.tavily_client import TavilyClient
+from src.vector_store.manager import VectorStoreManager
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def agent_graph():
+    """Create one compiled agent graph shared by all tests in the session.
+
+    Client handshakes and graph compilation are paid once; each test still
+    builds its own AgentState, so no conversation state leaks between tests.
+    Only requested by tests marked ``requires_live_api``, so real keys are set.
+    """
+    settings = Settings()
+    vector_store = VectorStoreManager(settings)
+    await vector_store.initialize()
+
+    graph = F1AgentGraph(settings, vector_store, TavilyClient(settings))
+    graph.compile()
+    return graph
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.requires_live_api
 class TestAgentGraphIntegration:
     """Integration tests for F1AgentGraph."""
 
-    @pytest.fixture
-    async def agent_graph(self, test_settings: Settings):
-        """Create agent graph for testing."""
-        # Skip if no real API keys
-        if (
-            test_settings.openai_api_key.startswith("test-")
-            or test_settings.pinecone_api_key.startswith("test-")
-            or test_settings.tavily_api_key.startswith("test-")
-        ):
-            pytest.skip("Skipping integration test - no real API keys")
-
-        graph = F1AgentGraph(test_settings)
-        await graph.initialize()
-        return graph
-
     async def test_agent_initialization(self, agent_graph: F1AgentGraph):
         """Test agent can be initialized."""
         assert agent_graph is not None
@@ -121,11 +127,9 @@ class TestAgentGraphIntegration:
 class TestAgentTools:
     """Integration tests for agent tools."""
 
-    async def test_search_current_f1_data_tool(self, test_settings: Settings):
+    @pytest.mark.requires_live_api("tavily")
+    async def test_search_current_f1_data_tool(self):
         """Test search_current_f1_data tool."""
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
         from src.tools.f1_tools import search_current_f1_data
 
         result = await search_current_f1_data("latest F1 race results")
@@ -134,11 +138,9 @@ class TestAgentTools:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    async def test_query_f1_history_tool(self, test_settings: Settings):
+    @pytest.mark.requires_live_api("pinecone")
+    async def test_query_f1_history_tool(self):
         """Test query_f1_history tool."""
-        if test_settings.pinecone_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Pinecone API key")
-
         from src.tools.f1_tools import query_f1_history
 
         result = await query_f1_history("Lewis Hamilton championships")
@@ -148,18 +150,13 @@ class TestAgentTools:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.requires_live_api
 class TestAgentErrorHandling:
     """Integration tests for agent error handling."""
 
-    async def test_invalid_query_handling(self, test_settings: Settings):
+    async def test_invalid_query_handling(self, agent_graph: F1AgentGraph):
         """Test handling of invalid queries."""
-        if test_settings.openai_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real OpenAI API key")
-
-        graph = F1AgentGraph(test_settings)
-        await graph.initialize()
-
         # Empty query
         state: AgentState = {
             "messages": [HumanMessage(content="")],
@@ -175,20 +172,14 @@ class TestAgentErrorHandling:
 
         # Should handle gracefully
         try:
-            result = await graph.run(state)
+            result = await agent_graph.run(state)
             assert result is not None
         except Exception as e:
             # Should raise appropriate error
             assert isinstance(e, (ValueError, TypeError))
 
-    async def test_off_topic_query_handling(self, test_settings: Settings):
+    async def test_off_topic_query_handling(self, agent_graph: F1AgentGraph):
         """Test handling of off-topic queries."""
-        if test_settings.openai_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real OpenAI API key")
-
-        graph = F1AgentGraph(test_settings)
-        await graph.initialize()
-
         # Off-topic query
         state: AgentState = {
             "messages": [HumanMessage(content="What is the weather in Paris?")],
@@ -202,7 +193,7 @@ class TestAgentErrorHandling:
             "metadata": {},
         }
 
-        result = await graph.run(state)
+        result = await agent_graph.run(state)
 
         # Should redirect to F1 topics
         assert result is not None
@@ -211,20 +202,16 @@ class TestAgentErrorHandling:
 
 
 @pytest.mark.integration
-@pytest.mark.asyncio
+@pytest.mark.benchmark
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.requires_live_api
 class TestAgentPerformance:
     """Integration tests for agent performance."""
 
-    async def test_query_response_time(self, test_settings: Settings):
+    async def test_query_response_time(self, agent_graph: F1AgentGraph):
         """Test agent response time."""
-        if test_settings.openai_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real OpenAI API key")
-
         import time
 
-        graph = F1AgentGraph(test_settings)
-        await graph.initialize()
-
         state: AgentState = {
             "messages": [HumanMessage(content="Who is Lewis Hamilton?")],
             "query": "Who is Lewis Hamilton?",
@@ -237,13 +224,13 @@ class TestAgentPerformance:
             "metadata": {},
         }
 
-        start = time.time()
-        result = await graph.run(state)
-        elapsed = time.time() - start
+        start = time.perf_counter_ns()
+        result = await agent_graph.run(state)
+        elapsed_ns = time.perf_counter_ns() - start
 
         assert result is not None
         # Should respond within reasonable time (< 10 seconds)
-        assert elapsed < 10.0
+        assert elapsed_ns < 10_000_000_000
 
 
 if __name__ == "__main__":
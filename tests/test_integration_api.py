@@ -3,11 +3,18 @@
 These tests start the FastAPI application and test endpoints end-to-end.
 """
 
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from pydantic import ValidationError
 
-from src.api.main import app
+from src.api.main import app_state, run_chat_graph, stream_chat_graph
+from src.api.routes import chat as chat_routes
+from src.api.routes.chat import ChatRequest
 from src.config.settings import Settings
 
 
@@ -15,14 +22,9 @@ from src.config.settings import Settings
 class TestAPIEndpoints:
     """Integration tests for API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_health_endpoint(self, client: TestClient):
+    async def test_health_endpoint(self, client: AsyncClient):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -30,9 +32,9 @@ class TestAPIEndpoints:
         assert "status" in data
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
 
-    def test_health_endpoint_structure(self, client: TestClient):
+    async def test_health_endpoint_structure(self, client: AsyncClient):
         """Test health endpoint response structure."""
-        response = client.get("/health")
+        response = await client.get("/health")
         data = response.json()
 
         # Should contain service status
@@ -42,18 +44,18 @@ class TestAPIEndpoints:
             # Check individual service statuses
             assert isinstance(data["services"], dict)
 
-    def test_root_endpoint(self, client: TestClient):
+    async def test_root_endpoint(self, client: AsyncClient):
         """Test root endpoint."""
-        response = client.get("/")
+        response = await client.get("/")
 
         assert response.status_code == 200
         data = response.json()
 
         assert "message" in data or "name" in data
 
-    def test_cors_headers(self, client: TestClient):
+    async def test_cors_headers(self, client: AsyncClient):
         """Test CORS headers are present."""
-        response = client.options("/health")
+        response = await client.options("/health")
 
         # Should have CORS headers
         assert (
@@ -67,32 +69,35 @@ class TestAPIEndpoints:
 class TestChatEndpoints:
     """Integration tests for chat endpoints."""
 
-    @pytest.fixture
-    async def async_client(self):
-        """Create async test client."""
-        async with AsyncClient(app=app, base_url="http://test") as client:
-            yield client
-
-    async def test_chat_endpoint_exists(self, async_client: AsyncClient):
+    async def test_chat_endpoint_exists(self, client: AsyncClient):
         """Test chat endpoint exists."""
-        response = await async_client.post(
+        response = await client.post(
             "/chat", json={"message": "Who won the 2021 F1 championship?"}
         )
 
         # Should not return 404
         assert response.status_code != 404
 
-    async def test_chat_endpoint_validation(self, async_client: AsyncClient):
-        """Test chat endpoint input validation."""
-        # Test with empty message
-        response = await async_client.post("/chat", json={"message": ""})
-
-        # Should return validation error
-        assert response.status_code in [400, 422]
-
-    async def test_chat_endpoint_with_session(self, async_client: AsyncClient):
+    @pytest.mark.parametrize(
+        "body,is_valid",
+        [
+            ({"message": "Who won the 2021 F1 championship?"}, True),
+            ({"message": ""}, False),
+            ({"message": "x" * 2001}, False),
+            ({}, False),
+        ],
+    )
+    async def test_chat_endpoint_validation(self, body: dict, is_valid: bool):
+        """Test chat request validation without going through the ASGI stack."""
+        if is_valid:
+            assert ChatRequest(**body).message == body["message"]
+        else:
+            with pytest.raises(ValidationError):
+                ChatRequest(**body)
+
+    async def test_chat_endpoint_with_session(self, client: AsyncClient):
         """Test chat endpoint with session ID."""
-        response = await async_client.post(
+        response = await client.post(
             "/chat",
             json={"message": "Tell me about F1", "session_id": "test-session-123"},
         )
@@ -100,26 +105,135 @@ class TestChatEndpoints:
         # Should accept session ID
         assert response.status_code in [200, 201, 404, 500]  # Various valid responses
 
+    async def test_session_graph_cached_only_for_client_sessions(self, monkeypatch):
+        """Test one-off sessions do not accumulate compiled graphs."""
+        monkeypatch.setattr(chat_routes, "session_graphs", {})
+        monkeypatch.setattr(chat_routes, "session_storage", {})
+        agent_graph = MagicMock()
+        agent_graph.graph.compile.side_effect = lambda checkpointer: object()
+
+        client_graph = chat_routes.get_session_graph("client", agent_graph)
+        chat_routes.get_session_graph("session_req1", agent_graph, cache=False)
+
+        assert chat_routes.get_session_graph("client", agent_graph) is client_graph
+        assert list(chat_routes.session_graphs) == ["client"]
+
+
+@pytest.mark.integration
+class TestChatConcurrency:
+    """Integration tests for the bounded chat run slots."""
+
+    @pytest.mark.asyncio
+    async def test_chat_runs_bounded_by_semaphore(self, monkeypatch):
+        """Test graph runs proceed concurrently up to the configured bound."""
+        in_flight = 0
+        max_in_flight = 0
+
+        class FakeGraph:
+            async def ainvoke(self, state, config=None):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"response": state["query"]}
+
+        monkeypatch.setitem(app_state, "chat_semaphore", asyncio.Semaphore(2))
+
+        results = await asyncio.gather(
+            *[run_chat_graph(FakeGraph(), {"query": str(i)}, {}) for i in range(5)]
+        )
+
+        assert [r["response"] for r in results] == [str(i) for i in range(5)]
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_chat_run_times_out_and_frees_slot(self, monkeypatch):
+        """Test a hung graph run times out without holding its slot."""
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setitem(app_state, "chat_semaphore", semaphore)
+        monkeypatch.setattr(
+            "src.api.main.get_settings",
+            lambda: Settings(
+                openai_api_key="test",
+                pinecone_api_key="test",
+                tavily_api_key="test",
+                api_chat_timeout=1.0,
+            ),
+        )
+
+        class HungGraph:
+            async def ainvoke(self, state, config=None):
+                await asyncio.sleep(60)
+
+        with pytest.raises(TimeoutError):
+            await run_chat_graph(HungGraph(), {"query": "q"}, {})
+
+        assert not semaphore.locked()
+
+    @pytest.mark.asyncio
+    async def test_stream_slot_released_before_client_reads(self, monkeypatch):
+        """Test a slow stream reader does not hold a slot after the run ends."""
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setitem(app_state, "chat_semaphore", semaphore)
+
+        class FakeGraph:
+            async def astream_events(self, state, config=None, version=None):
+                for name in ("analyze", "generate"):
+                    yield {"event": "on_chain_start", "name": name}
+
+        stream = stream_chat_graph(FakeGraph(), {"query": "q"}, {})
+        first = await anext(stream)
+        # Let the producer finish while the reader is paused
+        await asyncio.sleep(0.01)
+
+        assert first["name"] == "analyze"
+        assert not semaphore.locked()
+        assert [event["name"] async for event in stream] == ["generate"]
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_raised_to_reader(self, monkeypatch):
+        """Test a hung stream surfaces TimeoutError to the reader."""
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setitem(app_state, "chat_semaphore", semaphore)
+        monkeypatch.setattr(
+            "src.api.main.get_settings",
+            lambda: Settings(
+                openai_api_key="test",
+                pinecone_api_key="test",
+                tavily_api_key="test",
+                api_chat_timeout=1.0,
+            ),
+        )
+
+        class HungGraph:
+            async def astream_events(self, state, config=None, version=None):
+                yield {"event": "on_chain_start", "name": "analyze"}
+                await asyncio.sleep(60)
+
+        events = []
+        with pytest.raises(TimeoutError):
+            async for event in stream_chat_graph(HungGraph(), {"query": "q"}, {}):
+                events.append(event)
+
+        assert len(events) == 1
+        assert not semaphore.locked()
+
 
 @pytest.mark.integration
 class TestAdminEndpoints:
     """Integration tests for admin endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_stats_endpoint_exists(self, client: TestClient):
+    async def test_stats_endpoint_exists(self, client: AsyncClient):
         """Test stats endpoint exists."""
-        response = client.get("/stats")
+        response = await client.get("/stats")
 
         # Should not return 404
         assert response.status_code != 404
 
-    def test_ingest_endpoint_exists(self, client: TestClient):
+    async def test_ingest_endpoint_exists(self, client: AsyncClient):
         """Test ingest endpoint exists."""
-        response = client.post("/ingest", json={})
+        response = await client.post("/ingest", json={})
 
         # Should not return 404 (might return 400 or 401 for auth)
         assert response.status_code != 404
@@ -129,29 +243,24 @@ class TestAdminEndpoints:
 class TestAPIErrorHandling:
     """Integration tests for API error handling."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_invalid_endpoint(self, client: TestClient):
+    async def test_invalid_endpoint(self, client: AsyncClient):
         """Test accessing invalid endpoint."""
-        response = client.get("/nonexistent")
+        response = await client.get("/nonexistent")
 
         assert response.status_code == 404
 
-    def test_invalid_method(self, client: TestClient):
+    async def test_invalid_method(self, client: AsyncClient):
         """Test using invalid HTTP method."""
-        response = client.delete("/health")
+        response = await client.delete("/health")
 
         # Should return method not allowed
         assert response.status_code in [404, 405]
 
-    def test_malformed_json(self, client: TestClient):
+    async def test_malformed_json(self, client: AsyncClient):
         """Test sending malformed JSON."""
-        response = client.post(
+        response = await client.post(
             "/chat",
-            data="{ invalid json }",
+            content="{ invalid json }",
             headers={"Content-Type": "application/json"},
         )
 
@@ -163,62 +272,50 @@ class TestAPIErrorHandling:
 class TestAPIPerformance:
     """Integration tests for API performance."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [10, 50, 200])
+    async def test_concurrent_health_checks(
+        self, client: AsyncClient, concurrency: int
+    ):
+        """Test handling concurrent requests on a single event loop."""
+        latencies = []
 
-    def test_health_endpoint_response_time(self, client: TestClient):
-        """Test health endpoint responds quickly."""
-        import time
+        async def make_request():
+            start = time.perf_counter()
+            response = await client.get("/health")
+            latencies.append(time.perf_counter() - start)
+            return response
 
-        start = time.time()
-        response = client.get("/health")
-        elapsed = time.time() - start
-
-        assert response.status_code == 200
-        # Health check should be fast (< 1 second)
-        assert elapsed < 1.0
-
-    def test_concurrent_health_checks(self, client: TestClient):
-        """Test handling concurrent requests."""
-        import concurrent.futures
-
-        def make_request():
-            return client.get("/health")
-
-        # Make 10 concurrent requests
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(make_request) for _ in range(10)]
-            results = [f.result() for f in futures]
+        results = await asyncio.gather(*[make_request() for _ in range(concurrency)])
 
         # All should succeed
         assert all(r.status_code == 200 for r in results)
 
+        # p99 latency stays bounded, catching event-loop starvation
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        assert p99 < 5.0
+
 
 @pytest.mark.integration
 class TestAPIDocumentation:
     """Integration tests for API documentation."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_openapi_schema(self, client: TestClient):
+    async def test_openapi_schema(self, client: AsyncClient):
         """Test OpenAPI schema is available."""
-        response = client.get("/openapi.json")
+        response = await client.get("/openapi.json")
 
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
 
         assert "openapi" in data
         assert "info" in data
         assert "paths" in data
 
-    def test_docs_endpoint(self, client: TestClient):
+    async def test_docs_endpoint(self, client: AsyncClient):
         """Test Swagger docs endpoint."""
-        response = client.get("/docs")
+        response = await client.get("/docs")
 
         assert response.status_code == 200
         assert "text/html" in response.headers.get("content-type", "")
@@ -8,18 +8,22 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import AIMessage, HumanMessage
+from langchain_pinecone import PineconeVectorStore
 
 from src.agent.graph import F1AgentGraph
 from src.agent.state import create_initial_state
 from src.config.settings import Settings
+from src.exceptions import VectorStoreError
 from src.search.tavily_client import TavilyClient
+from src.tools import f1_tools
 from src.tools.f1_tools import initialize_tools
-from src.utils.cache import CacheManager, get_cache_manager
-from src.vector_store.manager import VectorStoreManager
+from src.utils.cache import CacheManager, SemanticTTLCache, get_cache_manager
+from src.vector_store.manager import OPTIMAL_UPSERT_BATCH_SIZE, VectorStoreManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_settings():
     """Create mock settings for testing."""
     return Settings(
@@ -31,13 +35,16 @@ def mock_settings():
         pinecone_environment="test",
         pinecone_index_name="test-index",
         tavily_api_key="test-key",
-        environment="test",
+        environment="development",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_vector_store(mock_settings):
-    """Create mock vector store."""
+    """Create mock vector store shared by the module.
+
+    Tests that inspect calls on ``_vector_store`` reset it first.
+    """
     with patch("src.vector_store.manager.Pinecone"):
         with patch("src.vector_store.manager.OpenAIEmbeddings"):
             vector_store = VectorStoreManager(mock_settings)
@@ -45,12 +52,31 @@ def mock_vector_store(mock_settings):
             return vector_store
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_tavily_client(mock_settings):
     """Create mock Tavily client."""
     return TavilyClient(mock_settings, enable_cache=True)
 
 
+def _make_overlap_probe(expected: int):
+    """Return a coroutine factory that only completes once all calls overlap.
+
+    Each call waits until ``expected`` calls have started, so calls made one
+    after another time out instead of finishing.
+    """
+    started = []
+    all_started = asyncio.Event()
+
+    async def probe(result):
+        started.append(result)
+        if len(started) == expected:
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), timeout=1.0)
+        return result
+
+    return probe
+
+
 @pytest.mark.asyncio
 async def test_tools_initialization(
     mock_settings, mock_vector_store, mock_tavily_client
@@ -60,8 +86,11 @@ async def test_tools_initialization(
     initialize_tools(mock_settings, mock_vector_store, mock_tavily_client)
 
     # Import tools to verify they're accessible
-    from src.tools.f1_tools import (_tavily_client, _vector_store_manager,
-                                    search_current_f1_data)
+    from src.tools.f1_tools import (
+        _tavily_client,
+        _vector_store_manager,
+        search_current_f1_data,
+    )
 
     assert _tavily_client is not None
     assert _vector_store_manager is not None
@@ -92,6 +121,49 @@ async def test_agent_graph_initialization(
     assert agent.compiled_graph is not None
 
 
+@pytest.mark.asyncio
+async def test_parallel_retrieval_runs_sources_concurrently(
+    mock_settings, mock_vector_store, mock_tavily_client, monkeypatch
+):
+    """Test the "both" route searches the vector store and Tavily together."""
+    agent = F1AgentGraph(mock_settings, mock_vector_store, mock_tavily_client)
+    probe = _make_overlap_probe(expected=2)
+
+    async def vector_search(state):
+        return await probe({"retrieved_docs": [{"content": "doc"}], "metadata": {}})
+
+    async def tavily_search(state):
+        return await probe({"search_results": [{"content": "result"}], "metadata": {}})
+
+    monkeypatch.setattr(agent, "vector_search_node", vector_search)
+    monkeypatch.setattr(agent, "tavily_search_node", tavily_search)
+
+    result = await agent.parallel_retrieval_node(create_initial_state("test"))
+
+    assert result["retrieved_docs"] == [{"content": "doc"}]
+    assert result["search_results"] == [{"content": "result"}]
+    assert "vector_search_error" not in result["metadata"]
+    assert "tavily_search_error" not in result["metadata"]
+
+
+@pytest.mark.asyncio
+async def test_prediction_searches_run_concurrently(monkeypatch):
+    """Test a prediction's Tavily lookups are issued together."""
+    factors = ["driver_form", "weather", "qualifying"]
+    probe = _make_overlap_probe(expected=len(factors))
+
+    async def safe_search(query, **kwargs):
+        return await probe(([{"content": query}], None))
+
+    client = MagicMock()
+    client.safe_search = safe_search
+    monkeypatch.setattr(f1_tools, "_tavily_client", client)
+
+    current = await f1_tools._gather_current_data("Monaco", 2024, factors)
+
+    assert len(current) == len(factors)
+
+
 @pytest.mark.asyncio
 async def test_cache_manager_initialization():
     """Test that cache manager initializes correctly."""
@@ -137,32 +209,39 @@ async def test_tavily_client_with_cache(mock_settings):
         }
     ]
 
-    with patch.object(client, "search_tool") as mock_tool:
-        mock_tool.ainvoke = AsyncMock(return_value=mock_results)
+    mock_tool = MagicMock()
+    mock_tool.ainvoke = AsyncMock(return_value=mock_results)
+    client._search_tool = mock_tool
 
-        # First call should hit the API
-        results1 = await client.search("test query", use_cache=True)
-        assert len(results1) == 1
-        assert mock_tool.ainvoke.call_count == 1
+    # First call should hit the API
+    results1 = await client.search("test query", use_cache=True)
+    assert len(results1) == 1
+    assert mock_tool.ainvoke.call_count == 1
 
-        # Second call should use cache
-        results2 = await client.search("test query", use_cache=True)
-        assert len(results2) == 1
-        assert mock_tool.ainvoke.call_count == 1  # Still 1, not 2
+    # Second call should use cache
+    results2 = await client.search("test query", use_cache=True)
+    assert len(results2) == 1
+    assert mock_tool.ainvoke.call_count == 1  # Still 1, not 2
 
 
 @pytest.mark.asyncio
 async def test_vector_store_with_cache(mock_settings, mock_vector_store):
     """Test vector store caching functionality."""
+    mock_vector_store._vector_store.reset_mock()
+
     # Mock similarity search
     mock_docs = [
         Document(page_content="Test doc 1", metadata={"source": "test"}),
         Document(page_content="Test doc 2", metadata={"source": "test"}),
     ]
 
-    mock_vector_store._vector_store.similarity_search = MagicMock(
+    mock_vector_store._vector_store.similarity_search_by_vector = MagicMock(
         return_value=mock_docs
     )
+    mock_vector_store.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+    )
+    mock_vector_store.embeddings.aembed_query = AsyncMock(return_value=[0.1] * 1536)
 
     # First call
     results1 = await mock_vector_store.similarity_search("test query", use_cache=True)
@@ -173,7 +252,161 @@ async def test_vector_store_with_cache(mock_settings, mock_vector_store):
     assert len(results2) == 2
 
     # Verify cache was used (only one actual call to vector store)
-    assert mock_vector_store._vector_store.similarity_search.call_count == 1
+    assert mock_vector_store._vector_store.similarity_search_by_vector.call_count == 1
+
+    # Concurrent cache misses share a single embeddings request
+    mock_vector_store.embeddings.aembed_documents.reset_mock()
+    results = await asyncio.gather(
+        *[
+            mock_vector_store.similarity_search(f"concurrent query {i}", use_cache=True)
+            for i in range(8)
+        ]
+    )
+    assert all(len(docs) == 2 for docs in results)
+    assert mock_vector_store.embeddings.aembed_documents.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_vector_store_embedding_coalescer(mock_settings):
+    """Test lone queries use aembed_query and close() fails queued queries."""
+    with patch("src.vector_store.manager.Pinecone"):
+        with patch("src.vector_store.manager.OpenAIEmbeddings"):
+            vector_store = VectorStoreManager(mock_settings)
+
+    vector_store.embeddings.aembed_query = AsyncMock(return_value=[0.1, 0.2])
+    vector_store.embeddings.aembed_documents = AsyncMock()
+
+    assert await vector_store._coalesced_embed("lone query") == [0.1, 0.2]
+    vector_store.embeddings.aembed_query.assert_awaited_once_with("lone query")
+    vector_store.embeddings.aembed_documents.assert_not_called()
+
+    # Queued before the batch is flushed, then the manager is closed
+    pending = asyncio.ensure_future(vector_store._coalesced_embed("queued query"))
+    await asyncio.sleep(0)
+    await vector_store.close()
+
+    with pytest.raises(VectorStoreError):
+        await pending
+
+
+@pytest.mark.asyncio
+async def test_vector_store_embedding_coalescer_short_response(mock_settings):
+    """Test a batch embedding response missing vectors fails every query."""
+    with patch("src.vector_store.manager.Pinecone"):
+        with patch("src.vector_store.manager.OpenAIEmbeddings"):
+            vector_store = VectorStoreManager(mock_settings)
+
+    vector_store.embeddings.aembed_documents = AsyncMock(return_value=[[0.1, 0.2]])
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            vector_store._coalesced_embed("first query"),
+            vector_store._coalesced_embed("second query"),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_vector_store_embeds_each_upsert_batch_once(mock_vector_store):
+    """Test ingestion embeds each upsert batch with one embed_documents call."""
+    embeddings = MagicMock(spec=Embeddings)
+    embeddings.embed_documents.side_effect = lambda texts: [[0.1] * 4] * len(texts)
+    # Real langchain-pinecone store, so its embedding path is exercised
+    store = PineconeVectorStore(
+        index=MagicMock(), embedding=embeddings, text_key="text"
+    )
+    documents = [
+        Document(page_content=f"Document {i}", metadata={"source": "test"})
+        for i in range(OPTIMAL_UPSERT_BATCH_SIZE * 2 + 50)
+    ]
+
+    with patch.object(mock_vector_store, "_vector_store", store):
+        ids = await mock_vector_store.add_documents(
+            documents, parallel=False, show_progress=False
+        )
+
+    batch_sizes = [
+        len(call.args[0]) for call in embeddings.embed_documents.call_args_list
+    ]
+    assert len(ids) == len(documents)
+    assert batch_sizes == [OPTIMAL_UPSERT_BATCH_SIZE, OPTIMAL_UPSERT_BATCH_SIZE, 50]
+    embeddings.embed_query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_vector_store_semantic_cache(
+    mock_settings, mock_vector_store, monkeypatch
+):
+    """Test paraphrased queries reuse cached vector search results."""
+    monkeypatch.setattr(mock_settings, "semantic_vector_cache_enabled", True)
+    get_cache_manager().clear_all()
+    mock_vector_store._vector_store.reset_mock()
+
+    embeddings = {
+        "current F1 standings": [0.9, 0.1, 0.4, 0.0],
+        "What are the current F1 driver standings?": [0.88, 0.12, 0.42, 0.02],
+        "Monaco circuit length": [0.0, 0.9, 0.0, 0.4],
+    }
+    mock_vector_store._vector_store.similarity_search_by_vector = MagicMock(
+        return_value=[Document(page_content="Standings", metadata={})]
+    )
+    mock_vector_store.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [embeddings[text] for text in texts]
+    )
+    mock_vector_store.embeddings.aembed_query = AsyncMock(
+        side_effect=lambda text: embeddings[text]
+    )
+    backend = mock_vector_store._vector_store.similarity_search_by_vector
+
+    await mock_vector_store.similarity_search("current F1 standings")
+    docs = await mock_vector_store.similarity_search(
+        "What are the current F1 driver standings?"
+    )
+
+    assert docs[0].page_content == "Standings"
+    assert backend.call_count == 1
+
+    # Unrelated queries and different search parameters still hit the backend
+    await mock_vector_store.similarity_search("Monaco circuit length")
+    await mock_vector_store.similarity_search("current F1 standings", k=10)
+    assert backend.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_vector_store_semantic_cache_off_by_default(
+    mock_settings, mock_vector_store
+):
+    """Test near-duplicate queries for different seasons are not merged."""
+    assert mock_settings.semantic_vector_cache_enabled is False
+    get_cache_manager().clear_all()
+    mock_vector_store._vector_store.reset_mock()
+
+    # Year-swapped queries embed almost identically (cosine similarity > 0.99)
+    embeddings = {
+        "2021 Monaco winner": [0.9, 0.1, 0.4, 0.01],
+        "2022 Monaco winner": [0.9, 0.1, 0.4, 0.03],
+    }
+    mock_vector_store._vector_store.similarity_search_by_vector = MagicMock(
+        side_effect=lambda embedding, k, filter: [
+            Document(page_content=f"Result {embedding[-1]}", metadata={})
+        ]
+    )
+    mock_vector_store.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [embeddings[text] for text in texts]
+    )
+    mock_vector_store.embeddings.aembed_query = AsyncMock(
+        side_effect=lambda text: embeddings[text]
+    )
+    backend = mock_vector_store._vector_store.similarity_search_by_vector
+
+    docs_2021 = await mock_vector_store.similarity_search("2021 Monaco winner")
+    docs_2022 = await mock_vector_store.similarity_search("2022 Monaco winner")
+
+    assert backend.call_count == 2
+    assert docs_2021[0].page_content != docs_2022[0].page_content
 
 
 @pytest.mark.asyncio
@@ -208,6 +441,14 @@ async def test_cache_key_generation():
     assert key1 == key2  # Same parameters should generate same key
     assert key1 != key3  # Different parameters should generate different key
 
+    # Filter key order and non-string filter keys are normalized
+    assert cache_manager.get_vector_cache_key(
+        "test query", 5, {"year": 2024, "category": "race"}
+    ) == cache_manager.get_vector_cache_key(
+        "test query", 5, {"category": "race", "year": 2024}
+    )
+    assert cache_manager.get_vector_cache_key("test query", 5, {2024: "season"})
+
     # Search cache key
     search_key1 = cache_manager.get_search_cache_key("test", 5, "advanced")
     search_key2 = cache_manager.get_search_cache_key("test", 5, "advanced")
@@ -222,73 +463,211 @@ async def test_cache_key_generation():
 
 
 @pytest.mark.asyncio
-async def test_cache_ttl_expiration():
-    """Test that cache entries expire after TTL."""
-    import time
-
-    from src.utils.cache import TTLCache
+async def test_semantic_cache_hit_on_paraphrase():
+    """Test that paraphrased queries hit the semantic LLM cache."""
+    cache_manager = CacheManager(llm_similarity_threshold=0.9)
+    partition = cache_manager.get_llm_partition_key("gpt-4", 0.7, "context")
 
-    # Create cache with 1 second TTL
-    cache = TTLCache(max_size=100, default_ttl=1)
+    # Embeddings of "Who won 2021 F1?" and a close paraphrase
+    original = [0.9, 0.1, 0.4, 0.0]
+    paraphrase = [0.85, 0.15, 0.45, 0.05]
+    unrelated = [0.0, 0.9, 0.0, 0.4]
 
-    # Set value
-    cache.set("test_key", "test_value")
+    cache_manager.semantic_llm_cache.set(partition, original, "Max Verstappen")
 
-    # Should be available immediately
-    assert cache.get("test_key") == "test_value"
-
-    # Wait for expiration
-    time.sleep(1.1)
-
-    # Should be expired
-    assert cache.get("test_key") is None
-
-
-@pytest.mark.asyncio
-async def test_cache_lru_eviction():
-    """Test LRU eviction when cache is full."""
-    from src.utils.cache import TTLCache
-
-    # Create small cache
-    cache = TTLCache(max_size=3, default_ttl=300)
+    assert (
+        cache_manager.semantic_llm_cache.get(partition, paraphrase) == "Max Verstappen"
+    )
+    assert cache_manager.semantic_llm_cache.get(partition, unrelated) is None
 
-    # Fill cache
-    cache.set("key1", "value1")
-    cache.set("key2", "value2")
-    cache.set("key3", "value3")
+    # Different model configurations never share entries
+    other_partition = cache_manager.get_llm_partition_key("gpt-4", 0.0, "context")
+    assert cache_manager.semantic_llm_cache.get(other_partition, original) is None
 
-    assert len(cache) == 3
+    stats = cache_manager.get_all_stats()["semantic_llm_cache"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
 
-    # Add one more (should evict key1)
-    cache.set("key4", "value4")
 
-    assert len(cache) == 3
-    assert cache.get("key1") is None  # Evicted
-    assert cache.get("key4") == "value4"  # New entry
+def test_semantic_llm_partition_includes_context_and_history():
+    """Test paraphrases only share answers built from the same context/history."""
+    cache_manager = CacheManager()
+    partition = cache_manager.get_llm_partition_key(
+        "gpt-4", 0.7, "2021 results", ["Who won Monaco?"]
+    )
 
+    assert partition == cache_manager.get_llm_partition_key(
+        "gpt-4", 0.7, "2021 results", ["Who won Monaco?"]
+    )
+    assert partition != cache_manager.get_llm_partition_key(
+        "gpt-4", 0.7, "2022 results", ["Who won Monaco?"]
+    )
+    assert partition != cache_manager.get_llm_partition_key(
+        "gpt-4", 0.7, "2021 results", ["Who won Monza?"]
+    )
 
-@pytest.mark.asyncio
-async def test_cache_stats():
-    """Test cache statistics tracking."""
+    embedding = [0.9, 0.1, 0.4, 0.0]
+    assert not cache_manager.semantic_llm_cache.has_entries(partition)
+    cache_manager.semantic_llm_cache.set(partition, embedding, "Max Verstappen")
+    assert cache_manager.semantic_llm_cache.has_entries(partition)
+
+
+def test_semantic_cache_skips_expired_best_match():
+    """Test an expired closest entry does not hide a live similar one."""
+    now = [0.0]
+    cache = SemanticTTLCache(similarity_threshold=0.9, time_source=lambda: now[0])
+    query = [0.9, 0.1, 0.4, 0.0]
+
+    cache.set("p", query, "stale", ttl=10)
+    cache.set("p", [0.85, 0.15, 0.45, 0.05], "fresh", ttl=100)
+    now[0] = 50.0
+
+    assert cache.get("p", query) == "fresh"
+
+
+def test_semantic_cache_sweeps_expired_entries():
+    """Test expired entries are removed even if never looked up."""
+    now = [0.0]
+    cache = SemanticTTLCache(time_source=lambda: now[0])
+
+    cache.set("a", [1.0, 0.0], "a1", ttl=10)
+    cache.set("b", [0.0, 1.0], "b1", ttl=10)
+    cache.set("b", [1.0, 1.0], "b2", ttl=100)
+    now[0] = 50.0
+
+    assert not cache.has_entries("a")
+    assert cache.has_entries("b")
+    assert len(cache) == 1
+
+
+def test_semantic_cache_lru_eviction_keeps_partitions_consistent():
+    """Test LRU eviction removes the right rows from a partition."""
+    cache = SemanticTTLCache(max_size=2, similarity_threshold=0.99)
+
+    cache.set("p", [1.0, 0.0, 0.0], "x")
+    cache.set("p", [0.0, 1.0, 0.0], "y")
+    cache.set("p", [0.0, 0.0, 1.0], "z")
+
+    assert cache.get("p", [1.0, 0.0, 0.0]) is None
+    assert cache.get("p", [0.0, 1.0, 0.0]) == "y"
+    assert cache.get("p", [0.0, 0.0, 1.0]) == "z"
+
+
+_LRU_1024_FILL = [("set", f"key{i}", i) for i in range(1025)]
+
+
+@pytest.mark.parametrize(
+    "max_size,ttl,op_script,expected",
+    [
+        pytest.param(
+            100,
+            1,
+            [("set", "a", 1), ("get", "a", 1), ("advance", 2), ("get", "a", None)],
+            {"size": 0, "hits": 1, "misses": 1},
+            id="ttl-expiration",
+        ),
+        pytest.param(
+            1,
+            300,
+            [("set", "a", 1), ("set", "b", 2), ("get", "a", None), ("get", "b", 2)],
+            {"size": 1, "hits": 1, "misses": 1},
+            id="lru-size-1",
+        ),
+        pytest.param(
+            3,
+            300,
+            [
+                ("set", "a", 1),
+                ("set", "b", 2),
+                ("set", "c", 3),
+                ("set", "d", 4),
+                ("get", "a", None),
+                ("get", "d", 4),
+            ],
+            {"size": 3, "hits": 1, "misses": 1},
+            id="lru-size-3",
+        ),
+        pytest.param(
+            3,
+            300,
+            [
+                ("set", "a", 1),
+                ("set", "b", 2),
+                ("set", "c", 3),
+                ("get", "a", 1),
+                ("set", "d", 4),
+                ("get", "b", None),
+                ("get", "a", 1),
+            ],
+            {"size": 3, "hits": 2, "misses": 1},
+            id="lru-interleaved-get",
+        ),
+        pytest.param(
+            1024,
+            300,
+            _LRU_1024_FILL + [("get", "key0", None), ("get", "key1024", 1024)],
+            {"size": 1024, "hits": 1, "misses": 1},
+            id="lru-size-1024",
+        ),
+        pytest.param(
+            3,
+            1,
+            [
+                ("set", "a", 1),
+                ("set", "b", 2),
+                ("set", "c", 3, 10),
+                ("advance", 5),
+                ("get", "c", 3),
+            ],
+            {"size": 1, "hits": 1, "misses": 0},
+            id="expiry-sweep",
+        ),
+        pytest.param(
+            1,
+            1,
+            [("set", "a", 1), ("set", "a", 2, 10), ("advance", 5), ("get", "a", 2)],
+            {"size": 1, "hits": 1, "misses": 0},
+            id="expiry-sweep-skips-overwritten",
+        ),
+        pytest.param(
+            100,
+            300,
+            [
+                ("set", "a", 1),
+                ("set", "b", 2),
+                ("get", "a", 1),
+                ("get", "a", 1),
+                ("get", "c", None),
+            ],
+            {"size": 2, "hits": 2, "misses": 1},
+            id="stats",
+        ),
+    ],
+)
+def test_ttl_cache_behavior(max_size, ttl, op_script, expected):
+    """Test TTL expiry, LRU eviction and stats from scripted cache operations."""
     from src.utils.cache import TTLCache
 
-    cache = TTLCache(max_size=100, default_ttl=300)
-
-    # Set some values
-    cache.set("key1", "value1")
-    cache.set("key2", "value2")
+    fake_time = [0.0]
+    cache = TTLCache(
+        max_size=max_size, default_ttl=ttl, time_source=lambda: fake_time[0]
+    )
 
-    # Generate hits and misses
-    cache.get("key1")  # Hit
-    cache.get("key1")  # Hit
-    cache.get("key3")  # Miss
+    for op, *args in op_script:
+        if op == "set":
+            cache.set(*args)
+        elif op == "get":
+            key, value = args
+            assert cache.get(key) == value
+        else:
+            fake_time[0] += args[0]
 
     stats = cache.get_stats()
 
-    assert stats["size"] == 2
-    assert stats["hits"] == 2
-    assert stats["misses"] == 1
-    assert stats["hit_rate"] == 2 / 3
+    assert {k: stats[k] for k in expected} == expected
+    assert stats["hit_rate"] == expected["hits"] / (
+        expected["hits"] + expected["misses"]
+    )
 
 
 if __name__ == "__main__":
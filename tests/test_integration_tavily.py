@@ -13,17 +13,14 @@ from src.search.tavily_client import TavilyClient
 
 @pytest.mark.integration
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api("tavily")
 class TestTavilySearchIntegration:
     """Integration tests for TavilySearchClient."""
 
     @pytest.fixture
-    def tavily_client(self, test_settings: Settings):
+    def tavily_client(self, live_settings: Settings):
         """Create Tavily client for testing."""
-        # Skip if no real API key
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
-        return TavilyClient(test_settings)
+        return TavilyClient(live_settings)
 
     async def test_basic_search(self, tavily_client: TavilyClient):
         """Test basic search functionality."""
@@ -89,21 +86,14 @@ class TestTavilySearchIntegration:
 class TestTavilyErrorHandling:
     """Integration tests for Tavily error handling."""
 
-    async def test_invalid_api_key(self):
+    async def test_invalid_api_key(self, monkeypatch: pytest.MonkeyPatch):
         """Test handling of invalid API key."""
-        import os
-
-        from src.config.settings import Settings
-
-        # Create settings with invalid key
-        os.environ["TAVILY_API_KEY"] = "invalid_key"
-        os.environ["OPENAI_API_KEY"] = "test-key"
-        os.environ["PINECONE_API_KEY"] = "test-key"
-        os.environ["PINECONE_ENVIRONMENT"] = "test"
-
-        from src.config.settings import get_settings
-
-        get_settings.cache_clear()
+        # Create settings with invalid key; monkeypatch restores the env and
+        # building Settings directly leaves the get_settings() cache untouched
+        monkeypatch.setenv("TAVILY_API_KEY", "invalid_key")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("PINECONE_API_KEY", "test-key")
+        monkeypatch.setenv("PINECONE_ENVIRONMENT", "test")
 
         settings = Settings()
         client = TavilyClient(settings)
@@ -112,12 +102,10 @@ class TestTavilyErrorHandling:
         with pytest.raises(SearchAPIError):
             await client.search(query="test query")
 
-    async def test_empty_query(self, test_settings: Settings):
+    @pytest.mark.requires_live_api("tavily")
+    async def test_empty_query(self, live_settings: Settings):
         """Test searching with empty query."""
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
-        client = TavilyClient(test_settings)
+        client = TavilyClient(live_settings)
 
         # Empty query should handle gracefully or raise appropriate error
         try:
@@ -127,12 +115,10 @@ class TestTavilyErrorHandling:
             # Expected behavior for empty query
             pass
 
-    async def test_rate_limiting(self, test_settings: Settings):
+    @pytest.mark.requires_live_api("tavily")
+    async def test_rate_limiting(self, live_settings: Settings):
         """Test rate limiting behavior."""
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
-        client = TavilyClient(test_settings)
+        client = TavilyClient(live_settings)
 
         # Make multiple rapid requests
         for i in range(3):
@@ -150,15 +136,13 @@ class TestTavilyErrorHandling:
 
 @pytest.mark.integration
 @pytest.mark.asyncio
+@pytest.mark.requires_live_api("tavily")
 class TestTavilyResultParsing:
     """Integration tests for result parsing."""
 
-    async def test_result_metadata_extraction(self, test_settings: Settings):
+    async def test_result_metadata_extraction(self, live_settings: Settings):
         """Test metadata extraction from search results."""
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
-        client = TavilyClient(test_settings)
+        client = TavilyClient(live_settings)
         results = await client.search(query="F1 news", max_results=2)
 
         for result in results:
@@ -170,12 +154,9 @@ class TestTavilyResultParsing:
             # Check URL is valid
             assert result.url.startswith("http")
 
-    async def test_result_deduplication(self, test_settings: Settings):
+    async def test_result_deduplication(self, live_settings: Settings):
         """Test that duplicate results are handled."""
-        if test_settings.tavily_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Tavily API key")
-
-        client = TavilyClient(test_settings)
+        client = TavilyClient(live_settings)
         results = await client.search(query="Formula 1", max_results=5)
 
         # Check for unique URLs
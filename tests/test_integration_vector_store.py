@@ -5,6 +5,7 @@ Mark as integration tests to skip in unit test runs.
 """
 
 import pytest
+import pytest_asyncio
 from langchain_core.documents import Document
 
 from src.config.settings import Settings
@@ -12,26 +13,27 @@ from src.exceptions import VectorStoreError
 from src.vector_store.manager import VectorStoreManager
 
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-class TestVectorStoreIntegration:
-    """Integration tests for VectorStoreManager."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def vector_store():
+    """Create one initialized vector store manager shared by the session.
 
-    @pytest.fixture
-    async def vector_store(self, test_settings: Settings):
-        """Create vector store manager for testing."""
-        # Skip if no real API keys
-        if test_settings.pinecone_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Pinecone API key")
+    The Pinecone index lookup and connection setup run once instead of once
+    per test; the manager is closed at session teardown. Only requested by
+    tests marked ``requires_live_api``, so a real Pinecone key is set.
+    """
+    manager = VectorStoreManager(Settings())
+    await manager.initialize()
 
-        manager = VectorStoreManager(test_settings)
+    yield manager
+
+    await manager.close()
 
-        try:
-            await manager.initialize()
-            yield manager
-        finally:
-            # Cleanup if needed
-            pass
+
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.requires_live_api("pinecone")
+class TestVectorStoreIntegration:
+    """Integration tests for VectorStoreManager."""
 
     async def test_vector_store_initialization(self, vector_store: VectorStoreManager):
         """Test vector store can be initialized."""
@@ -119,21 +121,14 @@ class TestVectorStoreIntegration:
 class TestVectorStoreErrorHandling:
     """Integration tests for error handling."""
 
-    async def test_invalid_api_key(self):
+    async def test_invalid_api_key(self, monkeypatch: pytest.MonkeyPatch):
         """Test handling of invalid API key."""
-        import os
-
-        from src.config.settings import Settings
-
-        # Create settings with invalid key
-        os.environ["PINECONE_API_KEY"] = "invalid_key"
-        os.environ["OPENAI_API_KEY"] = "test-key"
-        os.environ["PINECONE_ENVIRONMENT"] = "test"
-        os.environ["TAVILY_API_KEY"] = "test-key"
-
-        from src.config.settings import get_settings
-
-        get_settings.cache_clear()
+        # Create settings with invalid key; monkeypatch restores the env and
+        # building Settings directly leaves the get_settings() cache untouched
+        monkeypatch.setenv("PINECONE_API_KEY", "invalid_key")
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("PINECONE_ENVIRONMENT", "test")
+        monkeypatch.setenv("TAVILY_API_KEY", "test-key")
 
         settings = Settings()
 
@@ -142,12 +137,10 @@ class TestVectorStoreErrorHandling:
             manager = VectorStoreManager(settings)
             await manager.initialize()
 
-    async def test_search_empty_query(self, test_settings: Settings):
+    @pytest.mark.requires_live_api("pinecone")
+    async def test_search_empty_query(self, live_settings: Settings):
         """Test searching with empty query."""
-        if test_settings.pinecone_api_key.startswith("test-"):
-            pytest.skip("Skipping integration test - no real Pinecone API key")
-
-        manager = VectorStoreManager(test_settings)
+        manager = VectorStoreManager(live_settings)
         await manager.initialize()
 
         # Empty query should handle gracefully
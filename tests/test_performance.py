@@ -0,0 +1,436 @@
+"""Latency benchmarks for the retrieval path.
+
+``VectorStoreManager.similarity_search`` is timed end to end against mocked
+Pinecone and OpenAI backends, so the numbers reflect our own overhead
+(embedding coalescing, thread offload, bookkeeping) rather than network
+latency.
+
+The benchmarks are deselected by default. Run them with::
+
+    pytest tests/test_performance.py -m benchmark --no-cov
+"""
+
+import asyncio
+import math
+import sys
+import time
+import tracemalloc
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from langchain_core.documents import Document
+
+from src.config.settings import Settings
+from src.search.tavily_client import TavilyClient
+from src.vector_store.manager import (
+    EMBEDDING_COALESCE_MAX_BATCH,
+    VectorStoreManager,
+)
+
+SAMPLE_COUNT = 100
+INGEST_DOC_COUNT = 1000
+BATCH_COMPARE_DOC_COUNT = 100
+UPSERT_CALL_OVERHEAD_S = 0.001
+THROUGHPUT_DURATION_S = 0.5
+THROUGHPUT_WORKERS = 32
+LOAD_LEVELS = (10, 25, 50, 100)
+MIXED_OPERATION_COUNT = 50
+LARGE_RESULT_K = 100
+LATENCY_BUDGETS_MS = {50: 500, 95: 1000, 99: 2000}
+
+# Shared by every benchmark document so metadata is not rebuilt per document
+BENCH_METADATA = {"source": "benchmark"}
+
+BASELINE_QUERY_COUNT = 50
+
+
+@pytest.fixture(scope="module")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run these benchmarks on uvloop, which production serves with.
+
+    uvicorn[standard] installs uvloop except on Windows, where the default
+    asyncio policy is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="module")
+def bench_settings() -> Settings:
+    """Settings with dummy keys; every backend used by the benchmarks is mocked."""
+    return Settings(
+        openai_api_key="test-openai-key",
+        pinecone_api_key="test-pinecone-key",
+        tavily_api_key="test-tavily-key",
+        environment="development",
+    )
+
+
+@pytest.fixture(scope="class")
+def mock_vector_store(bench_settings: Settings) -> VectorStoreManager:
+    """Vector store manager whose Pinecone and OpenAI clients are mocked."""
+    with patch("src.vector_store.manager.Pinecone"):
+        with patch("src.vector_store.manager.OpenAIEmbeddings"):
+            manager = VectorStoreManager(bench_settings)
+
+    manager._vector_store = MagicMock()
+    manager._vector_store.similarity_search_by_vector.return_value = [
+        Document(page_content="Test doc", metadata={"source": "test"})
+    ]
+    manager.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts: [[0.1] * 1536 for _ in texts]
+    )
+    manager.embeddings.aembed_query = AsyncMock(return_value=[0.1] * 1536)
+    return manager
+
+
+@pytest.fixture(scope="class")
+def mock_tavily_client(bench_settings: Settings) -> TavilyClient:
+    """Uncached Tavily client whose search tool is mocked."""
+    client = TavilyClient(
+        bench_settings, rate_limit_requests=10_000, enable_cache=False
+    )
+    client._search_tool = MagicMock()
+    client._search_tool.ainvoke = AsyncMock(
+        return_value=[{"title": "Test", "url": "https://formula1.com", "content": ""}]
+    )
+    return client
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def latency_samples(mock_vector_store: VectorStoreManager) -> np.ndarray:
+    """Time SAMPLE_COUNT concurrent uncached searches for the percentile checks.
+
+    Searches are submitted together, so the samples include the time spent
+    waiting on the shared embedding batcher, as requests do under load.
+    """
+
+    async def timed_search() -> int:
+        start = time.perf_counter_ns()
+        await mock_vector_store.similarity_search("test query", use_cache=False)
+        return time.perf_counter_ns() - start
+
+    samples = await asyncio.gather(*(timed_search() for _ in range(SAMPLE_COUNT)))
+    return np.array(samples, dtype=np.int64)
+
+
+@pytest.fixture(scope="class")
+def latency_percentiles(latency_samples: np.ndarray) -> dict[int, float]:
+    """Budgeted latency percentiles in ms, from one np.percentile selection."""
+    pcts = list(LATENCY_BUDGETS_MS)
+    values_ms = np.percentile(latency_samples, pcts, method="nearest") / 1e6
+    return dict(zip(pcts, values_ms.tolist()))
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio(loop_scope="class")
+class TestResponseTimePercentiles:
+    """Latency percentiles for vector search."""
+
+    @pytest.mark.parametrize("pct,threshold_ms", LATENCY_BUDGETS_MS.items())
+    async def test_latency_percentile(self, latency_percentiles, pct, threshold_ms):
+        """Test the pct-th percentile search latency stays under its budget."""
+        assert latency_percentiles[pct] < threshold_ms
+
+    async def test_cache_hit_latency(self, mock_vector_store, latency_percentiles):
+        """Test cached searches skip the backend and beat the miss latency."""
+        query = "cached percentile query"
+        await mock_vector_store.similarity_search(query)
+        backend = mock_vector_store._vector_store.similarity_search_by_vector
+        backend_calls = backend.call_count
+
+        hits = np.empty(SAMPLE_COUNT, dtype=np.int64)
+        for i in range(SAMPLE_COUNT):
+            start = time.perf_counter_ns()
+            await mock_vector_store.similarity_search(query)
+            hits[i] = time.perf_counter_ns() - start
+        hit_p50_ms = np.percentile(hits, 50, method="nearest") / 1e6
+
+        assert backend.call_count == backend_calls
+        assert hit_p50_ms < 1
+        assert hit_p50_ms < latency_percentiles[50]
+
+
+@pytest.mark.benchmark(group="vector_search")
+class TestSearchLatencyBenchmark:
+    """Calibrated single-search latency via pytest-benchmark."""
+
+    def test_vector_search_latency(
+        self, benchmark, mock_vector_store, event_loop_policy
+    ):
+        """Benchmark one uncached search with warmup rounds discarded."""
+        loop = event_loop_policy.new_event_loop()
+
+        def search():
+            return loop.run_until_complete(
+                mock_vector_store.similarity_search("test query", use_cache=False)
+            )
+
+        try:
+            benchmark.pedantic(search, rounds=100, warmup_rounds=10)
+        finally:
+            loop.close()
+
+        assert benchmark.stats.stats.median * 1000 < 500
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestConcurrentLoad:
+    """Concurrent vector search load through the embedding batcher."""
+
+    @pytest.mark.parametrize("concurrency", [10, 50, 100])
+    async def test_concurrent_queries(self, mock_vector_store, concurrency):
+        """Test N concurrent searches share ceil(N / max batch) embedding calls."""
+        mock_vector_store.embeddings.aembed_documents.reset_mock()
+
+        results = await asyncio.gather(
+            *(
+                mock_vector_store.similarity_search(f"query {i}", use_cache=False)
+                for i in range(concurrency)
+            )
+        )
+
+        batch_sizes = [
+            len(call.args[0])
+            for call in mock_vector_store.embeddings.aembed_documents.call_args_list
+        ]
+
+        assert all(len(docs) == 1 for docs in results)
+        assert sum(batch_sizes) == concurrency
+        assert max(batch_sizes) <= EMBEDDING_COALESCE_MAX_BATCH
+        # One extra flush is tolerated if the coalescing window closes early
+        min_batches = math.ceil(concurrency / EMBEDDING_COALESCE_MAX_BATCH)
+        assert len(batch_sizes) <= min_batches + 1
+
+    async def test_concurrent_mixed_operations(
+        self, mock_vector_store, mock_tavily_client
+    ):
+        """Test interleaved vector and web searches all complete under load."""
+        pending = [
+            (
+                mock_vector_store.similarity_search(f"mixed {i}", use_cache=False)
+                if i % 2 == 0
+                else mock_tavily_client.search(f"mixed {i}", use_cache=False)
+            )
+            for i in range(MIXED_OPERATION_COUNT)
+        ]
+
+        # Results are consumed as they finish rather than buffered by gather
+        completed = 0
+        start = time.perf_counter_ns()
+        for next_done in asyncio.as_completed(pending):
+            assert len(await next_done) == 1
+            completed += 1
+        elapsed_s = (time.perf_counter_ns() - start) / 1e9
+
+        assert completed == MIXED_OPERATION_COUNT
+        assert elapsed_s < 15.0
+
+    async def test_queries_per_second(self, mock_vector_store):
+        """Test sustained QPS with concurrent workers over a fixed duration."""
+        deadline = time.monotonic() + THROUGHPUT_DURATION_S
+        completed = [0]
+
+        async def worker(worker_id: int) -> None:
+            while time.monotonic() < deadline:
+                await mock_vector_store.similarity_search(
+                    f"throughput query {worker_id}", use_cache=False
+                )
+                completed[0] += 1
+
+        await asyncio.gather(*(worker(i) for i in range(THROUGHPUT_WORKERS)))
+
+        assert completed[0] / THROUGHPUT_DURATION_S > 100
+
+    async def test_increasing_load_performance(self, mock_vector_store):
+        """Test per-query cost does not grow as concurrent load increases."""
+
+        async def run_level(concurrency: int) -> int:
+            start = time.perf_counter_ns()
+            await asyncio.gather(
+                *(
+                    mock_vector_store.similarity_search(f"load {i}", use_cache=False)
+                    for i in range(concurrency)
+                )
+            )
+            return time.perf_counter_ns() - start
+
+        # Levels run one after another so they do not share embedding batches
+        wall_ns = np.array([await run_level(n) for n in LOAD_LEVELS], dtype=np.int64)
+        per_query_ns = wall_ns / np.array(LOAD_LEVELS)
+
+        assert per_query_ns[-1] / per_query_ns[0] < 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestIngestionThroughput:
+    """Document ingestion throughput through the batched upsert path."""
+
+    async def test_document_ingestion_throughput(self, mock_vector_store):
+        """Test ingestion timing covers add_documents only, not input setup."""
+        # Build inputs outside the timed section
+        documents = [
+            Document(page_content=f"Document {i}", metadata=BENCH_METADATA)
+            for i in range(INGEST_DOC_COUNT)
+        ]
+        mock_vector_store._vector_store.add_documents.side_effect = lambda documents: [
+            doc.page_content for doc in documents
+        ]
+
+        start = time.perf_counter_ns()
+        ids = await mock_vector_store.add_documents(documents, show_progress=False)
+        elapsed_s = (time.perf_counter_ns() - start) / 1e9
+
+        assert len(ids) == INGEST_DOC_COUNT
+        assert INGEST_DOC_COUNT / elapsed_s > 1000  # docs per second
+
+    async def test_batch_processing_efficiency(self, mock_vector_store):
+        """Test batched upserts amortize the fixed per-request overhead."""
+        documents = [
+            Document(page_content=f"Document {i}", metadata=BENCH_METADATA)
+            for i in range(BATCH_COMPARE_DOC_COUNT)
+        ]
+
+        def upsert(documents: list[Document]) -> list[str]:
+            time.sleep(UPSERT_CALL_OVERHEAD_S)  # stands in for one round trip
+            return [doc.page_content for doc in documents]
+
+        async def best_of_three(batch_size: int) -> int:
+            timings = []
+            for _ in range(3):
+                start = time.perf_counter_ns()
+                ids = await mock_vector_store.add_documents(
+                    documents,
+                    batch_size=batch_size,
+                    parallel=False,
+                    show_progress=False,
+                )
+                timings.append(time.perf_counter_ns() - start)
+                assert len(ids) == BATCH_COMPARE_DOC_COUNT
+            return min(timings)
+
+        with patch.object(
+            mock_vector_store._vector_store, "add_documents", side_effect=upsert
+        ) as backend:
+            batched_ns = await best_of_three(BATCH_COMPARE_DOC_COUNT)
+            individual_ns = await best_of_three(1)
+
+        assert backend.call_count == 3 * (1 + BATCH_COMPARE_DOC_COUNT)
+        assert batched_ns < individual_ns
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB, from the kernel counter."""
+    resource = pytest.importorskip("resource")  # POSIX only
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestMemoryUsage:
+    """Coarse peak memory checks for the retrieval path."""
+
+    async def test_search_peak_memory(self, mock_vector_store):
+        """Test 1000 concurrent uncached searches stay within a peak RSS budget."""
+        rss_before = _peak_rss_mb()
+
+        await asyncio.gather(
+            *(
+                mock_vector_store.similarity_search(f"query {i}", use_cache=False)
+                for i in range(1000)
+            )
+        )
+
+        assert _peak_rss_mb() - rss_before < 100
+
+    async def test_large_result_set_handling(self, mock_vector_store):
+        """Test a top-100 result set is returned in full and served from cache."""
+        large_results = [
+            Document(page_content=f"Doc {i}", metadata=BENCH_METADATA)
+            for i in range(LARGE_RESULT_K)
+        ]
+        query = "large result set query"
+
+        with patch.object(
+            mock_vector_store._vector_store,
+            "similarity_search_by_vector",
+            return_value=large_results,
+        ) as backend:
+            docs = await mock_vector_store.similarity_search(query, k=LARGE_RESULT_K)
+            cached = await mock_vector_store.similarity_search(query, k=LARGE_RESULT_K)
+
+        assert docs == large_results
+        assert cached == large_results
+        assert backend.call_count == 1
+
+    async def test_memory_leak_detection(self, mock_vector_store):
+        """Test repeated searches do not retain memory in our own modules."""
+        # Queries come from a fixed pool built up front, so the snapshots only
+        # differ by what the search path itself allocates and keeps
+        query_pool = [f"leak query {i}" for i in range(10)]
+
+        async def run_round() -> None:
+            await asyncio.gather(
+                *(
+                    mock_vector_store.similarity_search(query, use_cache=False)
+                    for query in query_pool
+                )
+            )
+
+        await run_round()  # warm up lazily created state (batcher worker, etc.)
+        tracemalloc.start(1)
+        try:
+            baseline = tracemalloc.take_snapshot()
+            for _ in range(100):
+                await run_round()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        src_filter = [tracemalloc.Filter(True, "*/src/*")]
+        growth = sum(
+            stat.size_diff
+            for stat in snapshot.filter_traces(src_filter).compare_to(
+                baseline.filter_traces(src_filter), "lineno"
+            )
+        )
+
+        assert growth < 1024 * 1024  # under 1 MB retained after 1000 searches
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+class TestPerformanceRegression:
+    """Baseline latency guards against regressions in the search path."""
+
+    async def test_baseline_query_performance(self, mock_vector_store):
+        """Test average and p95 latency of concurrent searches for one query."""
+
+        async def timed_search() -> int:
+            start = time.perf_counter_ns()
+            await mock_vector_store.similarity_search("baseline query")
+            return time.perf_counter_ns() - start
+
+        # Issued together, as pooled production traffic arrives
+        latencies = np.array(
+            await asyncio.gather(
+                *(timed_search() for _ in range(BASELINE_QUERY_COUNT))
+            ),
+            dtype=np.int64,
+        )
+
+        p95_index = math.ceil(0.95 * BASELINE_QUERY_COUNT) - 1
+        avg_ms = latencies.mean() / 1e6
+        p95_ms = np.partition(latencies, p95_index)[p95_index] / 1e6
+
+        assert avg_ms < 100
+        assert p95_ms < 200
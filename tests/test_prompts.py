@@ -71,6 +71,15 @@ class TestSystemPrompts:
         assert "analyst" in prompt.content.lower() or "expert" in prompt.content.lower()
         assert "technical" in prompt.content.lower()
 
+    def test_prompt_factories_are_cached(self):
+        """Test repeated factory calls reuse the built prompt objects."""
+        assert create_system_prompt(include_guardrails=False) is create_system_prompt(
+            include_guardrails=False
+        )
+        assert create_role_based_system_prompt(
+            role="educator", user_expertise="beginner"
+        ) is create_role_based_system_prompt(role="educator", user_expertise="beginner")
+
     def test_concise_system_prompt(self):
         """Test pre-configured concise prompt."""
         assert isinstance(CONCISE_SYSTEM_PROMPT, ChatPromptTemplate)
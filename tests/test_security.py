@@ -119,6 +119,7 @@ class TestTokenBucket:
 
         # Should be able to consume some tokens
         assert bucket.consume(4) is True
+        assert bucket.tokens >= 1
 
     def test_time_until_available(self):
         """Test calculation of time until tokens available."""
@@ -132,6 +133,46 @@ class TestTokenBucket:
         assert wait_time > 0
         assert wait_time <= 5.0
 
+    def test_next_conforming_time(self):
+        """Test the delay until exactly n tokens are available."""
+        bucket = TokenBucket(capacity=10, refill_rate=2.0)
+
+        assert bucket.next_conforming_time(10) == 0.0
+
+        bucket.consume(10)
+        assert bucket.next_conforming_time(4) == pytest.approx(2.0, abs=0.01)
+
+    async def test_acquire_sleeps_once(self, monkeypatch):
+        """Test acquire waits a single computed delay before consuming."""
+        import asyncio
+
+        bucket = TokenBucket(capacity=10, refill_rate=100.0)
+        bucket.consume(10)
+
+        delays = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            delays.append(delay)
+            await real_sleep(delay)
+
+        monkeypatch.setattr(
+            "src.security.rate_limiting.asyncio.sleep", recording_sleep
+        )
+
+        await bucket.acquire(5)
+
+        assert len(delays) <= 2  # a second, tiny sleep absorbs float rounding
+        assert delays[0] == pytest.approx(0.05, abs=0.01)
+        assert bucket.tokens < 1
+
+    async def test_acquire_more_than_capacity(self):
+        """Test acquiring more tokens than the bucket holds is rejected."""
+        bucket = TokenBucket(capacity=10, refill_rate=1.0)
+
+        with pytest.raises(ValueError):
+            await bucket.acquire(11)
+
 
 class TestRateLimiter:
     """Tests for rate limiter."""
@@ -146,6 +187,69 @@ class TestRateLimiter:
         assert limiter.requests_per_minute == 60
         assert limiter.requests_per_hour == 1000
         assert limiter.burst_size == 60
+        assert limiter.strategy == "token_bucket"
+
+    @staticmethod
+    def _request(host: str = "10.0.0.1"):
+        """Build a minimal stand-in for a FastAPI request."""
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            state=SimpleNamespace(), headers={}, client=SimpleNamespace(host=host)
+        )
+
+    @pytest.mark.parametrize("strategy", ["token_bucket", "fixed_window"])
+    def test_denies_at_limit(self, strategy):
+        """Test both strategies allow exactly the per-minute limit, then deny."""
+        from src.security.rate_limiting import RateLimitExceeded
+
+        limiter = RateLimiter(requests_per_minute=5, strategy=strategy)
+        request = self._request()
+
+        for _ in range(5):
+            limiter.check_rate_limit(request)
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            limiter.check_rate_limit(request)
+        assert int(exc_info.value.headers["Retry-After"]) >= 1
+        assert limiter.get_rate_limit_info(request)["remaining"]["minute"] == 0
+
+    def test_strategy_burst_characteristics(self):
+        """Test only the token bucket caps bursts below the per-minute limit."""
+        from src.security.rate_limiting import RateLimitExceeded
+
+        bucket = RateLimiter(requests_per_minute=5, burst_size=2)
+        window = RateLimiter(
+            requests_per_minute=5, burst_size=2, strategy="fixed_window"
+        )
+        request = self._request()
+
+        bucket.check_rate_limit(request)
+        bucket.check_rate_limit(request)
+        with pytest.raises(RateLimitExceeded):
+            bucket.check_rate_limit(request)
+
+        for _ in range(5):
+            window.check_rate_limit(request)
+
+    def test_fixed_window_resets(self):
+        """Test a fixed-window counter starts over once its window has passed."""
+        from src.security.rate_limiting import FixedWindowCounter
+
+        counter = FixedWindowCounter(limit=2, window_seconds=60.0)
+        assert counter.consume(2) is True
+        assert counter.consume() is False
+        assert counter.time_until_available() > 59
+
+        counter.window_start -= 60.0
+        assert counter.available() == 2
+        assert counter.consume() is True
+        assert counter.tokens == 1
+
+    def test_unknown_strategy(self):
+        """Test an unknown strategy is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(strategy="leaky_bucket")
 
 
 class TestAPIKeyValidation:
@@ -303,6 +407,44 @@ class TestRequestSigning:
 
         assert is_valid is False
 
+    def test_signature_matches_plain_hmac(self):
+        """Test reusing the pre-keyed HMAC yields the standard signature."""
+        import hashlib
+        import hmac
+
+        from src.security.request_signing import RequestSigner
+
+        signer = RequestSigner(secret_key="test-secret")
+        body = '{"test": "data"}'
+        body_hash = hashlib.sha256(body.encode()).hexdigest()
+        string_to_sign = "\n".join(["1700000000", "POST", "/api/test", body_hash])
+        expected = hmac.new(
+            b"test-secret", string_to_sign.encode(), hashlib.sha256
+        ).hexdigest()
+
+        for _ in range(2):
+            signature = signer.sign_request(
+                method="post", path="/api/test", body=body, timestamp=1700000000
+            )
+            assert signature == f"1700000000.{expected}"
+
+    @pytest.mark.benchmark
+    def test_signing_throughput(self):
+        """Test signing and verifying 10,000 requests stays fast."""
+        import time
+
+        from src.security.request_signing import RequestSigner
+
+        signer = RequestSigner(secret_key="test-secret")
+
+        start = time.perf_counter()
+        for i in range(10_000):
+            signature = signer.sign_request("POST", f"/api/test/{i}", body="{}")
+            assert signer.verify_signature(signature, "POST", f"/api/test/{i}", "{}")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 2.0, f"10,000 sign/verify pairs took {elapsed:.2f}s"
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,6 +1,7 @@
 """Tests for Tavily search client."""
 
 import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -104,6 +105,51 @@ async def test_search_with_overrides(
         mock_tool_class.assert_called_once()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_reuses_override_tools(
+    test_settings: Settings, mock_search_results: list[dict]
+):
+    """Test repeated overrides reuse one tool per parameter combination."""
+    client = TavilyClient(test_settings, enable_cache=False)
+
+    with patch("src.search.tavily_client.TavilySearchResults") as mock_tool_class:
+        mock_tool_class.return_value.ainvoke = AsyncMock(
+            return_value=mock_search_results
+        )
+
+        for query in ("Monaco", "Monza", "Suzuka"):
+            await client.search(query, max_results=3, search_depth="advanced")
+        await client.search("Spa", max_results=5)
+
+        assert mock_tool_class.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_concurrency_cap(
+    test_settings: Settings, mock_search_results: list[dict]
+):
+    """Test concurrent searches never exceed the in-flight request cap."""
+    client = TavilyClient(test_settings, rate_limit_requests=100, enable_cache=False)
+    in_flight = peak = 0
+
+    async def slow_invoke(payload):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return mock_search_results
+
+    client._search_tool = MagicMock()
+    client._search_tool.ainvoke = slow_invoke
+
+    await asyncio.gather(*(client.search(f"query {i}") for i in range(32)))
+
+    assert peak == test_settings.tavily_max_concurrent
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_search_failure_records_failure(tavily_client: TavilyClient):
@@ -230,6 +276,57 @@ def test_convert_to_documents_with_deduplication(tavily_client: TavilyClient):
     assert len(documents) == 1  # Duplicate removed
 
 
+@pytest.mark.unit
+def test_deduplication_scales_linearly(tavily_client: TavilyClient):
+    """Test URL variants are merged and large result sets dedupe quickly."""
+    results = []
+    for i in range(5_000):
+        url = f"https://example.com/article-{i}"
+        results.append({"title": "A", "url": url, "content": f"Story {i}"})
+        # Same page with a trailing slash and a different host case
+        variant = url.replace("example.com", "EXAMPLE.com") + "/"
+        results.append({"title": "B", "url": variant, "content": f"Copy {i}"})
+
+    start = time.perf_counter()
+    deduplicated = tavily_client._deduplicate_results(results)
+    elapsed = time.perf_counter() - start
+
+    assert len(deduplicated) == 5_000
+    assert all(result["title"] == "A" for result in deduplicated)
+    assert elapsed < 1.0
+
+
+@pytest.mark.unit
+def test_deduplication_keeps_case_sensitive_paths(tavily_client: TavilyClient):
+    """Test URLs differing only in path or query case are distinct pages."""
+    results = [
+        {"title": "A", "url": "https://example.com/News/Race", "content": "One"},
+        {"title": "B", "url": "https://example.com/news/race", "content": "Two"},
+        {"title": "C", "url": "https://example.com/r?id=Ab", "content": "Three"},
+        {"title": "D", "url": "https://example.com/r?id=ab", "content": "Four"},
+        {"title": "E", "url": "HTTPS://Example.com/News/Race/", "content": "Five"},
+    ]
+
+    deduplicated = tavily_client._deduplicate_results(results)
+
+    assert [result["title"] for result in deduplicated] == ["A", "B", "C", "D"]
+
+
+@pytest.mark.unit
+def test_deduplication_tolerates_malformed_urls(tavily_client: TavilyClient):
+    """Test one malformed URL does not abort deduplication of the rest."""
+    results = [
+        {"title": "A", "url": "http://[::1", "content": "One"},
+        {"title": "B", "url": "http://[::1/", "content": "Two"},
+        {"title": "C", "url": "https://example.com/race", "content": "Three"},
+        {"title": "D", "url": "https://EXAMPLE.com/race/", "content": "Four"},
+    ]
+
+    deduplicated = tavily_client._deduplicate_results(results)
+
+    assert [result["title"] for result in deduplicated] == ["A", "C"]
+
+
 @pytest.mark.unit
 def test_parse_and_normalize_result(tavily_client: TavilyClient):
     """Test result parsing and normalization."""
@@ -301,7 +398,7 @@ def test_get_fallback_message(tavily_client: TavilyClient):
 
     # Enter fallback mode
     tavily_client._fallback_mode = True
-    tavily_client._last_failure_time = asyncio.get_event_loop().time()
+    tavily_client._last_failure_time = time.monotonic()
 
     message = tavily_client.get_fallback_message()
     assert "temporarily unavailable" in message.lower()
@@ -0,0 +1,79 @@
+"""Micro-benchmarks for the UI message rendering hot paths.
+
+``render_message`` and ``render_sources`` run once per chat message on every
+Streamlit rerun, so their per-call cost is tracked here with pytest-benchmark.
+Streamlit itself is replaced with a no-op mock so only our own rendering logic
+is measured.
+
+The benchmarks are opt-in. Run them with::
+
+    pytest tests/test_ui_benchmarks.py --benchmark-only
+
+and compare against a saved baseline with
+``--benchmark-compare --benchmark-compare-fail=mean:10%``.
+"""
+
+from importlib import import_module
+from unittest.mock import MagicMock
+
+import pytest
+
+# Import components module directly without going through __init__.py
+components = import_module("src.ui.components")
+
+SAMPLE_CONTENT = "Max Verstappen won the 2023 championship. " * 5
+
+SAMPLE_SOURCES = [
+    {
+        "type": "historical",
+        "content": "Lewis Hamilton won his first championship in 2008. " * 6,
+        "metadata": {"year": 2008},
+        "score": 0.92,
+    },
+    {
+        "type": "current",
+        "title": "Latest F1 Race Results",
+        "url": "https://www.formula1.com/results",
+        "content": "Max Verstappen wins the Monaco Grand Prix",
+        "score": 0.81,
+    },
+    {"type": "historical", "content": "Ferrari's 2004 season", "score": 0.64},
+]
+
+
+@pytest.fixture
+def mock_st(monkeypatch):
+    """No-op Streamlit stand-in so benchmarks only measure component logic."""
+    st = MagicMock()
+    st.columns.return_value = (MagicMock(), MagicMock())
+    st.session_state.feedback = {}
+    st.button.return_value = False
+    monkeypatch.setattr(components, "st", st)
+    return st
+
+
+@pytest.mark.benchmark(group="render")
+class TestRenderBenchmarks:
+    """Per-call timings for the chat rendering functions."""
+
+    def test_render_message_bench(self, benchmark, mock_st):
+        """Benchmark rendering a plain assistant message."""
+        benchmark(components.render_message, "assistant", SAMPLE_CONTENT, None, "id")
+
+        mock_st.markdown.assert_called_with(SAMPLE_CONTENT)
+
+    def test_render_message_with_metadata_bench(self, benchmark, mock_st):
+        """Benchmark rendering an assistant message with sources and confidence."""
+        metadata = {"sources": SAMPLE_SOURCES, "confidence": 0.87}
+
+        benchmark(
+            components.render_message, "assistant", SAMPLE_CONTENT, metadata, "id"
+        )
+
+        mock_st.expander.assert_called()
+
+    def test_render_sources_bench(self, benchmark, mock_st):
+        """Benchmark rendering the source citations expander."""
+        benchmark(components.render_sources, SAMPLE_SOURCES)
+
+        assert mock_st.divider.call_count > 0
@@ -1,7 +1,9 @@
 """Unit tests for UI components and F1 theme."""
 
+import re
 import sys
 from importlib import import_module
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,37 +12,78 @@ import pytest
 components = import_module("src.ui.components")
 F1Theme = components.F1Theme
 apply_f1_theme = components.apply_f1_theme
+RecommendationPrompt = components.RecommendationPrompt
+execute_prompt = components.execute_prompt
+render_recommendation_prompts = components.render_recommendation_prompts
+render_welcome_screen = components.render_welcome_screen
+render_about_modal = components.render_about_modal
+
+
+class SessionState(dict):
+    """Dict supporting attribute access, like Streamlit's session state."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+def _contains(calls, token):
+    """Check whether any captured markdown call contains token."""
+    return any(token in call for call in calls)
+
+
+@pytest.fixture
+def mock_st(monkeypatch):
+    """Streamlit stand-in with an empty session state."""
+    st = MagicMock()
+    st.session_state = SessionState()
+    monkeypatch.setattr(components, "st", st)
+    return st
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Logger stand-in for asserting on component log events."""
+    logger = MagicMock()
+    monkeypatch.setattr(components, "logger", logger)
+    return logger
 
 
 class TestF1Theme:
     """Test F1Theme configuration model."""
 
+    EXPECTED_DEFAULTS = {
+        # Primary colors
+        "f1_red": "#E10600",
+        "black": "#0e1117",
+        "dark_gray": "#1e2130",
+        "white": "#FFFFFF",
+        # Spacing
+        "spacing_xs": "4px",
+        "spacing_sm": "8px",
+        "spacing_md": "16px",
+        "spacing_lg": "24px",
+        "spacing_xl": "32px",
+        # Border radius
+        "radius_sm": "4px",
+        "radius_md": "8px",
+        "radius_lg": "12px",
+        # Transitions
+        "transition_fast": "150ms ease",
+        "transition_normal": "200ms ease",
+        "transition_slow": "300ms ease",
+    }
+
     def test_f1_theme_default_values(self):
         """Test F1Theme initializes with correct default values."""
         theme = F1Theme()
 
-        # Test primary colors
-        assert theme.f1_red == "#E10600"
-        assert theme.black == "#0e1117"
-        assert theme.dark_gray == "#1e2130"
-        assert theme.white == "#FFFFFF"
-
-        # Test spacing
-        assert theme.spacing_xs == "4px"
-        assert theme.spacing_sm == "8px"
-        assert theme.spacing_md == "16px"
-        assert theme.spacing_lg == "24px"
-        assert theme.spacing_xl == "32px"
-
-        # Test border radius
-        assert theme.radius_sm == "4px"
-        assert theme.radius_md == "8px"
-        assert theme.radius_lg == "12px"
-
-        # Test transitions
-        assert theme.transition_fast == "150ms ease"
-        assert theme.transition_normal == "200ms ease"
-        assert theme.transition_slow == "300ms ease"
+        assert self.EXPECTED_DEFAULTS.items() <= theme.model_dump().items()
 
     def test_f1_theme_custom_values(self):
         """Test F1Theme accepts custom values."""
@@ -60,18 +103,51 @@ class TestF1Theme:
         assert isinstance(theme_dict, dict)
         assert "f1_red" in theme_dict
         assert "spacing_md" in theme_dict
-        assert theme_dict["f1_red"] == "#E10600"
+        assert theme_dict["f1_red"] == self.EXPECTED_DEFAULTS["f1_red"]
 
 
 class TestApplyF1Theme:
     """Test apply_f1_theme CSS injection function."""
 
-    @patch("src.ui.components.st")
+    CSS_TOKENS = (
+        "@media (max-width: 768px)",
+        "@media (max-width: 480px)",
+        "focus-visible",
+        "outline:",
+        "@keyframes fadeIn",
+        "@keyframes slideIn",
+        "animation:",
+        ".stButton",
+        ".stChatMessage",
+        ".stTextInput",
+        ".stSlider",
+        ".streamlit-expanderHeader",
+        ".welcome-hero",
+        ".main .block-container",
+        "max-width: 800px",
+        "padding-top:",
+        "padding-left:",
+        "padding-right:",
+    )
+
+    @pytest.fixture(scope="class")
+    def injected_css(self):
+        """Render the theme CSS once and share it across content checks."""
+        with patch("src.ui.components.st") as mock_st:
+            mock_st.session_state = SessionState()
+            apply_f1_theme()
+            return mock_st.markdown.call_args[0][0]
+
+    @pytest.fixture(scope="class")
+    def css_tokens(self, injected_css):
+        """Scan the CSS once for every token the content checks look for."""
+        # Longest first so a shorter token never shadows one it prefixes
+        tokens = sorted(self.CSS_TOKENS, key=len, reverse=True)
+        pattern = re.compile("|".join(re.escape(token) for token in tokens))
+        return set(pattern.findall(injected_css))
+
     def test_apply_f1_theme_injects_css(self, mock_st):
         """Test that apply_f1_theme injects CSS via st.markdown."""
-        # Setup mock session state
-        mock_st.session_state = {}
-
         # Call function
         apply_f1_theme()
 
@@ -87,12 +163,8 @@ class TestApplyF1Theme:
         assert "unsafe_allow_html" in call_args[1]
         assert call_args[1]["unsafe_allow_html"] is True
 
-    @patch("src.ui.components.st")
     def test_apply_f1_theme_sets_session_flag(self, mock_st):
         """Test that apply_f1_theme sets css_injected flag."""
-        # Setup mock session state
-        mock_st.session_state = {}
-
         # Call function
         apply_f1_theme()
 
@@ -100,11 +172,10 @@ class TestApplyF1Theme:
         assert "css_injected" in mock_st.session_state
         assert mock_st.session_state["css_injected"] is True
 
-    @patch("src.ui.components.st")
     def test_apply_f1_theme_only_injects_once(self, mock_st):
         """Test that CSS is only injected once per session."""
         # Setup mock session state with flag already set
-        mock_st.session_state = {"css_injected": True}
+        mock_st.session_state.update({"css_injected": True})
 
         # Call function
         apply_f1_theme()
@@ -112,78 +183,43 @@ class TestApplyF1Theme:
         # Verify st.markdown was NOT called
         mock_st.markdown.assert_not_called()
 
-    @patch("src.ui.components.st")
-    def test_apply_f1_theme_includes_responsive_css(self, mock_st):
+    def test_apply_f1_theme_includes_responsive_css(self, css_tokens):
         """Test that responsive CSS is included."""
-        mock_st.session_state = {}
-
-        apply_f1_theme()
-
-        css_content = mock_st.markdown.call_args[0][0]
-
         # Check for responsive media queries
-        assert "@media (max-width: 768px)" in css_content
-        assert "@media (max-width: 480px)" in css_content
+        assert "@media (max-width: 768px)" in css_tokens
+        assert "@media (max-width: 480px)" in css_tokens
 
-    @patch("src.ui.components.st")
-    def test_apply_f1_theme_includes_accessibility_css(self, mock_st):
+    def test_apply_f1_theme_includes_accessibility_css(self, css_tokens):
         """Test that accessibility CSS is included."""
-        mock_st.session_state = {}
-
-        apply_f1_theme()
-
-        css_content = mock_st.markdown.call_args[0][0]
-
         # Check for accessibility features
-        assert "focus-visible" in css_content
-        assert "outline:" in css_content
+        assert "focus-visible" in css_tokens
+        assert "outline:" in css_tokens
 
-    @patch("src.ui.components.st")
-    def test_apply_f1_theme_includes_animations(self, mock_st):
+    def test_apply_f1_theme_includes_animations(self, css_tokens):
         """Test that animation CSS is included."""
-        mock_st.session_state = {}
-
-        apply_f1_theme()
-
-        css_content = mock_st.markdown.call_args[0][0]
-
         # Check for animations
-        assert "@keyframes fadeIn" in css_content
-        assert "@keyframes slideIn" in css_content
-        assert "animation:" in css_content
+        assert "@keyframes fadeIn" in css_tokens
+        assert "@keyframes slideIn" in css_tokens
+        assert "animation:" in css_tokens
 
-    @patch("src.ui.components.st")
-    def test_apply_f1_theme_includes_component_styles(self, mock_st):
+    def test_apply_f1_theme_includes_component_styles(self, css_tokens):
         """Test that all component styles are included."""
-        mock_st.session_state = {}
-
-        apply_f1_theme()
-
-        css_content = mock_st.markdown.call_args[0][0]
-
         # Check for various component styles
-        assert ".stButton" in css_content
-        assert ".stChatMessage" in css_content
-        assert ".stTextInput" in css_content
-        assert ".stSlider" in css_content
-        assert ".streamlit-expanderHeader" in css_content
-        assert ".welcome-hero" in css_content
-
-    @patch("src.ui.components.st")
-    def test_apply_f1_theme_includes_centered_layout(self, mock_st):
+        assert ".stButton" in css_tokens
+        assert ".stChatMessage" in css_tokens
+        assert ".stTextInput" in css_tokens
+        assert ".stSlider" in css_tokens
+        assert ".streamlit-expanderHeader" in css_tokens
+        assert ".welcome-hero" in css_tokens
+
+    def test_apply_f1_theme_includes_centered_layout(self, css_tokens):
         """Test that centered layout CSS with 800px max-width is included."""
-        mock_st.session_state = {}
-
-        apply_f1_theme()
-
-        css_content = mock_st.markdown.call_args[0][0]
-
         # Check for centered layout styles
-        assert ".main .block-container" in css_content
-        assert "max-width: 800px" in css_content
-        assert "padding-top:" in css_content
-        assert "padding-left:" in css_content
-        assert "padding-right:" in css_content
+        assert ".main .block-container" in css_tokens
+        assert "max-width: 800px" in css_tokens
+        assert "padding-top:" in css_tokens
+        assert "padding-left:" in css_tokens
+        assert "padding-right:" in css_tokens
 
 
 class TestRecommendationPrompt:
@@ -191,8 +227,6 @@ class TestRecommendationPrompt:
 
     def test_recommendation_prompt_creation(self):
         """Test RecommendationPrompt model can be created with valid data."""
-        RecommendationPrompt = components.RecommendationPrompt
-
         prompt = RecommendationPrompt(
             icon="🏆",
             text="Who is leading the championship?",
@@ -207,30 +241,24 @@ class TestRecommendationPrompt:
             prompt.query == "Who is currently leading the Formula 1 World Championship?"
         )
 
-    def test_recommendation_prompt_categories(self):
+    @pytest.mark.parametrize(
+        "category", ["standings", "results", "prediction", "historical"]
+    )
+    def test_recommendation_prompt_categories(self, category):
         """Test RecommendationPrompt accepts all valid categories."""
-        RecommendationPrompt = components.RecommendationPrompt
-
-        valid_categories = ["standings", "results", "prediction", "historical"]
-
-        for category in valid_categories:
-            prompt = RecommendationPrompt(
-                icon="🏁", text="Test prompt", category=category, query="Test query"
-            )
-            assert prompt.category == category
+        prompt = RecommendationPrompt(
+            icon="🏁", text="Test prompt", category=category, query="Test query"
+        )
+        assert prompt.category == category
 
 
 class TestExecutePrompt:
     """Test execute_prompt function."""
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_adds_message_to_history(self, mock_logger, mock_st):
         """Test that execute_prompt adds user message to session state."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         query = "Who is leading the championship?"
@@ -243,14 +271,10 @@ class TestExecutePrompt:
         assert message["content"] == query
         assert "timestamp" in message
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_sets_execution_flag(self, mock_logger, mock_st):
         """Test that execute_prompt sets prompt_executed flag."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         execute_prompt("Test query")
@@ -258,14 +282,10 @@ class TestExecutePrompt:
         # Verify flag was set
         assert mock_st.session_state["prompt_executed"] is True
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_triggers_rerun(self, mock_logger, mock_st):
         """Test that execute_prompt triggers st.rerun()."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         execute_prompt("Test query")
@@ -273,14 +293,10 @@ class TestExecutePrompt:
         # Verify rerun was called
         mock_st.rerun.assert_called_once()
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_logs_execution(self, mock_logger, mock_st):
         """Test that execute_prompt logs the execution."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         query = "Test query"
@@ -297,11 +313,8 @@ class TestExecutePrompt:
 class TestRenderRecommendationPrompts:
     """Test render_recommendation_prompts component."""
 
-    @patch("src.ui.components.st")
     def test_render_recommendation_prompts_displays_four_prompts(self, mock_st):
         """Test that render_recommendation_prompts displays 4 prompts."""
-        render_recommendation_prompts = components.render_recommendation_prompts
-
         # Setup mock button to not trigger
         mock_st.button.return_value = False
 
@@ -311,11 +324,8 @@ class TestRenderRecommendationPrompts:
         # Verify 4 buttons were created
         assert mock_st.button.call_count == 4
 
-    @patch("src.ui.components.st")
     def test_render_recommendation_prompts_uses_grid_layout(self, mock_st):
         """Test that prompts are displayed in 2x2 grid using st.columns()."""
-        render_recommendation_prompts = components.render_recommendation_prompts
-
         # Setup mock
         mock_st.button.return_value = False
 
@@ -329,11 +339,8 @@ class TestRenderRecommendationPrompts:
         for call in mock_st.columns.call_args_list:
             assert call[0][0] == 2
 
-    @patch("src.ui.components.st")
     def test_render_recommendation_prompts_covers_all_categories(self, mock_st):
         """Test that prompts cover standings, results, prediction, and historical."""
-        render_recommendation_prompts = components.render_recommendation_prompts
-
         # Setup mock
         mock_st.button.return_value = False
 
@@ -357,11 +364,8 @@ class TestRenderRecommendationPrompts:
             or "stats" in combined_text.lower()
         )
 
-    @patch("src.ui.components.st")
     def test_render_recommendation_prompts_buttons_have_icons(self, mock_st):
         """Test that all prompt buttons include emoji icons."""
-        render_recommendation_prompts = components.render_recommendation_prompts
-
         # Setup mock
         mock_st.button.return_value = False
 
@@ -376,14 +380,11 @@ class TestRenderRecommendationPrompts:
             # Check that text starts with an emoji (non-ASCII character)
             assert any(ord(char) > 127 for char in text[:5])
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.execute_prompt")
     def test_render_recommendation_prompts_executes_on_click(
         self, mock_execute, mock_st
     ):
         """Test that clicking a prompt button executes the query."""
-        render_recommendation_prompts = components.render_recommendation_prompts
-
         # Setup mock to simulate button click on first button
         mock_st.button.side_effect = [True, False, False, False]
 
@@ -397,15 +398,11 @@ class TestRenderRecommendationPrompts:
 class TestRenderWelcomeScreen:
     """Test render_welcome_screen component."""
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.render_recommendation_prompts")
     def test_render_welcome_screen_displays_hero_section(
         self, mock_render_prompts, mock_st
     ):
         """Test that welcome screen renders hero section with title and tagline."""
-        # Import function
-        render_welcome_screen = components.render_welcome_screen
-
         # Call function
         render_welcome_screen()
 
@@ -414,71 +411,58 @@ class TestRenderWelcomeScreen:
 
         # Get all markdown calls
         markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
-        combined_content = " ".join(markdown_calls)
 
         # Check for hero section elements
-        assert "🏎️ ChatFormula1" in combined_content
-        assert "Your AI-powered Formula 1 expert assistant" in combined_content
-        assert "welcome-hero" in combined_content
+        assert _contains(markdown_calls, "🏎️ ChatFormula1")
+        assert _contains(markdown_calls, "Your AI-powered Formula 1 expert assistant")
+        assert _contains(markdown_calls, "welcome-hero")
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.render_recommendation_prompts")
     def test_render_welcome_screen_displays_description(
         self, mock_render_prompts, mock_st
     ):
         """Test that welcome screen renders description of capabilities."""
-        render_welcome_screen = components.render_welcome_screen
-
         render_welcome_screen()
 
         # Get all markdown calls
         markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
-        combined_content = " ".join(markdown_calls)
 
         # Check for description content
-        assert "F1 standings" in combined_content or "race results" in combined_content
-        assert "AI" in combined_content
+        assert _contains(markdown_calls, "F1 standings") or _contains(
+            markdown_calls, "race results"
+        )
+        assert _contains(markdown_calls, "AI")
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.render_recommendation_prompts")
     def test_render_welcome_screen_uses_flexbox_centering(
         self, mock_render_prompts, mock_st
     ):
         """Test that welcome screen uses flexbox for vertical centering."""
-        render_welcome_screen = components.render_welcome_screen
-
         render_welcome_screen()
 
         # Get all markdown calls
         markdown_calls = [call[0][0] for call in mock_st.markdown.call_args_list]
-        combined_content = " ".join(markdown_calls)
 
         # Check for flexbox CSS properties
-        assert "display: flex" in combined_content
-        assert "flex-direction: column" in combined_content
-        assert "justify-content: center" in combined_content
-        assert "align-items: center" in combined_content
+        assert _contains(markdown_calls, "display: flex")
+        assert _contains(markdown_calls, "flex-direction: column")
+        assert _contains(markdown_calls, "justify-content: center")
+        assert _contains(markdown_calls, "align-items: center")
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.render_recommendation_prompts")
     def test_render_welcome_screen_uses_unsafe_html(self, mock_render_prompts, mock_st):
         """Test that welcome screen uses unsafe_allow_html for custom styling."""
-        render_welcome_screen = components.render_welcome_screen
-
         render_welcome_screen()
 
         # Check that all markdown calls use unsafe_allow_html=True
         for call in mock_st.markdown.call_args_list:
             assert call[1].get("unsafe_allow_html") is True
 
-    @patch("src.ui.components.st")
     @patch("src.ui.components.render_recommendation_prompts")
     def test_render_welcome_screen_includes_recommendation_prompts(
         self, mock_render_prompts, mock_st
     ):
         """Test that welcome screen calls render_recommendation_prompts."""
-        render_welcome_screen = components.render_welcome_screen
-
         render_welcome_screen()
 
         # Verify render_recommendation_prompts was called
@@ -488,14 +472,10 @@ class TestRenderWelcomeScreen:
 class TestWelcomeScreenTransition:
     """Test welcome screen to chat transition functionality."""
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_hides_welcome_screen(self, mock_logger, mock_st):
         """Test that executing a prompt adds message which hides welcome screen."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state with empty messages (welcome screen visible)
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         query = "Who is leading the championship?"
@@ -506,14 +486,10 @@ class TestWelcomeScreenTransition:
         assert mock_st.session_state["messages"][0]["role"] == "user"
         assert mock_st.session_state["messages"][0]["content"] == query
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_triggers_agent_processing(self, mock_logger, mock_st):
         """Test that executing a prompt sets flag to trigger agent processing."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         execute_prompt("Test query")
@@ -521,14 +497,10 @@ class TestWelcomeScreenTransition:
         # Verify prompt_executed flag was set (triggers agent processing)
         assert mock_st.session_state["prompt_executed"] is True
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_triggers_ui_rerun(self, mock_logger, mock_st):
         """Test that executing a prompt triggers rerun for smooth transition."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         execute_prompt("Test query")
@@ -536,14 +508,10 @@ class TestWelcomeScreenTransition:
         # Verify rerun was called (enables smooth transition)
         mock_st.rerun.assert_called_once()
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_message_history_not_empty_after_prompt(self, mock_logger, mock_st):
         """Test that message history is not empty after prompt execution."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state with empty messages
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Verify messages is empty initially
         assert len(mock_st.session_state["messages"]) == 0
@@ -554,14 +522,10 @@ class TestWelcomeScreenTransition:
         # Verify messages is no longer empty (welcome screen will be hidden)
         assert len(mock_st.session_state["messages"]) > 0
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_execute_prompt_includes_timestamp(self, mock_logger, mock_st):
         """Test that executed prompt message includes timestamp."""
-        execute_prompt = components.execute_prompt
-
         # Setup mock session state
-        mock_st.session_state = {"messages": [], "session_id": "test-session-123"}
+        mock_st.session_state.update({"messages": [], "session_id": "test-session-123"})
 
         # Execute prompt
         execute_prompt("Test query")
@@ -575,14 +539,32 @@ class TestWelcomeScreenTransition:
 class TestRenderAboutModal:
     """Test render_about_modal component."""
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
+    @pytest.fixture
+    def about_modal_content(self, mock_st, mock_logger):
+        """Render the about modal and collect the content it displays."""
+        mock_st.session_state.update({"show_about": True})
+        mock_st.columns.return_value = (MagicMock(), MagicMock())
+
+        # Capture markdown calls
+        markdown_calls = []
+        mock_st.markdown = MagicMock(
+            side_effect=lambda *args, **kwargs: markdown_calls.append(args[0])
+        )
+
+        # Pass-through dialog decorator, so showing the modal runs its body
+        mock_st.dialog = lambda title: lambda func: func
+
+        render_about_modal()
+
+        return SimpleNamespace(
+            markdown_calls=markdown_calls,
+            link_urls=[call[0][1] for call in mock_st.link_button.call_args_list],
+        )
+
     def test_render_about_modal_displays_when_flag_set(self, mock_logger, mock_st):
         """Test that about modal displays when show_about flag is True."""
-        render_about_modal = components.render_about_modal
-
         # Setup mock session state with show_about flag
-        mock_st.session_state = {"show_about": True}
+        mock_st.session_state.update({"show_about": True})
 
         # Mock the dialog decorator to capture the inner function
         dialog_func = None
@@ -606,16 +588,12 @@ class TestRenderAboutModal:
         # Verify show_about flag was reset
         assert mock_st.session_state["show_about"] is False
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_render_about_modal_not_displayed_when_flag_false(
         self, mock_logger, mock_st
     ):
         """Test that about modal does not display when show_about flag is False."""
-        render_about_modal = components.render_about_modal
-
         # Setup mock session state with show_about flag False
-        mock_st.session_state = {"show_about": False}
+        mock_st.session_state.update({"show_about": False})
 
         # Track if dialog was called
         dialog_called = False
@@ -636,174 +614,38 @@ class TestRenderAboutModal:
         # Verify dialog was not shown (flag remains False)
         assert mock_st.session_state["show_about"] is False
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
-    def test_render_about_modal_includes_project_description(
-        self, mock_logger, mock_st
-    ):
+    def test_render_about_modal_includes_project_description(self, about_modal_content):
         """Test that about modal includes project description."""
-        render_about_modal = components.render_about_modal
-
-        # Setup mock
-        mock_st.session_state = {"show_about": True}
-
-        # Capture markdown calls
-        markdown_calls = []
-        mock_st.markdown = MagicMock(
-            side_effect=lambda *args, **kwargs: markdown_calls.append(args[0])
+        markdown_calls = about_modal_content.markdown_calls
+        assert _contains(markdown_calls, "ChatFormula1")
+        assert _contains(markdown_calls, "AI-powered") or _contains(
+            markdown_calls, "Formula 1"
         )
 
-        # Mock dialog decorator
-        dialog_func = None
-
-        def mock_dialog(title):
-            def decorator(func):
-                nonlocal dialog_func
-                dialog_func = func
-                return func
-
-            return decorator
-
-        mock_st.dialog = mock_dialog
-
-        # Call function
-        render_about_modal()
-
-        # Execute the dialog function to capture content
-        if dialog_func:
-            dialog_func()
-
-        # Verify project description is present
-        combined_content = " ".join(markdown_calls)
-        assert "ChatFormula1" in combined_content
-        assert "AI-powered" in combined_content or "Formula 1" in combined_content
-
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
-    def test_render_about_modal_includes_features_list(self, mock_logger, mock_st):
+    def test_render_about_modal_includes_features_list(self, about_modal_content):
         """Test that about modal includes features list."""
-        render_about_modal = components.render_about_modal
-
-        # Setup mock
-        mock_st.session_state = {"show_about": True}
-
-        # Capture markdown calls
-        markdown_calls = []
-        mock_st.markdown = MagicMock(
-            side_effect=lambda *args, **kwargs: markdown_calls.append(args[0])
+        markdown_calls = about_modal_content.markdown_calls
+        assert _contains(markdown_calls, "Features") or _contains(
+            markdown_calls, "features"
         )
 
-        # Mock dialog decorator
-        dialog_func = None
-
-        def mock_dialog(title):
-            def decorator(func):
-                nonlocal dialog_func
-                dialog_func = func
-                return func
-
-            return decorator
-
-        mock_st.dialog = mock_dialog
-
-        # Call function
-        render_about_modal()
-
-        # Execute the dialog function
-        if dialog_func:
-            dialog_func()
-
-        # Verify features are present
-        combined_content = " ".join(markdown_calls)
-        assert "Features" in combined_content or "features" in combined_content
-
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
-    def test_render_about_modal_includes_creator_name(self, mock_logger, mock_st):
+    def test_render_about_modal_includes_creator_name(self, about_modal_content):
         """Test that about modal includes creator name 'Prateek Mulye'."""
-        render_about_modal = components.render_about_modal
-
-        # Setup mock
-        mock_st.session_state = {"show_about": True}
-
-        # Capture markdown calls
-        markdown_calls = []
-        mock_st.markdown = MagicMock(
-            side_effect=lambda *args, **kwargs: markdown_calls.append(args[0])
-        )
-
-        # Mock dialog decorator
-        dialog_func = None
-
-        def mock_dialog(title):
-            def decorator(func):
-                nonlocal dialog_func
-                dialog_func = func
-                return func
-
-            return decorator
+        assert _contains(about_modal_content.markdown_calls, "Prateek Mulye")
 
-        mock_st.dialog = mock_dialog
-
-        # Call function
-        render_about_modal()
-
-        # Execute the dialog function
-        if dialog_func:
-            dialog_func()
-
-        # Verify creator name is present
-        combined_content = " ".join(markdown_calls)
-        assert "Prateek Mulye" in combined_content
-
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
-    def test_render_about_modal_includes_social_links(self, mock_logger, mock_st):
+    def test_render_about_modal_includes_social_links(self, about_modal_content):
         """Test that about modal includes LinkedIn and GitHub links."""
-        render_about_modal = components.render_about_modal
-
-        # Setup mock
-        mock_st.session_state = {"show_about": True}
-
-        # Mock dialog decorator
-        dialog_func = None
-
-        def mock_dialog(title):
-            def decorator(func):
-                nonlocal dialog_func
-                dialog_func = func
-                return func
-
-            return decorator
-
-        mock_st.dialog = mock_dialog
-
-        # Call function
-        render_about_modal()
-
-        # Execute the dialog function
-        if dialog_func:
-            dialog_func()
-
-        # Verify link_button was called for LinkedIn and GitHub
-        assert mock_st.link_button.call_count == 2
-
-        # Get all link_button calls
-        link_calls = [call[0] for call in mock_st.link_button.call_args_list]
-        link_urls = [call[1] for call in link_calls]
+        link_urls = about_modal_content.link_urls
 
         # Verify LinkedIn and GitHub URLs are present
+        assert len(link_urls) == 2
         assert any("linkedin.com/in/prateekmulye" in url for url in link_urls)
         assert any("github.com/prateekmulye" in url for url in link_urls)
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_render_about_modal_error_handling(self, mock_logger, mock_st):
         """Test that about modal has error handling with fallback display."""
-        render_about_modal = components.render_about_modal
-
         # Setup mock to raise exception
-        mock_st.session_state = {"show_about": True}
+        mock_st.session_state.update({"show_about": True})
         mock_st.dialog = MagicMock(side_effect=Exception("Test error"))
 
         # Call function - should not raise exception
@@ -816,16 +658,12 @@ class TestRenderAboutModal:
         mock_st.error.assert_called_once()
         assert "Unable to display About modal" in mock_st.error.call_args[0][0]
 
-    @patch("src.ui.components.st")
-    @patch("src.ui.components.logger")
     def test_render_about_modal_fallback_includes_creator_info(
         self, mock_logger, mock_st
     ):
         """Test that fallback display includes creator information."""
-        render_about_modal = components.render_about_modal
-
         # Setup mock to raise exception
-        mock_st.session_state = {"show_about": True}
+        mock_st.session_state.update({"show_about": True})
         mock_st.dialog = MagicMock(side_effect=Exception("Test error"))
 
         # Capture markdown calls
@@ -838,7 +676,6 @@ class TestRenderAboutModal:
         render_about_modal()
 
         # Verify fallback content includes creator info
-        combined_content = " ".join(markdown_calls)
-        assert "Prateek Mulye" in combined_content
-        assert "linkedin.com/in/prateekmulye" in combined_content
-        assert "github.com/prateekmulye" in combined_content
+        assert _contains(markdown_calls, "Prateek Mulye")
+        assert _contains(markdown_calls, "linkedin.com/in/prateekmulye")
+        assert _contains(markdown_calls, "github.com/prateekmulye")